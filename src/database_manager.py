@@ -13,13 +13,24 @@ This module provides:
 All operations use Python's built-in sqlite3 module.
 """
 
+import os
+import mmap
+import atexit
+import shutil
 import sqlite3
 import hashlib
 import logging
+import threading
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Set
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+_LOG = logging.getLogger('FileOrganizer')
 
 
 # ============================================================================
@@ -28,6 +39,22 @@ from contextlib import contextmanager
 
 DEFAULT_DB_PATH = "file_organizer.db"
 
+# Chunk size for the fallback hashing loop (pre-3.11 interpreters)
+HASH_CHUNK_SIZE = 1 << 20
+
+# Files at least this large are hashed through mmap instead of read()
+MMAP_HASH_THRESHOLD = 1 << 20
+
+# hashlib.file_digest was added in Python 3.11
+_HAS_FILE_DIGEST = hasattr(hashlib, 'file_digest')
+
+# Kernel access-pattern hints (POSIX only; absent on Windows and macOS)
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+_HAS_MADVISE = hasattr(mmap, 'MADV_SEQUENTIAL')
+
+# Number of file records buffered before a batched insert is flushed
+INSERT_BATCH_SIZE = 1000
+
 # SQL Schema
 CREATE_FILES_TABLE = """
 CREATE TABLE IF NOT EXISTS files (
@@ -39,53 +66,311 @@ CREATE TABLE IF NOT EXISTS files (
     file_type TEXT NOT NULL,
     created_at TEXT,
     modified_at TEXT,
-    sha256_hash TEXT NOT NULL,
+    sha256_hash BLOB NOT NULL,
     operation_date TEXT NOT NULL,
-    operation_id TEXT NOT NULL
+    operation_id TEXT NOT NULL,
+    mtime_ns INTEGER
+);
+"""
+
+# Hashes of files still in place, keyed by absolute path. An entry is valid
+# only while the file's size and st_mtime_ns are unchanged, so re-scanning
+# an untouched file costs one indexed lookup instead of a full read.
+CREATE_HASH_CACHE_TABLE = """
+CREATE TABLE IF NOT EXISTS hash_cache (
+    path TEXT PRIMARY KEY,
+    file_size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256_hash BLOB NOT NULL
 );
 """
 
+# Maximum ids bound into a single DELETE ... WHERE id IN (...) statement
+# (SQLite's default SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds)
+DELETE_BATCH_SIZE = 500
+
+# Maximum values bound into a single SELECT ... WHERE ... IN (...) lookup
+LOOKUP_BATCH_SIZE = 500
+
+# Deletes larger than this are followed by an incremental vacuum
+VACUUM_THRESHOLD_ROWS = 10000
+
+# Worker threads used to move files back during undo
+UNDO_MOVE_WORKERS = 8
+
+# Column added after the initial schema; older databases get it via ALTER TABLE
+ADD_MTIME_COLUMN = """
+ALTER TABLE files ADD COLUMN mtime_ns INTEGER;
+"""
+
 # Create index on sha256_hash for faster duplicate lookups
 CREATE_HASH_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_sha256_hash ON files(sha256_hash);
 """
 
-# Create index on operation_id for faster undo operations
+# Create index on (operation_id, operation_date) for faster undo operations;
+# it serves both the operation filter and its date ordering
 CREATE_OPERATION_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_operation_id ON files(operation_id);
+CREATE INDEX IF NOT EXISTS idx_op_date ON files(operation_id, operation_date);
+"""
+
+# Superseded by idx_op_date (same leading column)
+DROP_LEGACY_OPERATION_INDEX = """
+DROP INDEX IF EXISTS idx_operation_id;
+"""
+
+# Create index on operation_date for finding the most recent operation
+CREATE_OPERATION_DATE_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_operation_date ON files(operation_date);
+"""
+
+# Create index on (file_size, mtime_ns) for hash-free duplicate probes
+CREATE_STAT_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_size_mtime ON files(file_size, mtime_ns);
+"""
+
+# Create index on file_type so the per-type counts in get_database_stats
+# are read from the index in group order instead of scanning and sorting
+CREATE_TYPE_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_file_type ON files(file_type);
+"""
+
+# Size of each connection's prepared-statement cache. sqlite3 caches
+# compiled statements keyed by their SQL text, so the hot queries below are
+# kept as module constants: every call then passes the exact same string and
+# is prepared once per connection instead of being re-parsed each time.
+STATEMENT_CACHE_SIZE = 256
+
+SQL_INSERT_FILE = """
+INSERT INTO files (
+    original_path, new_path, file_name, file_size,
+    file_type, created_at, modified_at, sha256_hash,
+    operation_date, operation_id, mtime_ns
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_SELECT_BY_HASH = """
+SELECT * FROM files
+WHERE sha256_hash = ?
+ORDER BY operation_date DESC
+LIMIT 1
+"""
+
+SQL_SELECT_BY_STAT = """
+SELECT * FROM files
+WHERE file_size = ? AND mtime_ns = ?
+ORDER BY operation_date DESC
+LIMIT 1
+"""
+
+SQL_SELECT_BY_STAT_AND_NAME = """
+SELECT * FROM files
+WHERE file_size = ? AND mtime_ns = ? AND file_name = ?
+ORDER BY operation_date DESC
+LIMIT 1
+"""
+
+SQL_UPSERT_CACHED_HASH = """
+INSERT OR REPLACE INTO hash_cache (path, file_size, mtime_ns, sha256_hash)
+VALUES (?, ?, ?, ?)
+"""
+
+SQL_DELETE_CACHED_HASH = """
+DELETE FROM hash_cache WHERE path = ?
+"""
+
+SQL_SELECT_DUPLICATE_ROWS = """
+SELECT * FROM files
+WHERE sha256_hash IN (
+    SELECT sha256_hash
+    FROM files
+    GROUP BY sha256_hash
+    HAVING COUNT(*) > 1
+)
+ORDER BY sha256_hash, operation_date ASC
 """
 
+SQL_SELECT_OPERATION_FILES = """
+SELECT * FROM files
+WHERE operation_id = ?
+ORDER BY operation_date ASC
+"""
+
+SQL_SELECT_TOTALS = """
+SELECT COUNT(*) AS total_files,
+       COALESCE(SUM(file_size), 0) AS total_size,
+       COUNT(DISTINCT operation_id) AS total_operations
+FROM files
+"""
+
+SQL_SELECT_FILES_BY_TYPE = """
+SELECT file_type, COUNT(*) AS count
+FROM files
+GROUP BY file_type
+ORDER BY count DESC
+"""
+
+# Connection tuning applied once when a connection is opened.
+# WAL with synchronous=NORMAL avoids an fsync on every commit; the larger
+# page cache, in-memory temp store and mmap keep hot pages out of syscalls.
+CONNECTION_PRAGMAS = (
+    # Only takes effect on a new, empty database and must come before the
+    # switch to WAL; lets large deletes be reclaimed with incremental_vacuum
+    "PRAGMA auto_vacuum=INCREMENTAL",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",       # 64 MB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",     # 256 MB memory map
+    "PRAGMA busy_timeout=5000",
+)
+
 
 # ============================================================================
 # DATABASE CONNECTION CONTEXT MANAGER
 # ============================================================================
 
+# Long-lived connections, one per database file. Opening a connection for
+# every query dominated batch workloads, so connections are kept open for the
+# lifetime of the process and shared between threads under _conn_lock.
+_conn_cache: Dict[str, sqlite3.Connection] = {}
+_conn_lock = threading.RLock()
+
+# Connections currently inside a get_db_connection block
+_open_blocks: Set[sqlite3.Connection] = set()
+
+
+def _get_cached_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Return the cached connection for a database, opening it on first use.
+    Must be called with _conn_lock held.
+    
+    Args:
+        db_path: Path to the SQLite database file
+        
+    Returns:
+        sqlite3.Connection object
+    """
+    key = os.path.abspath(db_path)
+    conn = _conn_cache.get(key)
+    
+    if conn is None:
+        conn = sqlite3.connect(
+            key,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row  # Enable dict-like row access
+        
+        # Tune once per connection; cached connections are never re-tuned
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        
+        _conn_cache[key] = conn
+    
+    return conn
+
+
+def _close_all() -> None:
+    """Close all cached database connections (registered with atexit)."""
+    with _conn_lock:
+        for conn in _conn_cache.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        _conn_cache.clear()
+
+
+atexit.register(_close_all)
+
+
+def _rows_to_dicts(cursor: sqlite3.Cursor, rows) -> List[Dict[str, Any]]:
+    """
+    Convert raw tuple rows to dictionaries keyed by column name.
+    
+    Hot read paths set row_factory = None on their cursor (never on the
+    shared connection) and convert here, which skips building a
+    sqlite3.Row per row and then copying it again with dict(row).
+    
+    Args:
+        cursor: Cursor that produced the rows
+        rows: Iterable of tuples from that cursor
+        
+    Returns:
+        List of row dictionaries
+    """
+    columns = [c[0] for c in cursor.description]
+    return [dict(zip(columns, row)) for row in rows]
+
+
 @contextmanager
 def get_db_connection(db_path: str = DEFAULT_DB_PATH):
     """
     Context manager for database connections.
     Ensures proper connection handling and automatic commit/rollback.
     
+    The underlying connection is cached per database file and reused across
+    calls; each block runs as one transaction that is committed on success
+    and rolled back on error, but the connection itself stays open. Access
+    is serialized with a lock so worker threads can share it. Blocks nested
+    inside another block for the same database share its transaction, so a
+    caller can run several queries against one consistent snapshot.
+    
     Args:
         db_path: Path to the SQLite database file
         
     Yields:
         sqlite3.Connection object
     """
-    conn = None
-    try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like row access
-        yield conn
-        conn.commit()
-    except Exception as e:
-        if conn:
-            conn.rollback()
-        logging.getLogger('FileOrganizer').error(f"Database error: {e}")
-        raise
-    finally:
-        if conn:
-            conn.close()
+    with _conn_lock:
+        try:
+            conn = _get_cached_connection(db_path)
+            
+            # Nested block on the same connection (only possible from the
+            # thread already holding the lock): join the outer transaction
+            # instead of committing it early
+            if conn in _open_blocks:
+                yield conn
+                return
+            
+            _open_blocks.add(conn)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                _open_blocks.discard(conn)
+        except Exception as e:
+            _LOG.error("Database error: %s", e)
+            raise
+
+
+@contextmanager
+def get_read_connection(db_path: str = DEFAULT_DB_PATH):
+    """
+    Context manager for long read-only scans (e.g. model training).
+    
+    Like get_db_connection, but the block runs as one explicit deferred
+    read transaction, so every fetch sees the same WAL snapshot, and the
+    connection is switched to query_only for its duration. The connection
+    already carries the large page cache, in-memory temp store and mmap
+    settings from CONNECTION_PRAGMAS.
+    
+    Args:
+        db_path: Path to the SQLite database file
+        
+    Yields:
+        sqlite3.Connection object
+    """
+    with get_db_connection(db_path) as conn:
+        query_only = conn.execute("PRAGMA query_only").fetchone()[0]
+        conn.execute("PRAGMA query_only=1")
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN DEFERRED")
+            yield conn
+        finally:
+            conn.execute(f"PRAGMA query_only={query_only}")
 
 
 # ============================================================================
@@ -97,29 +382,62 @@ def init_db(db_path: str = DEFAULT_DB_PATH) -> None:
     Create the SQLite database and tables if they don't exist.
     Also creates necessary indexes for performance.
     
+    The WAL journal mode set on connection open is a persistent property of
+    the database file, so it only has to take effect once per database.
+    
     Args:
         db_path: Path to the SQLite database file
         
     Example:
         >>> init_db("my_organizer.db")
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         with get_db_connection(db_path) as conn:
             cursor = conn.cursor()
             
             # Create tables
             cursor.execute(CREATE_FILES_TABLE)
-            logger.info(f"Database initialized: {db_path}")
+            cursor.execute(CREATE_HASH_CACHE_TABLE)
+            _LOG.info("Database initialized: %s", db_path)
+            
+            # SQLite silently keeps the old journal mode where WAL is not
+            # supported (e.g. some network filesystems); make that visible,
+            # since every commit then pays a full fsync again
+            journal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+            if str(journal_mode).lower() != 'wal':
+                _LOG.warning(
+                    "WAL journal mode unavailable for %s (using %s); "
+                    "database writes will be slower", db_path, journal_mode
+                )
+            
+            # Migrate databases created before mtime_ns was tracked
+            columns = {row['name'] for row in cursor.execute("PRAGMA table_info(files)")}
+            if 'mtime_ns' not in columns:
+                cursor.execute(ADD_MTIME_COLUMN)
+                _LOG.info("Database migrated: added mtime_ns column")
+            
+            # Migrate hashes stored as hex TEXT by older versions to raw bytes
+            legacy = cursor.execute(
+                "SELECT id, sha256_hash FROM files WHERE typeof(sha256_hash) = 'text'"
+            ).fetchall()
+            if legacy:
+                cursor.executemany(
+                    "UPDATE files SET sha256_hash = ? WHERE id = ?",
+                    [(_hex_to_bytes(row['sha256_hash']), row['id']) for row in legacy]
+                )
+                _LOG.info("Database migrated: converted %d hashes to BLOB", len(legacy))
             
             # Create indexes
             cursor.execute(CREATE_HASH_INDEX)
             cursor.execute(CREATE_OPERATION_INDEX)
-            logger.debug("Database indexes created")
+            cursor.execute(DROP_LEGACY_OPERATION_INDEX)
+            cursor.execute(CREATE_OPERATION_DATE_INDEX)
+            cursor.execute(CREATE_STAT_INDEX)
+            cursor.execute(CREATE_TYPE_INDEX)
+            _LOG.debug("Database indexes created")
             
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        _LOG.error("Failed to initialize database: %s", e)
         raise
 
 
@@ -127,41 +445,233 @@ def init_db(db_path: str = DEFAULT_DB_PATH) -> None:
 # SHA-256 HASHING
 # ============================================================================
 
-def compute_file_hash(file_path: Path, chunk_size: int = 8192) -> str:
+# Hashes are stored as raw 32-byte digests (BLOB) rather than 64-character
+# hex strings, halving the size of the hash column and its index. Convert
+# with .hex() only where a hash is displayed.
+
+def _hex_to_bytes(hex_value: str) -> bytes:
+    """Convert a legacy hex hash to bytes (b'' if empty or malformed)."""
+    try:
+        return bytes.fromhex(hex_value)
+    except ValueError:
+        return b''
+
+
+def compute_file_hash(file_path: Path, chunk_size: int = HASH_CHUNK_SIZE) -> bytes:
     """
     Compute SHA-256 hash of a file.
-    Reads file in chunks to handle large files efficiently.
+    Files of MMAP_HASH_THRESHOLD bytes or more are memory-mapped and hashed
+    in one call. Smaller files use hashlib.file_digest (Python 3.11+), which
+    runs the read/update loop in C; older interpreters read in chunks.
+    
+    Where supported, the kernel is told the file is read sequentially (for
+    deeper readahead), and the pages of large files are released afterwards
+    since they are not read again.
     
     Args:
         file_path: Path to the file
-        chunk_size: Size of chunks to read (default: 8KB)
+        chunk_size: Size of chunks to read in the fallback path (default: 1MB)
         
     Returns:
-        SHA-256 hash as hexadecimal string
+        SHA-256 digest as 32 raw bytes
         
     Example:
         >>> hash_val = compute_file_hash(Path("photo.jpg"))
-        >>> print(hash_val)  # e.g., "a3b2c1d4e5f6..."
+        >>> print(hash_val.hex())  # e.g., "a3b2c1d4e5f6..."
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
-        sha256_hash = hashlib.sha256()
-        
         with open(file_path, 'rb') as f:
-            # Read file in chunks to avoid memory issues with large files
-            while chunk := f.read(chunk_size):
-                sha256_hash.update(chunk)
+            sha256_hash = None
+            fd = f.fileno()
+            large = os.fstat(fd).st_size >= MMAP_HASH_THRESHOLD
+            
+            if _HAS_FADVISE:
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass  # Only a hint
+            
+            # Medium/large files: hash straight from a memory map, no copies
+            if large:
+                try:
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                        if _HAS_MADVISE:
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        with memoryview(mm) as view:
+                            sha256_hash = hashlib.sha256(view)
+                except (ValueError, OSError):
+                    # Not mappable (special file, platform limits) - read instead
+                    sha256_hash = None
+            
+            if sha256_hash is None:
+                if _HAS_FILE_DIGEST:
+                    sha256_hash = hashlib.file_digest(f, 'sha256')
+                else:
+                    sha256_hash = hashlib.sha256()
+                    # Read file in chunks to avoid memory issues with large files
+                    while chunk := f.read(chunk_size):
+                        sha256_hash.update(chunk)
+            
+            # Don't let large files crowd everything else out of the page cache
+            if large and _HAS_FADVISE:
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    pass
         
-        hash_value = sha256_hash.hexdigest()
-        logger.debug(f"Computed hash for {file_path.name}: {hash_value[:16]}...")
+        hash_value = sha256_hash.digest()
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Computed hash for %s: %s...", file_path.name, hash_value.hex()[:16])
         return hash_value
         
     except Exception as e:
-        logger.error(f"Failed to compute hash for {file_path}: {e}")
+        _LOG.error("Failed to compute hash for %s: %s", file_path, e)
         raise
 
 
+def compute_file_hashes(
+    paths: List[Path],
+    workers: Optional[int] = None
+) -> Dict[Path, bytes]:
+    """
+    Compute SHA-256 hashes for many files in parallel.
+    hashlib releases the GIL while hashing, so a thread pool scales with
+    the number of cores. Use workers=2 on spinning disks to limit seeking.
+    
+    Args:
+        paths: Files to hash
+        workers: Number of worker threads (default: CPU count)
+        
+    Returns:
+        Dictionary mapping each path to its hash. Files that could not be
+        hashed are left out (the error is logged by compute_file_hash).
+        
+    Example:
+        >>> hashes = compute_file_hashes(files)
+        >>> hashes.get(Path("photo.jpg"))
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    hashes = {}
+    if not paths:
+        return hashes
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(paths)))) as executor:
+        futures = {executor.submit(compute_file_hash, path): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                hashes[futures[future]] = future.result()
+            except Exception:
+                pass  # Already logged in compute_file_hash
+    
+    return hashes
+
+
+def _load_cached_hashes(
+    paths: List[str],
+    db_path: str
+) -> Dict[str, Tuple[int, int, bytes]]:
+    """Fetch (file_size, mtime_ns, sha256_hash) cache entries for paths."""
+    cached = {}
+    with get_db_connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        
+        for chunk in _batched(paths, LOOKUP_BATCH_SIZE):
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                "SELECT path, file_size, mtime_ns, sha256_hash FROM hash_cache "
+                f"WHERE path IN ({placeholders})",
+                chunk
+            )
+            for path, file_size, mtime_ns, hash_value in cursor:
+                cached[path] = (file_size, mtime_ns, hash_value)
+    
+    return cached
+
+
+def get_or_compute_hashes(
+    files: List[Tuple[Path, os.stat_result]],
+    db_path: str = DEFAULT_DB_PATH,
+    workers: Optional[int] = None
+) -> Dict[Path, bytes]:
+    """
+    Hash many files, reusing cached hashes of files that have not changed.
+    
+    A file whose path, size and st_mtime_ns match its hash_cache entry is
+    not read at all. The others are hashed in parallel with
+    compute_file_hashes() and their entries are refreshed. The cache is an
+    optimization only: if it cannot be read or written, files are hashed.
+    
+    Args:
+        files: (path, stat result) pairs of the files to hash
+        db_path: Path to the SQLite database file
+        workers: Number of hashing threads (default: CPU count)
+        
+    Returns:
+        Dictionary mapping each path to its hash. Files that could not be
+        hashed are left out.
+        
+    Example:
+        >>> hashes = get_or_compute_hashes([(p, p.stat()) for p in files])
+    """
+    hashes = {}
+    if not files:
+        return hashes
+    
+    try:
+        cached = _load_cached_hashes([str(path) for path, _ in files], db_path)
+    except Exception as e:
+        _LOG.debug("Hash cache unavailable: %s", e)
+        cached = {}
+    
+    misses = []
+    for path, st in files:
+        entry = cached.get(str(path))
+        if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            hashes[path] = entry[2]
+        else:
+            misses.append((path, st))
+    
+    if not misses:
+        return hashes
+    
+    computed = compute_file_hashes([path for path, _ in misses], workers=workers)
+    hashes.update(computed)
+    
+    rows = [
+        (str(path), st.st_size, st.st_mtime_ns, computed[path])
+        for path, st in misses
+        if path in computed
+    ]
+    try:
+        with get_db_connection(db_path) as conn:
+            conn.executemany(SQL_UPSERT_CACHED_HASH, rows)
+    except Exception as e:
+        _LOG.debug("Failed to update hash cache: %s", e)
+    
+    return hashes
+
+
+def forget_cached_hashes(
+    paths: List[str],
+    db_path: str = DEFAULT_DB_PATH
+) -> None:
+    """
+    Drop hash_cache entries, e.g. for files that have been moved away.
+    
+    Args:
+        paths: Absolute paths whose entries should be removed
+        db_path: Path to the SQLite database file
+    """
+    if not paths:
+        return
+    
+    with get_db_connection(db_path) as conn:
+        conn.executemany(SQL_DELETE_CACHED_HASH, [(path,) for path in paths])
+
+
 # ============================================================================
 # FILE RECORD OPERATIONS
 # ============================================================================
@@ -172,6 +682,7 @@ def insert_file_record(
 ) -> int:
     """
     Insert metadata for a single file into the database.
+    Thin wrapper around insert_file_records() for one record.
     
     Args:
         file_info: Dictionary with file metadata:
@@ -182,8 +693,9 @@ def insert_file_record(
             - file_type: str
             - created_at: str (ISO format timestamp)
             - modified_at: str (ISO format timestamp)
-            - sha256_hash: str
+            - sha256_hash: bytes (raw digest, b'' if unknown)
             - operation_id: str (unique ID for this organization run)
+            - mtime_ns: int (optional, st_mtime_ns of the source file)
         db_path: Path to the SQLite database file
         
     Returns:
@@ -198,27 +710,44 @@ def insert_file_record(
         ...     'file_type': 'images',
         ...     'created_at': '2024-10-25T12:00:00',
         ...     'modified_at': '2024-10-25T12:30:00',
-        ...     'sha256_hash': 'a3b2c1d4...',
+        ...     'sha256_hash': bytes.fromhex('a3b2c1d4...'),
         ...     'operation_id': 'run_20241025_120000'
         ... }
         >>> record_id = insert_file_record(file_info)
     """
-    logger = logging.getLogger('FileOrganizer')
+    return insert_file_records([file_info], db_path)
+
+
+def insert_file_records(
+    file_infos: List[Dict[str, Any]],
+    db_path: str = DEFAULT_DB_PATH
+) -> Optional[int]:
+    """
+    Insert metadata for many files in a single transaction.
+    
+    All rows are written with one executemany() call and committed once,
+    so the commit cost is paid per batch instead of per file.
+    
+    Args:
+        file_infos: List of file metadata dictionaries (same keys as
+            insert_file_record)
+        db_path: Path to the SQLite database file
+        
+    Returns:
+        ID of the last inserted record, or None if nothing was inserted
+        
+    Example:
+        >>> insert_file_records(pending_records)
+    """
+    if not file_infos:
+        return None
     
     try:
-        # Add operation timestamp
+        # One operation timestamp for the whole batch
         operation_date = datetime.now().isoformat()
         
-        with get_db_connection(db_path) as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO files (
-                    original_path, new_path, file_name, file_size,
-                    file_type, created_at, modified_at, sha256_hash,
-                    operation_date, operation_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        rows = [
+            (
                 file_info['original_path'],
                 file_info['new_path'],
                 file_info['file_name'],
@@ -228,15 +757,24 @@ def insert_file_record(
                 file_info['modified_at'],
                 file_info['sha256_hash'],
                 operation_date,
-                file_info['operation_id']
-            ))
+                file_info['operation_id'],
+                file_info.get('mtime_ns')
+            )
+            for file_info in file_infos
+        ]
+        
+        with get_db_connection(db_path) as conn:
+            cursor = conn.cursor()
+            
+            cursor.executemany(SQL_INSERT_FILE, rows)
             
-            record_id = cursor.lastrowid
-            logger.debug(f"Inserted record {record_id} for {file_info['file_name']}")
+            # executemany() does not set lastrowid; ask SQLite directly
+            record_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            _LOG.debug("Inserted %d records (last id %s)", len(rows), record_id)
             return record_id
             
     except Exception as e:
-        logger.error(f"Failed to insert file record: {e}")
+        _LOG.error("Failed to insert file records: %s", e)
         raise
 
 
@@ -245,54 +783,182 @@ def insert_file_record(
 # ============================================================================
 
 def get_duplicate(
-    hash_value: str,
+    hash_value: bytes,
     db_path: str = DEFAULT_DB_PATH
 ) -> Optional[Dict[str, Any]]:
     """
     Check if a file with the same SHA-256 hash already exists in the database.
     
     Args:
-        hash_value: SHA-256 hash to search for
+        hash_value: SHA-256 digest to search for
         db_path: Path to the SQLite database file
         
     Returns:
         Dictionary with file metadata if duplicate found, None otherwise
         
     Example:
-        >>> duplicate = get_duplicate("a3b2c1d4e5f6...")
+        >>> duplicate = get_duplicate(compute_file_hash(Path("photo.jpg")))
         >>> if duplicate:
         ...     print(f"Duplicate found: {duplicate['file_name']}")
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         with get_db_connection(db_path) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None  # Raw tuples; see _rows_to_dicts
             
-            cursor.execute("""
-                SELECT * FROM files
-                WHERE sha256_hash = ?
-                ORDER BY operation_date DESC
-                LIMIT 1
-            """, (hash_value,))
+            cursor.execute(SQL_SELECT_BY_HASH, (hash_value,))
             
             row = cursor.fetchone()
             
             if row:
-                duplicate = dict(row)
-                logger.debug(f"Duplicate found: {duplicate['file_name']}")
+                duplicate = _rows_to_dicts(cursor, (row,))[0]
+                _LOG.debug("Duplicate found: %s", duplicate['file_name'])
                 return duplicate
             
             return None
             
     except Exception as e:
-        logger.error(f"Failed to check for duplicate: {e}")
+        _LOG.error("Failed to check for duplicate: %s", e)
+        raise
+
+
+def get_duplicates(
+    hash_values: Iterable[bytes],
+    db_path: str = DEFAULT_DB_PATH
+) -> Dict[bytes, Dict[str, Any]]:
+    """
+    Look up many hashes at once; the batched form of get_duplicate().
+    
+    Args:
+        hash_values: SHA-256 digests to search for
+        db_path: Path to the SQLite database file
+        
+    Returns:
+        Dictionary mapping each hash that is already recorded to the
+        metadata of its most recent record
+        
+    Example:
+        >>> recorded = get_duplicates(hashes.values())
+        >>> duplicate = recorded.get(file_hash)
+    """
+    hashes = [h for h in set(hash_values) if h]
+    duplicates = {}
+    
+    try:
+        with get_db_connection(db_path) as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Raw tuples; see _rows_to_dicts
+            
+            for chunk in _batched(hashes, LOOKUP_BATCH_SIZE):
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    f"SELECT * FROM files WHERE sha256_hash IN ({placeholders}) "
+                    "ORDER BY operation_date ASC",
+                    chunk
+                )
+                # Later rows overwrite earlier ones: the newest record wins
+                for record in _rows_to_dicts(cursor, cursor.fetchall()):
+                    duplicates[record['sha256_hash']] = record
+        
+        return duplicates
+    
+    except Exception as e:
+        _LOG.error("Failed to check for duplicates: %s", e)
+        raise
+
+
+def get_duplicate_by_stat(
+    file_size: int,
+    mtime_ns: int,
+    db_path: str = DEFAULT_DB_PATH,
+    file_name: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Find a recorded file with the same size and modification time.
+    This is a cheap probe that needs no hashing; a match is a likely
+    duplicate whose stored hash can be reused instead of re-hashing.
+    
+    Args:
+        file_size: File size in bytes
+        mtime_ns: Modification time in nanoseconds (st_mtime_ns)
+        db_path: Path to the SQLite database file
+        file_name: Optionally also require the same file name
+        
+    Returns:
+        Dictionary with file metadata of the candidate, None otherwise
+        
+    Example:
+        >>> st = path.stat()
+        >>> candidate = get_duplicate_by_stat(st.st_size, st.st_mtime_ns)
+    """
+    try:
+        with get_db_connection(db_path) as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Raw tuples; see _rows_to_dicts
+            
+            if file_name is None:
+                cursor.execute(SQL_SELECT_BY_STAT, (file_size, mtime_ns))
+            else:
+                cursor.execute(SQL_SELECT_BY_STAT_AND_NAME, (file_size, mtime_ns, file_name))
+            row = cursor.fetchone()
+            
+            if row:
+                candidate = _rows_to_dicts(cursor, (row,))[0]
+                _LOG.debug("Stat match found: %s", candidate['file_name'])
+                return candidate
+            
+            return None
+            
+    except Exception as e:
+        _LOG.error("Failed to check for stat match: %s", e)
+        raise
+
+
+def get_recorded_sizes(
+    file_sizes: Iterable[int],
+    db_path: str = DEFAULT_DB_PATH
+) -> Set[int]:
+    """
+    Return the subset of file_sizes that at least one recorded file has.
+    A file whose size is not in the result cannot be a duplicate of any
+    recorded file, so it does not need to be hashed for a duplicate check.
+    
+    Args:
+        file_sizes: File sizes in bytes
+        db_path: Path to the SQLite database file
+        
+    Returns:
+        Set of sizes present in the database
+    """
+    sizes = list(set(file_sizes))
+    recorded = set()
+    
+    try:
+        with get_db_connection(db_path) as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            
+            # Served from the (file_size, mtime_ns) index
+            for chunk in _batched(sizes, LOOKUP_BATCH_SIZE):
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    f"SELECT DISTINCT file_size FROM files WHERE file_size IN ({placeholders})",
+                    chunk
+                )
+                recorded.update(row[0] for row in cursor)
+        
+        return recorded
+    
+    except Exception as e:
+        _LOG.error("Failed to look up recorded sizes: %s", e)
         raise
 
 
 def get_all_duplicates(db_path: str = DEFAULT_DB_PATH) -> List[List[Dict[str, Any]]]:
     """
     Find all groups of duplicate files in the database.
+    All duplicate rows are read in one query; the connection is released
+    before they are grouped.
     
     Args:
         db_path: Path to the SQLite database file
@@ -308,42 +974,23 @@ def get_all_duplicates(db_path: str = DEFAULT_DB_PATH) -> List[List[Dict[str, An
         ...     for file in group:
         ...         print(f"  - {file['new_path']}")
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         with get_db_connection(db_path) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None  # Raw tuples; see _rows_to_dicts
             
-            # Find hashes that appear more than once
-            cursor.execute("""
-                SELECT sha256_hash, COUNT(*) as count
-                FROM files
-                GROUP BY sha256_hash
-                HAVING count > 1
-            """)
-            
-            duplicate_hashes = cursor.fetchall()
-            
-            duplicate_groups = []
-            for row in duplicate_hashes:
-                hash_value = row['sha256_hash']
-                
-                # Get all files with this hash
-                cursor.execute("""
-                    SELECT * FROM files
-                    WHERE sha256_hash = ?
-                    ORDER BY operation_date ASC
-                """, (hash_value,))
-                
-                group = [dict(r) for r in cursor.fetchall()]
-                duplicate_groups.append(group)
-            
-            logger.info(f"Found {len(duplicate_groups)} duplicate groups")
-            return duplicate_groups
+            # All rows whose hash appears more than once, in one pass
+            cursor.execute(SQL_SELECT_DUPLICATE_ROWS)
+            records = _rows_to_dicts(cursor, cursor.fetchall())
             
     except Exception as e:
-        logger.error(f"Failed to get duplicates: {e}")
+        _LOG.error("Failed to get duplicates: %s", e)
         raise
+    
+    # Rows arrive sorted by hash, so consecutive rows form a group
+    duplicate_groups = [list(group) for _, group in groupby(records, key=itemgetter('sha256_hash'))]
+    _LOG.info("Found %d duplicate groups", len(duplicate_groups))
+    return duplicate_groups
 
 
 # ============================================================================
@@ -360,11 +1007,10 @@ def get_last_operation_id(db_path: str = DEFAULT_DB_PATH) -> Optional[str]:
     Returns:
         Operation ID string, or None if no operations found
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         with get_db_connection(db_path) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
             
             cursor.execute("""
                 SELECT operation_id FROM files
@@ -373,10 +1019,10 @@ def get_last_operation_id(db_path: str = DEFAULT_DB_PATH) -> Optional[str]:
             """)
             
             row = cursor.fetchone()
-            return row['operation_id'] if row else None
+            return row[0] if row else None
             
     except Exception as e:
-        logger.error(f"Failed to get last operation ID: {e}")
+        _LOG.error("Failed to get last operation ID: %s", e)
         raise
 
 
@@ -394,27 +1040,82 @@ def get_operation_files(
     Returns:
         List of file record dictionaries
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         with get_db_connection(db_path) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None  # Raw tuples; see _rows_to_dicts
             
-            cursor.execute("""
-                SELECT * FROM files
-                WHERE operation_id = ?
-                ORDER BY operation_date ASC
-            """, (operation_id,))
+            cursor.execute(SQL_SELECT_OPERATION_FILES, (operation_id,))
             
-            files = [dict(row) for row in cursor.fetchall()]
-            logger.info(f"Found {len(files)} files for operation {operation_id}")
+            files = _rows_to_dicts(cursor, cursor.fetchall())
+            _LOG.info("Found %d files for operation %s", len(files), operation_id)
             return files
             
     except Exception as e:
-        logger.error(f"Failed to get operation files: {e}")
+        _LOG.error("Failed to get operation files: %s", e)
         raise
 
 
+def _batched(items: List[Any], size: int):
+    """Yield successive slices of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _listdir_cached(directory: Path, cache: Dict[Path, set]) -> set:
+    """
+    Return the set of entry names in a directory, listing it only once.
+    Missing or unreadable directories yield an empty set.
+    """
+    names = cache.get(directory)
+    if names is None:
+        try:
+            names = set(os.listdir(directory))
+        except OSError:
+            names = set()
+        cache[directory] = names
+    return names
+
+
+def _restore_file(move: Tuple[Path, Path, Dict[str, Any]]) -> Tuple[Dict[str, Any], Optional[Exception]]:
+    """
+    Move one file back to its original location (undo worker).
+    
+    Args:
+        move: (current path, original path, file record) tuple
+        
+    Returns:
+        (file record, None) on success or (file record, error) on failure
+    """
+    new_path, original_path, file_record = move
+    try:
+        # Move file back (parent directories are created beforehand)
+        shutil.move(str(new_path), str(original_path))
+        return file_record, None
+    except Exception as e:
+        return file_record, e
+
+
+def _compact_after_delete(db_path: str, deleted_rows: int) -> None:
+    """
+    Keep the database footprint stable after a large delete.
+    Truncates the WAL file and, for big deletes, returns free pages to the
+    filesystem (requires auto_vacuum=INCREMENTAL, set on new databases).
+    
+    Args:
+        db_path: Path to the SQLite database file
+        deleted_rows: Number of rows just deleted
+    """
+    try:
+        with get_db_connection(db_path) as conn:
+            if deleted_rows > VACUUM_THRESHOLD_ROWS:
+                conn.execute("PRAGMA incremental_vacuum").fetchall()
+                _LOG.debug("Ran incremental vacuum")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+    except Exception as e:
+        _LOG.warning("Database compaction skipped: %s", e)
+
+
 def undo_operation(
     operation_id: str,
     db_path: str = DEFAULT_DB_PATH,
@@ -436,10 +1137,6 @@ def undo_operation(
         >>> stats = undo_operation("run_20241025_120000", dry_run=True)
         >>> print(f"Would restore {stats['files_restored']} files")
     """
-    import shutil
-    
-    logger = logging.getLogger('FileOrganizer')
-    
     stats = {
         'files_restored': 0,
         'errors': 0
@@ -450,64 +1147,95 @@ def undo_operation(
         files = get_operation_files(operation_id, db_path)
         
         if not files:
-            logger.warning(f"No files found for operation {operation_id}")
+            _LOG.warning("No files found for operation %s", operation_id)
             return stats
         
-        logger.info(f"{'DRY-RUN: Would undo' if dry_run else 'Undoing'} operation {operation_id}")
-        logger.info(f"Found {len(files)} files to restore")
+        _LOG.info("%s operation %s", 'DRY-RUN: Would undo' if dry_run else 'Undoing', operation_id)
+        _LOG.info("Found %d files to restore", len(files))
         
         restored_ids = []
+        pending_moves = []
+        
+        # Existence checks use one directory listing per parent directory
+        # instead of a stat() per file
+        dir_listings = {}
         
         for file_record in files:
             original_path = Path(file_record['original_path'])
             new_path = Path(file_record['new_path'])
             
             try:
+                new_names = _listdir_cached(new_path.parent, dir_listings)
+                original_names = _listdir_cached(original_path.parent, dir_listings)
+                
                 # Check if file exists at new location
-                if not new_path.exists():
-                    logger.warning(f"File not found at new location: {new_path}")
+                if new_path.name not in new_names:
+                    _LOG.warning("File not found at new location: %s", new_path)
                     stats['errors'] += 1
                     continue
                 
                 # Check if original location is occupied
-                if original_path.exists():
-                    logger.warning(f"Original location occupied: {original_path}")
+                if original_path.name in original_names:
+                    _LOG.warning("Original location occupied: %s", original_path)
                     stats['errors'] += 1
                     continue
                 
                 action = "WOULD RESTORE" if dry_run else "RESTORING"
-                logger.info(f"{action}: {new_path} -> {original_path}")
+                _LOG.info("%s: %s -> %s", action, new_path, original_path)
                 
-                if not dry_run:
-                    # Create parent directory if needed
-                    original_path.parent.mkdir(parents=True, exist_ok=True)
+                if dry_run:
+                    stats['files_restored'] += 1
+                else:
+                    pending_moves.append((new_path, original_path, file_record))
                     
-                    # Move file back
-                    shutil.move(str(new_path), str(original_path))
-                    logger.info(f"SUCCESS: Restored {file_record['file_name']}")
-                    restored_ids.append(file_record['id'])
-                
-                stats['files_restored'] += 1
+                    # Keep the cached listings in step with the planned move
+                    new_names.discard(new_path.name)
+                    original_names.add(original_path.name)
                 
             except Exception as e:
-                logger.error(f"Error restoring {file_record['file_name']}: {e}")
+                _LOG.error("Error restoring %s: %s", file_record['file_name'], e)
                 stats['errors'] += 1
         
+        # Move files back in parallel; moves are independent and mostly
+        # blocked on the filesystem
+        if pending_moves:
+            # Create each original parent directory once, not once per file
+            for parent in {original.parent for _, original, _ in pending_moves}:
+                try:
+                    parent.mkdir(parents=True, exist_ok=True)
+                except OSError as e:
+                    _LOG.error("Failed to create directory %s: %s", parent, e)
+            
+            with ThreadPoolExecutor(max_workers=UNDO_MOVE_WORKERS) as executor:
+                results = list(executor.map(_restore_file, pending_moves))
+            
+            for file_record, error in results:
+                if error is None:
+                    _LOG.info("SUCCESS: Restored %s", file_record['file_name'])
+                    restored_ids.append(file_record['id'])
+                    stats['files_restored'] += 1
+                else:
+                    _LOG.error("Error restoring %s: %s", file_record['file_name'], error)
+                    stats['errors'] += 1
+        
         # Remove records from database (only in live mode)
         if not dry_run and restored_ids:
             with get_db_connection(db_path) as conn:
                 cursor = conn.cursor()
-                placeholders = ','.join('?' * len(restored_ids))
-                cursor.execute(f"""
-                    DELETE FROM files
-                    WHERE id IN ({placeholders})
-                """, restored_ids)
-                logger.info(f"Removed {len(restored_ids)} records from database")
+                for chunk in _batched(restored_ids, DELETE_BATCH_SIZE):
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor.execute(f"""
+                        DELETE FROM files
+                        WHERE id IN ({placeholders})
+                    """, chunk)
+                _LOG.info("Removed %d records from database", len(restored_ids))
+            
+            _compact_after_delete(db_path, len(restored_ids))
         
         return stats
         
     except Exception as e:
-        logger.error(f"Failed to undo operation: {e}")
+        _LOG.error("Failed to undo operation: %s", e)
         raise
 
 
@@ -530,16 +1258,14 @@ def undo_last_operation(
         >>> stats = undo_last_operation(dry_run=False)
         >>> print(f"Restored {stats['files_restored']} files")
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     # Get the last operation ID
     operation_id = get_last_operation_id(db_path)
     
     if not operation_id:
-        logger.warning("No operations found in database")
+        _LOG.warning("No operations found in database")
         return {'files_restored': 0, 'errors': 0}
     
-    logger.info(f"Last operation ID: {operation_id}")
+    _LOG.info("Last operation ID: %s", operation_id)
     
     # Undo that operation
     return undo_operation(operation_id, db_path, dry_run)
@@ -560,8 +1286,6 @@ def list_operations(db_path: str = DEFAULT_DB_PATH) -> List[Dict[str, Any]]:
         >>> for op in operations:
         ...     print(f"{op['operation_id']}: {op['file_count']} files")
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         with get_db_connection(db_path) as conn:
             cursor = conn.cursor()
@@ -586,7 +1310,7 @@ def list_operations(db_path: str = DEFAULT_DB_PATH) -> List[Dict[str, Any]]:
             return operations
     
     except Exception as e:
-        logger.error(f"Failed to list operations: {e}")
+        _LOG.error("Failed to list operations: %s", e)
         return []
 
 
@@ -632,33 +1356,21 @@ def get_database_stats(db_path: str = DEFAULT_DB_PATH) -> Dict[str, Any]:
     Returns:
         Dictionary with database statistics
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         with get_db_connection(db_path) as conn:
             cursor = conn.cursor()
             
-            # Total files
-            cursor.execute("SELECT COUNT(*) as count FROM files")
-            total_files = cursor.fetchone()['count']
-            
-            # Total size
-            cursor.execute("SELECT SUM(file_size) as total FROM files")
-            total_size = cursor.fetchone()['total'] or 0
+            # Totals in a single scan
+            cursor.execute(SQL_SELECT_TOTALS)
+            row = cursor.fetchone()
+            total_files = row['total_files']
+            total_size = row['total_size']
+            total_operations = row['total_operations']
             
             # Files by type
-            cursor.execute("""
-                SELECT file_type, COUNT(*) as count
-                FROM files
-                GROUP BY file_type
-                ORDER BY count DESC
-            """)
+            cursor.execute(SQL_SELECT_FILES_BY_TYPE)
             files_by_type = {row['file_type']: row['count'] for row in cursor.fetchall()}
             
-            # Number of operations
-            cursor.execute("SELECT COUNT(DISTINCT operation_id) as count FROM files")
-            total_operations = cursor.fetchone()['count']
-            
             stats = {
                 'total_files': total_files,
                 'total_size_bytes': total_size,
@@ -670,7 +1382,7 @@ def get_database_stats(db_path: str = DEFAULT_DB_PATH) -> Dict[str, Any]:
             return stats
             
     except Exception as e:
-        logger.error(f"Failed to get database stats: {e}")
+        _LOG.error("Failed to get database stats: %s", e)
         raise
 
 
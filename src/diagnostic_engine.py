@@ -47,11 +47,16 @@ ACCURACY_POOR = 0.60
 # ============================================================================
 
 def diagnose_model_confidence(
-    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR
+    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR,
+    model: Optional[learn.FileOrganizationModel] = None
 ) -> Dict[str, Any]:
     """
     Analyze model confidence levels in detail.
     
+    Args:
+        learning_dir: Learning data directory
+        model: Already loaded model (loaded from learning_dir if omitted)
+    
     Returns:
         Diagnostic report with confidence analysis
     """
@@ -71,7 +76,8 @@ def diagnose_model_confidence(
         'recommendations': []
     }
     
-    model = learn.load_model(learning_dir)
+    if model is None:
+        model = learn.load_model(learning_dir)
     if not model or model.total_samples == 0:
         report['status'] = 'no_model'
         report['recommendations'].append("Train initial model with --learn")
@@ -134,11 +140,17 @@ def diagnose_model_confidence(
 
 
 def diagnose_feedback_accuracy(
-    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR
+    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR,
+    stats: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Analyze feedback accuracy and trends.
     
+    Args:
+        learning_dir: Learning data directory
+        stats: Already computed feedback statistics (read from learning_dir
+            if omitted)
+    
     Returns:
         Diagnostic report with accuracy analysis
     """
@@ -152,7 +164,8 @@ def diagnose_feedback_accuracy(
         'recommendations': []
     }
     
-    stats = feedback.get_feedback_stats(learning_dir)
+    if stats is None:
+        stats = feedback.get_feedback_stats(learning_dir)
     
     if stats['total_feedback'] == 0:
         report['status'] = 'no_data'
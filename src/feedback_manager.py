@@ -10,12 +10,17 @@ This module provides:
 - Analytics and reporting
 """
 
+import os
 import json
+import atexit
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+
+
+_LOG = logging.getLogger('FileOrganizer')
 
 
 # ============================================================================
@@ -31,20 +36,59 @@ POSITIVE_REINFORCEMENT = 2   # +2 weight for correct predictions
 NEGATIVE_REINFORCEMENT = -1  # -1 weight for incorrect predictions
 MIN_CONFIDENCE_PENALTY = 0.1 # Minimum confidence after penalties
 
+# Feedback is kept in memory and written to disk after this many updates
+# (and at interpreter exit) instead of on every single event
+FEEDBACK_FLUSH_INTERVAL = 100
+
+# Maximum number of learning directories kept in the in-memory cache
+FEEDBACK_CACHE_SIZE = 32
+
+# Buffer size for feedback file reads and writes
+IO_BUFFER_SIZE = 1 << 20
+
 
 # ============================================================================
 # FEEDBACK DATA STRUCTURE
 # ============================================================================
 
+# Separator between pattern type and value in serialized pattern keys
+PATTERN_KEY_SEPARATOR = '|'
+
+PatternKey = Tuple[str, str]
+
+
+def _encode_pattern_key(key: PatternKey) -> str:
+    """Serialize a (type, value) pattern key for JSON, e.g. 'ext|.pdf'."""
+    return key[0] + PATTERN_KEY_SEPARATOR + key[1]
+
+
+def _decode_pattern_key(text: str) -> PatternKey:
+    """Parse a serialized pattern key ('ext|.pdf', or legacy 'ext_.pdf')."""
+    pattern_type, sep, pattern_value = text.partition(PATTERN_KEY_SEPARATOR)
+    if not sep:
+        # Files written before tuple keys used 'type_value'; pattern types
+        # never contain underscores, so the first one is the separator
+        pattern_type, _, pattern_value = text.partition('_')
+    return pattern_type, pattern_value
+
+
+def _format_pattern_key(key: PatternKey) -> str:
+    """Human-readable pattern name, e.g. 'ext_.pdf'."""
+    return f"{key[0]}_{key[1]}"
+
+
 class FeedbackData:
     """
     Stores user feedback for reinforcement learning.
     
+    In memory, patterns are keyed by (pattern_type, pattern_value) tuples;
+    the JSON file stores them as 'type|value' strings.
+    
     Structure:
         {
             'patterns': {
-                'type_documents': {'correct': 12, 'wrong': 3, 'confidence_adj': 0.8},
-                'ext_.pdf': {'correct': 18, 'wrong': 2, 'confidence_adj': 0.9}
+                ('type', 'documents'): {'correct': 12, 'wrong': 3, 'confidence_adj': 0.8},
+                ('ext', '.pdf'): {'correct': 18, 'wrong': 2, 'confidence_adj': 0.9}
             },
             'metadata': {
                 'total_feedback': 35,
@@ -55,11 +99,7 @@ class FeedbackData:
     """
     
     def __init__(self):
-        self.patterns = defaultdict(lambda: {
-            'correct': 0,
-            'wrong': 0,
-            'confidence_adj': 1.0  # Multiplier for confidence
-        })
+        self.patterns: Dict[PatternKey, Dict[str, Any]] = {}
         self.metadata = {
             'total_feedback': 0,
             'last_updated': None,
@@ -67,10 +107,23 @@ class FeedbackData:
             'version': '5.0'
         }
     
+    def _get_or_init(self, pattern_key: PatternKey) -> Dict[str, Any]:
+        """Return the counters for a pattern, creating them if missing."""
+        pattern = self.patterns.get(pattern_key)
+        if pattern is None:
+            pattern = self.patterns[pattern_key] = {
+                'correct': 0,
+                'wrong': 0,
+                'confidence_adj': 1.0  # Multiplier for confidence
+            }
+        return pattern
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
-            'patterns': dict(self.patterns),
+            'patterns': {
+                _encode_pattern_key(key): data for key, data in self.patterns.items()
+            },
             'metadata': self.metadata
         }
     
@@ -78,10 +131,10 @@ class FeedbackData:
     def from_dict(data: Dict[str, Any]) -> 'FeedbackData':
         """Create from dictionary."""
         feedback = FeedbackData()
-        feedback.patterns = defaultdict(
-            lambda: {'correct': 0, 'wrong': 0, 'confidence_adj': 1.0},
-            data.get('patterns', {})
-        )
+        feedback.patterns = {
+            _decode_pattern_key(key): value
+            for key, value in data.get('patterns', {}).items()
+        }
         feedback.metadata = data.get('metadata', feedback.metadata)
         return feedback
 
@@ -112,23 +165,19 @@ def record_positive_feedback(
         >>> record_positive_feedback('type', 'documents', 'Documents')
         # Increases confidence for type_documents → Documents
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         feedback = load_feedback(learning_dir)
         
         if not feedback.metadata.get('enabled', True):
             return False
         
-        # Create pattern key
-        pattern_key = f"{pattern_type}_{pattern_value}"
+        pattern = feedback._get_or_init((pattern_type, pattern_value))
         
         # Increment correct count
-        feedback.patterns[pattern_key]['correct'] += POSITIVE_REINFORCEMENT
+        pattern['correct'] += POSITIVE_REINFORCEMENT
         
         # Adjust confidence (increase up to 1.5x)
-        current_adj = feedback.patterns[pattern_key]['confidence_adj']
-        feedback.patterns[pattern_key]['confidence_adj'] = min(1.5, current_adj + 0.05)
+        pattern['confidence_adj'] = min(1.5, pattern['confidence_adj'] + 0.05)
         
         # Update metadata
         feedback.metadata['total_feedback'] += 1
@@ -137,12 +186,12 @@ def record_positive_feedback(
         # Save
         save_feedback(feedback, learning_dir)
         
-        logger.info(f"[LEARNING] Reinforced mapping: {pattern_value} → {destination} (↑ +{POSITIVE_REINFORCEMENT})")
+        _LOG.info("[LEARNING] Reinforced mapping: %s → %s (↑ +%s)", pattern_value, destination, POSITIVE_REINFORCEMENT)
         
         return True
     
     except Exception as e:
-        logger.error(f"Failed to record positive feedback: {e}")
+        _LOG.error("Failed to record positive feedback: %s", e)
         return False
 
 
@@ -168,25 +217,21 @@ def record_negative_feedback(
         >>> record_negative_feedback('ext', '.zip', 'others')
         # Decreases confidence for .zip → others
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         feedback = load_feedback(learning_dir)
         
         if not feedback.metadata.get('enabled', True):
             return False
         
-        # Create pattern key
-        pattern_key = f"{pattern_type}_{pattern_value}"
+        pattern = feedback._get_or_init((pattern_type, pattern_value))
         
         # Increment wrong count
-        feedback.patterns[pattern_key]['wrong'] += abs(NEGATIVE_REINFORCEMENT)
+        pattern['wrong'] += abs(NEGATIVE_REINFORCEMENT)
         
         # Adjust confidence (decrease but not below threshold)
-        current_adj = feedback.patterns[pattern_key]['confidence_adj']
-        feedback.patterns[pattern_key]['confidence_adj'] = max(
+        pattern['confidence_adj'] = max(
             MIN_CONFIDENCE_PENALTY,
-            current_adj - 0.1
+            pattern['confidence_adj'] - 0.1
         )
         
         # Update metadata
@@ -196,12 +241,12 @@ def record_negative_feedback(
         # Save
         save_feedback(feedback, learning_dir)
         
-        logger.info(f"[FEEDBACK] Corrected pattern: {pattern_value} → {destination} (↓ {NEGATIVE_REINFORCEMENT})")
+        _LOG.info("[FEEDBACK] Corrected pattern: %s → %s (↓ %s)", pattern_value, destination, NEGATIVE_REINFORCEMENT)
         
         return True
     
     except Exception as e:
-        logger.error(f"Failed to record negative feedback: {e}")
+        _LOG.error("Failed to record negative feedback: %s", e)
         return False
 
 
@@ -221,8 +266,6 @@ def record_undo_operation(
     Returns:
         True if successful
     """
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         # Import here to avoid circular dependency
         import database_manager as db
@@ -230,33 +273,92 @@ def record_undo_operation(
         # Get files from operation
         files = db.get_operation_files(operation_id, db_path)
         
+        # Count penalties per pattern first, then apply them in one update
+        deltas = Counter()
+        
         for file_record in files:
             file_type = file_record.get('file_type', 'unknown')
-            file_ext = Path(file_record['file_name']).suffix.lower()
+            # Same as Path(name).suffix.lower(), without a Path per record
+            head, _, tail = file_record['file_name'].rpartition('.')
+            file_ext = '.' + tail.lower() if head and tail else ''
             
-            # Extract destination
-            dest_path = Path(file_record['new_path'])
-            # Assume organized/category/year/month structure
-            parts = dest_path.parts
-            if 'organized' in parts:
-                idx = parts.index('organized')
-                if idx + 1 < len(parts):
-                    destination = parts[idx + 1]
-                else:
-                    continue
-            else:
+            # Only files placed in an organized/<category>/... folder count
+            parts = Path(file_record['new_path']).parts
+            if 'organized' not in parts or parts.index('organized') + 1 >= len(parts):
                 continue
             
             # Record negative feedback for each pattern
-            record_negative_feedback('type', file_type, destination, learning_dir)
+            deltas[('type', file_type)] += 1
             if file_ext:
-                record_negative_feedback('ext', file_ext, destination, learning_dir)
+                deltas[('ext', file_ext)] += 1
+        
+        apply_feedback_bulk(deltas, positive=False, learning_dir=learning_dir)
         
-        logger.info(f"[FEEDBACK] Recorded undo operation: {operation_id}")
+        _LOG.info("[FEEDBACK] Recorded undo operation: %s", operation_id)
         return True
     
     except Exception as e:
-        logger.error(f"Failed to record undo feedback: {e}")
+        _LOG.error("Failed to record undo feedback: %s", e)
+        return False
+
+
+def apply_feedback_bulk(
+    deltas: Dict[PatternKey, int],
+    positive: bool,
+    learning_dir: Path = DEFAULT_LEARNING_DIR
+) -> bool:
+    """
+    Apply many feedback events at once.
+    Equivalent to calling record_positive_feedback/record_negative_feedback
+    once per event, but with a single load and a single save.
+    
+    Args:
+        deltas: Mapping of (pattern_type, pattern_value) to number of events
+        positive: True for correct predictions, False for incorrect ones
+        learning_dir: Directory for learning data
+        
+    Returns:
+        True if successful
+        
+    Example:
+        >>> apply_feedback_bulk({('type', 'documents'): 3, ('ext', '.pdf'): 2}, positive=False)
+    """
+    if not deltas:
+        return True
+    
+    try:
+        feedback = load_feedback(learning_dir)
+        
+        if not feedback.metadata.get('enabled', True):
+            return False
+        
+        for pattern_key, count in deltas.items():
+            pattern = feedback._get_or_init(pattern_key)
+            
+            if positive:
+                pattern['correct'] += POSITIVE_REINFORCEMENT * count
+                pattern['confidence_adj'] = min(1.5, pattern['confidence_adj'] + 0.05 * count)
+            else:
+                pattern['wrong'] += abs(NEGATIVE_REINFORCEMENT) * count
+                pattern['confidence_adj'] = max(
+                    MIN_CONFIDENCE_PENALTY,
+                    pattern['confidence_adj'] - 0.1 * count
+                )
+        
+        # Update metadata
+        feedback.metadata['total_feedback'] += sum(deltas.values())
+        feedback.metadata['last_updated'] = datetime.now().isoformat()
+        
+        # Save
+        save_feedback(feedback, learning_dir)
+        
+        label = "[LEARNING] Reinforced" if positive else "[FEEDBACK] Corrected"
+        _LOG.info("%s %d patterns from %d feedback events", label, len(deltas), sum(deltas.values()))
+        
+        return True
+    
+    except Exception as e:
+        _LOG.error("Failed to apply bulk feedback: %s", e)
         return False
 
 
@@ -282,10 +384,9 @@ def get_confidence_adjustment(
     """
     try:
         feedback = load_feedback(learning_dir)
-        pattern_key = f"{pattern_type}_{pattern_value}"
-        
-        if pattern_key in feedback.patterns:
-            return feedback.patterns[pattern_key]['confidence_adj']
+        pattern = feedback.patterns.get((pattern_type, pattern_value))
+        if pattern is not None:
+            return pattern['confidence_adj']
         
         return 1.0  # Neutral (no adjustment)
     
@@ -300,6 +401,7 @@ def apply_feedback_to_confidence(
 ) -> float:
     """
     Apply feedback adjustments to base confidence.
+    Feedback is loaded once and both patterns are looked up in it.
     
     Args:
         base_confidence: Original confidence (0-1)
@@ -310,18 +412,27 @@ def apply_feedback_to_confidence(
         Adjusted confidence (0-1)
     """
     try:
-        # Get adjustments for each pattern
+        feedback = load_feedback(learning_dir)
+        if not feedback.metadata.get('enabled', True):
+            return base_confidence
+        patterns = feedback.patterns
+        
+        # Nothing recorded yet: no adjustment is possible
+        if not patterns:
+            return base_confidence
+        
+        # Get adjustments for each pattern (neutral 1.0 if no feedback yet)
         adjustments = []
         
         # File type adjustment
         if 'file_type' in file_metadata:
-            adj = get_confidence_adjustment('type', file_metadata['file_type'], learning_dir)
-            adjustments.append(adj)
+            pattern = patterns.get(('type', file_metadata['file_type']))
+            adjustments.append(pattern['confidence_adj'] if pattern is not None else 1.0)
         
         # Extension adjustment
         if 'file_ext' in file_metadata:
-            adj = get_confidence_adjustment('ext', file_metadata['file_ext'], learning_dir)
-            adjustments.append(adj)
+            pattern = patterns.get(('ext', file_metadata['file_ext']))
+            adjustments.append(pattern['confidence_adj'] if pattern is not None else 1.0)
         
         # Average adjustment
         if adjustments:
@@ -339,63 +450,195 @@ def apply_feedback_to_confidence(
 # PERSISTENCE
 # ============================================================================
 
+# Loaded feedback per learning directory, and the number of updates not yet
+# written to disk. Every load_feedback() call returns the cached instance, so
+# recording N events costs N in-memory updates plus N/FEEDBACK_FLUSH_INTERVAL
+# file writes rather than N full read/parse/rewrite cycles. The file's
+# st_mtime_ns at load/write time is remembered so that a clean cached copy
+# is re-read if another process changes the file. Once FEEDBACK_CACHE_SIZE
+# directories are cached, the least frequently used one is flushed and
+# evicted to make room.
+_feedback_cache: Dict[str, FeedbackData] = {}
+_dirty_counts: Dict[str, int] = {}
+_feedback_mtimes: Dict[str, Optional[int]] = {}
+_cache_hits: Counter = Counter()
+
+
+def _cache_key(learning_dir: Path) -> str:
+    """Cache key for a learning directory."""
+    return os.path.abspath(learning_dir)
+
+
+def _stat_mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of a file in nanoseconds, or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _forget(key: str) -> None:
+    """Drop every in-memory trace of a cached learning directory."""
+    _feedback_cache.pop(key, None)
+    _dirty_counts.pop(key, None)
+    _feedback_mtimes.pop(key, None)
+    _cache_hits.pop(key, None)
+
+
+def _cache_feedback(key: str, feedback: FeedbackData) -> None:
+    """
+    Store feedback in the cache, evicting the least frequently used
+    directory first when the cache is full. Pending updates of the evicted
+    directory are written to disk before it is dropped.
+    """
+    if key not in _feedback_cache and len(_feedback_cache) >= FEEDBACK_CACHE_SIZE:
+        victim = min(_feedback_cache, key=lambda k: _cache_hits[k])
+        flush_feedback(Path(victim))
+        _forget(victim)
+    
+    _feedback_cache[key] = feedback
+    _cache_hits[key] += 1
+
+
+def _write_feedback_file(feedback: FeedbackData, learning_dir: Path) -> None:
+    """Write feedback to disk atomically (temp file + rename)."""
+    learning_dir.mkdir(parents=True, exist_ok=True)
+    feedback_path = learning_dir / FEEDBACK_FILE
+    tmp_path = feedback_path.with_name(feedback_path.name + '.tmp')
+    
+    # Serialize first, then write once: json.dump() issues many small writes.
+    # The file is machine-read, so it is written compact: without indent the
+    # stdlib encoder runs entirely in its C implementation.
+    payload = json.dumps(feedback.to_dict(), ensure_ascii=False, separators=(',', ':'))
+    with open(tmp_path, 'w', buffering=IO_BUFFER_SIZE, encoding='utf-8') as f:
+        f.write(payload)
+    
+    os.replace(tmp_path, feedback_path)
+    _feedback_mtimes[_cache_key(learning_dir)] = _stat_mtime_ns(feedback_path)
+
+
 def save_feedback(
     feedback: FeedbackData,
-    learning_dir: Path = DEFAULT_LEARNING_DIR
+    learning_dir: Path = DEFAULT_LEARNING_DIR,
+    flush: bool = False
 ) -> bool:
-    """Save feedback data to disk."""
-    logger = logging.getLogger('FileOrganizer')
+    """
+    Save feedback data.
+    
+    The data becomes the cached copy for learning_dir immediately; the file
+    itself is rewritten every FEEDBACK_FLUSH_INTERVAL saves, when flush is
+    True, and at interpreter exit.
     
+    Args:
+        feedback: Feedback data to save
+        learning_dir: Directory for learning data
+        flush: Write to disk now instead of waiting for the next flush
+        
+    Returns:
+        True if successful
+    """
     try:
-        learning_dir.mkdir(parents=True, exist_ok=True)
-        feedback_path = learning_dir / FEEDBACK_FILE
+        key = _cache_key(learning_dir)
+        _cache_feedback(key, feedback)
+        _dirty_counts[key] = _dirty_counts.get(key, 0) + 1
         
-        with open(feedback_path, 'w', encoding='utf-8') as f:
-            json.dump(feedback.to_dict(), f, indent=2, ensure_ascii=False)
+        if flush or _dirty_counts[key] >= FEEDBACK_FLUSH_INTERVAL:
+            _write_feedback_file(feedback, learning_dir)
+            _dirty_counts[key] = 0
         
         return True
     
     except Exception as e:
-        logger.error(f"Failed to save feedback: {e}")
+        _LOG.error("Failed to save feedback: %s", e)
         return False
 
 
+def flush_feedback(learning_dir: Optional[Path] = None) -> bool:
+    """
+    Write pending feedback updates to disk.
+    
+    Args:
+        learning_dir: Directory to flush, or None to flush every directory
+        
+    Returns:
+        True if all pending data was written
+    """
+    if learning_dir is None:
+        keys = list(_dirty_counts)
+    else:
+        keys = [_cache_key(learning_dir)]
+    
+    ok = True
+    for key in keys:
+        if not _dirty_counts.get(key):
+            continue
+        try:
+            _write_feedback_file(_feedback_cache[key], Path(key))
+            _dirty_counts[key] = 0
+        except Exception as e:
+            _LOG.error("Failed to save feedback: %s", e)
+            ok = False
+    
+    return ok
+
+
+atexit.register(flush_feedback)
+
+
 def load_feedback(
     learning_dir: Path = DEFAULT_LEARNING_DIR
 ) -> FeedbackData:
-    """Load feedback data from disk."""
+    """
+    Load feedback data.
+    
+    Returns the in-memory copy when it has unsaved updates or the file is
+    unchanged since it was read (same st_mtime_ns); otherwise reads disk.
+    """
+    key = _cache_key(learning_dir)
     feedback_path = learning_dir / FEEDBACK_FILE
+    mtime_ns = _stat_mtime_ns(feedback_path)
     
-    if not feedback_path.exists():
-        return FeedbackData()
+    cached = _feedback_cache.get(key)
+    if cached is not None:
+        if _dirty_counts.get(key) or mtime_ns == _feedback_mtimes.get(key):
+            _cache_hits[key] += 1
+            return cached
     
-    try:
-        with open(feedback_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    feedback = FeedbackData()
+    
+    if mtime_ns is not None:
+        try:
+            with open(feedback_path, 'r', buffering=IO_BUFFER_SIZE, encoding='utf-8') as f:
+                data = json.loads(f.read())
+            
+            feedback = FeedbackData.from_dict(data)
         
-        return FeedbackData.from_dict(data)
+        except Exception:
+            pass
     
-    except Exception:
-        return FeedbackData()
+    _cache_feedback(key, feedback)
+    _feedback_mtimes[key] = mtime_ns
+    return feedback
 
 
 def clear_feedback(
     learning_dir: Path = DEFAULT_LEARNING_DIR
 ) -> bool:
     """Clear all feedback data."""
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         feedback_path = learning_dir / FEEDBACK_FILE
         
+        # Drop the in-memory copy so pending updates are not written back
+        _forget(_cache_key(learning_dir))
+        
         if feedback_path.exists():
             feedback_path.unlink()
-            logger.info("✓ Feedback data cleared")
+            _LOG.info("✓ Feedback data cleared")
         
         return True
     
     except Exception as e:
-        logger.error(f"Failed to clear feedback: {e}")
+        _LOG.error("Failed to clear feedback: %s", e)
         return False
 
 
@@ -429,7 +672,7 @@ def get_feedback_stats(
         accuracy = (correct / total_feedback * 100) if total_feedback > 0 else 0
         
         pattern_stats.append({
-            'pattern': pattern_key,
+            'pattern': _format_pattern_key(pattern_key),
             'correct': correct,
             'wrong': wrong,
             'accuracy': accuracy,
@@ -467,44 +710,42 @@ def get_feedback_stats(
 
 def print_feedback_stats(learning_dir: Path = DEFAULT_LEARNING_DIR):
     """Print feedback statistics to console."""
-    logger = logging.getLogger('FileOrganizer')
-    
     stats = get_feedback_stats(learning_dir)
     
-    logger.info("=" * 70)
-    logger.info("🧠 LEARNING INSIGHTS")
-    logger.info("=" * 70)
+    _LOG.info("=" * 70)
+    _LOG.info("🧠 LEARNING INSIGHTS")
+    _LOG.info("=" * 70)
     
     if stats['total_feedback'] == 0:
-        logger.info("No feedback data available yet.")
-        logger.info("The system will learn from your organization patterns automatically.")
-        logger.info("=" * 70)
+        _LOG.info("No feedback data available yet.")
+        _LOG.info("The system will learn from your organization patterns automatically.")
+        _LOG.info("=" * 70)
         return
     
-    logger.info(f"Overall Accuracy: {stats['overall_accuracy']:.1f}%")
-    logger.info(f"Total Feedback Events: {stats['total_feedback']}")
-    logger.info(f"  ✓ Correct: {stats['total_correct']}")
-    logger.info(f"  ✗ Wrong: {stats['total_wrong']}")
-    logger.info("")
+    _LOG.info("Overall Accuracy: %.1f%%", stats['overall_accuracy'])
+    _LOG.info("Total Feedback Events: %s", stats['total_feedback'])
+    _LOG.info("  ✓ Correct: %s", stats['total_correct'])
+    _LOG.info("  ✗ Wrong: %s", stats['total_wrong'])
+    _LOG.info("")
     
     if stats['strongest_pattern']:
         sp = stats['strongest_pattern']
-        logger.info(f"Strongest Pattern: {sp['pattern']}")
-        logger.info(f"  Accuracy: {sp['accuracy']:.1f}%")
-        logger.info(f"  Confidence Adj: {sp['confidence_adj']:.2f}x")
+        _LOG.info("Strongest Pattern: %s", sp['pattern'])
+        _LOG.info("  Accuracy: %.1f%%", sp['accuracy'])
+        _LOG.info("  Confidence Adj: %.2fx", sp['confidence_adj'])
     
     if stats['weakest_pattern'] and stats['pattern_count'] > 1:
         wp = stats['weakest_pattern']
-        logger.info(f"Weakest Pattern: {wp['pattern']}")
-        logger.info(f"  Accuracy: {wp['accuracy']:.1f}%")
-        logger.info(f"  Confidence Adj: {wp['confidence_adj']:.2f}x")
+        _LOG.info("Weakest Pattern: %s", wp['pattern'])
+        _LOG.info("  Accuracy: %.1f%%", wp['accuracy'])
+        _LOG.info("  Confidence Adj: %.2fx", wp['confidence_adj'])
     
-    logger.info("")
-    logger.info("Top Patterns:")
+    _LOG.info("")
+    _LOG.info("Top Patterns:")
     for i, pattern in enumerate(stats['patterns'][:5], 1):
-        logger.info(f"  {i}. {pattern['pattern']}: {pattern['accuracy']:.1f}% accuracy")
+        _LOG.info("  %d. %s: %.1f%% accuracy", i, pattern['pattern'], pattern['accuracy'])
     
-    logger.info("=" * 70)
+    _LOG.info("=" * 70)
 
 
 # ============================================================================
@@ -513,35 +754,31 @@ def print_feedback_stats(learning_dir: Path = DEFAULT_LEARNING_DIR):
 
 def enable_feedback(learning_dir: Path = DEFAULT_LEARNING_DIR) -> bool:
     """Enable feedback tracking."""
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         feedback = load_feedback(learning_dir)
         feedback.metadata['enabled'] = True
-        save_feedback(feedback, learning_dir)
+        save_feedback(feedback, learning_dir, flush=True)
         
-        logger.info("✓ Feedback tracking enabled")
+        _LOG.info("✓ Feedback tracking enabled")
         return True
     
     except Exception as e:
-        logger.error(f"Failed to enable feedback: {e}")
+        _LOG.error("Failed to enable feedback: %s", e)
         return False
 
 
 def disable_feedback(learning_dir: Path = DEFAULT_LEARNING_DIR) -> bool:
     """Disable feedback tracking."""
-    logger = logging.getLogger('FileOrganizer')
-    
     try:
         feedback = load_feedback(learning_dir)
         feedback.metadata['enabled'] = False
-        save_feedback(feedback, learning_dir)
+        save_feedback(feedback, learning_dir, flush=True)
         
-        logger.info("✓ Feedback tracking disabled")
+        _LOG.info("✓ Feedback tracking disabled")
         return True
     
     except Exception as e:
-        logger.error(f"Failed to disable feedback: {e}")
+        _LOG.error("Failed to disable feedback: %s", e)
         return False
 
 
@@ -13,12 +13,20 @@ All operations are 100% offline with zero external dependencies.
 """
 
 import os
+import sys
+import errno
 import shutil
+import atexit
+import queue
 import logging
+import logging.handlers
+import time
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Iterator, Union
+from itertools import islice, repeat
+from concurrent.futures import ThreadPoolExecutor
 
 # Import database manager for Phase 2 features
 import database_manager as db
@@ -43,6 +51,9 @@ import visual_dashboard as dashboard
 import insight_engine as insights
 
 
+_LOG = logging.getLogger('FileOrganizer')
+
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -79,36 +90,91 @@ FILE_CATEGORIES = {
     }
 }
 
+# Files pulled from the directory scan and processed per batch
+SCAN_BATCH_SIZE = 1000
+
+# Worker threads used to move files during organization
+MOVE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Target paths are handled as plain strings (os.path) on the per-file path;
+# Path objects are only built at API boundaries.
+
+# Directories this process has already created (or found to exist), so
+# mkdir runs once per target directory rather than once per file
+_CREATED_DIRS: set = set()
+
+# Names taken per target directory: a one-time listing of the directory
+# on first use, plus every name claimed by this process since
+_DIR_NAMES: Dict[str, set] = {}
+
+# Whether stat results carry a real creation time (macOS/BSD, Windows 3.12+)
+_HAS_BIRTHTIME = hasattr(os.stat_result, 'st_birthtime')
+
 # Default folder for uncategorized files
-DEFAULT_CATEGORY = 'others'
+DEFAULT_CATEGORY = sys.intern('others')
+
+# Reverse lookup: extension -> category (first category listing it wins).
+# Keys and values are interned so every returned category is the same object
+# and compares by identity in downstream dicts and counters.
+_EXT_TO_CATEGORY: Dict[str, str] = {}
+for _category, _extensions in FILE_CATEGORIES.items():
+    for _ext in _extensions:
+        _EXT_TO_CATEGORY.setdefault(sys.intern(_ext), sys.intern(_category))
+del _category, _extensions, _ext
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 
+# Background thread writing queued records to the log file
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging(log_file: str = 'file_organizer.log', log_level: int = logging.INFO):
     """
     Configure logging to write to both file and console.
     
+    Console output is written synchronously, so it stays in order with
+    print() and input(). File records are put on a queue and written by a
+    listener thread, so slow disk writes never block file operations or
+    training. Calling this again for the same log file keeps that listener.
+    
     Args:
         log_file: Name of the log file
         log_level: Logging level (default: INFO)
     """
+    global _LOG_LISTENER
+    
     # Create logger
-    logger = logging.getLogger('FileOrganizer')
+    logger = _LOG
     logger.setLevel(log_level)
     
-    # Clear existing handlers to avoid duplicates
+    # Keep the listener if it already writes this file; otherwise drain it
+    file_handler = None
+    if _LOG_LISTENER is not None:
+        if _LOG_LISTENER.handlers[0].baseFilename == os.path.abspath(log_file):
+            file_handler = _LOG_LISTENER.handlers[0]
+        else:
+            shutdown_logging()
+    
+    # Close and clear existing handlers to avoid duplicates
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
     
-    # File handler
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # File handler, fed from a queue by the listener thread
+    if file_handler is None:
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        file_handler.setFormatter(file_formatter)
+        _LOG_LISTENER = logging.handlers.QueueListener(
+            queue.SimpleQueue(), file_handler, respect_handler_level=True
+        )
+        _LOG_LISTENER.start()
     file_handler.setLevel(log_level)
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(file_formatter)
     
     # Console handler
     console_handler = logging.StreamHandler()
@@ -117,16 +183,52 @@ def setup_logging(log_file: str = 'file_organizer.log', log_level: int = logging
     console_handler.setFormatter(console_formatter)
     
     # Add handlers to logger
-    logger.addHandler(file_handler)
+    logger.addHandler(logging.handlers.QueueHandler(_LOG_LISTENER.queue))
     logger.addHandler(console_handler)
     
     return logger
 
 
+def shutdown_logging():
+    """
+    Write any queued records and stop the listener.
+    
+    The file handler is attached to the logger directly afterwards, so
+    records logged later (e.g. by other atexit callbacks, which may run
+    after this one) are still written, synchronously. logging's own
+    shutdown closes it at exit.
+    """
+    global _LOG_LISTENER
+    
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        for handler in list(_LOG.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                _LOG.removeHandler(handler)
+        for handler in _LOG_LISTENER.handlers:
+            _LOG.addHandler(handler)
+        _LOG_LISTENER = None
+
+
+atexit.register(shutdown_logging)
+
+
 # ============================================================================
 # FILE ANALYSIS FUNCTIONS
 # ============================================================================
 
+def _suffix_of(file_name: str) -> str:
+    """
+    Lower-cased extension of a file name, as Path.suffix would give it
+    ('' for names without one and for dotfiles like '.bashrc'), computed
+    with plain string operations.
+    """
+    dot = file_name.rfind('.')
+    if 0 < dot < len(file_name) - 1:
+        return file_name[dot:].lower()
+    return ''
+
+
 def get_file_category(file_path: Path) -> str:
     """
     Determine the category of a file based on its extension.
@@ -137,82 +239,234 @@ def get_file_category(file_path: Path) -> str:
     Returns:
         Category name as string (e.g., 'images', 'documents', 'others')
     """
-    extension = file_path.suffix.lower()
-    
-    # Check each category for the extension
-    for category, extensions in FILE_CATEGORIES.items():
-        if extension in extensions:
-            return category
-    
-    # Return default category if no match found
-    return DEFAULT_CATEGORY
+    # Single dict lookup; default category if no match found
+    return _EXT_TO_CATEGORY.get(_suffix_of(file_path.name), DEFAULT_CATEGORY)
 
 
-def get_file_creation_date(file_path: Path) -> Tuple[int, int]:
+def get_file_creation_date(
+    file_path: Union[Path, os.DirEntry, os.stat_result]
+) -> Tuple[int, int]:
     """
     Get the creation date of a file and return year and month.
     
     Args:
-        file_path: Path object of the file
+        file_path: Path of the file, a DirEntry from os.scandir (its cached
+            stat is used), or an already-taken os.stat_result
         
     Returns:
         Tuple of (year, month) as integers
     """
     try:
-        # Try to get creation time (Windows) or change time (Unix)
-        if os.name == 'nt':  # Windows
-            timestamp = os.path.getctime(file_path)
-        else:  # Unix-like systems
+        if isinstance(file_path, os.stat_result):
+            stat = file_path
+        elif isinstance(file_path, os.DirEntry):
+            stat = file_path.stat()
+        else:
             stat = os.stat(file_path)
-            # Use birth time if available, otherwise modification time
-            timestamp = getattr(stat, 'st_birthtime', stat.st_mtime)
         
-        creation_date = datetime.fromtimestamp(timestamp)
-        return creation_date.year, creation_date.month
+        # Use birth time if available; otherwise creation time (Windows
+        # ctime) or modification time (Unix)
+        if _HAS_BIRTHTIME:
+            timestamp = stat.st_birthtime
+        elif os.name == 'nt':
+            timestamp = stat.st_ctime
+        else:
+            timestamp = stat.st_mtime
+        
+        # time.localtime avoids building a datetime object
+        return time.localtime(timestamp)[:2]
     
     except Exception as e:
         # If we can't get creation date, use current date
-        current_date = datetime.now()
-        return current_date.year, current_date.month
+        return time.localtime()[:2]
 
 
-def scan_directory(directory: Path, recursive: bool = False) -> List[Path]:
+def scan_directory(directory: Path, recursive: bool = False) -> Iterator[Path]:
     """
-    Scan a directory and return a list of all files (excluding directories).
+    Scan a directory and yield all files (excluding directories).
+    Files are produced lazily as the walk proceeds; wrap in list() if a
+    complete snapshot is needed.
     
     Args:
         directory: Path object of the directory to scan
         recursive: If True, scan subdirectories recursively
         
-    Returns:
-        List of Path objects for all files found
+    Yields:
+        Path objects for all files found
+    """
+    for entry in scan_directory_entries(directory, recursive=recursive):
+        yield Path(entry.path)
+
+
+def scan_directory_entries(
+    directory: Path,
+    recursive: bool = False,
+    exclude: Optional[Path] = None
+) -> Iterator[os.DirEntry]:
+    """
+    Scan a directory and yield a DirEntry for every file.
+    
+    Unlike scan_directory, the entries are passed through as-is so callers
+    can use DirEntry.stat(), which is cached on the entry, instead of
+    issuing fresh stat() calls through Path.
+    
+    Args:
+        directory: Path object of the directory to scan
+        recursive: If True, scan subdirectories recursively
+        exclude: Subdirectory (same form as directory, e.g. both resolved)
+            that is pruned from the walk together with everything below it
+        
+    Yields:
+        os.DirEntry objects for all files found
     """
-    files = []
+    excluded = str(exclude) if exclude is not None else None
     
     try:
-        if recursive:
-            # Recursively find all files
-            for item in directory.rglob('*'):
-                if item.is_file():
-                    files.append(item)
-        else:
-            # Only scan the top-level directory
-            for item in directory.iterdir():
-                if item.is_file():
-                    files.append(item)
+        # Iterative os.scandir walk: DirEntry.is_dir()/is_file() reuse the
+        # file type from readdir, avoiding a stat() per entry
+        stack = [str(directory)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and entry.path != excluded:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError as e:
+                # Unreadable subdirectories are skipped; the top level is fatal
+                if current == str(directory):
+                    raise
+                _LOG.debug("Skipping %s: %s", current, e)
     
     except PermissionError as e:
-        logging.getLogger('FileOrganizer').error(f"Permission denied: {directory}")
+        _LOG.error("Permission denied: %s", directory)
     except Exception as e:
-        logging.getLogger('FileOrganizer').error(f"Error scanning directory {directory}: {e}")
-    
-    return files
+        _LOG.error("Error scanning directory %s: %s", directory, e)
 
 
 # ============================================================================
 # FILE ORGANIZATION FUNCTIONS
 # ============================================================================
 
+def _ensure_dir(directory: str) -> None:
+    """Create a directory (and parents) unless this process already did."""
+    if directory not in _CREATED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _CREATED_DIRS.add(directory)
+
+
+def _same_filesystem(source: Path, target: Path) -> bool:
+    """
+    Whether source and target (or its nearest existing ancestor) are on the
+    same device, i.e. whether moves between them can be plain renames.
+    """
+    try:
+        while not target.exists() and target.parent != target:
+            target = target.parent
+        return os.stat(source).st_dev == os.stat(target).st_dev
+    except OSError:
+        return True  # Unknown; try the rename and let EXDEV decide
+
+
+def _rename_or_move(source: Path, target_file: str, same_fs: bool = True) -> None:
+    """
+    Move a file with a single rename(2) when possible, falling back to
+    shutil.move only when the target lives on another filesystem.
+    When same_fs is False the rename attempt is skipped altogether.
+    """
+    if not same_fs:
+        shutil.move(str(source), str(target_file))
+        return
+    try:
+        os.replace(source, target_file)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source), str(target_file))
+
+
+def _move_into(
+    source: Path,
+    target_dir: str,
+    target_file: str,
+    same_fs: bool = True
+) -> None:
+    """
+    Move a file into target_dir, creating the directory on first use.
+    If a cached directory has since been removed, it is recreated once.
+    """
+    _ensure_dir(target_dir)
+    try:
+        _rename_or_move(source, target_file, same_fs)
+    except FileNotFoundError:
+        _CREATED_DIRS.discard(target_dir)
+        _ensure_dir(target_dir)
+        _rename_or_move(source, target_file, same_fs)
+
+
+def _resolve_target(target_dir: str, file_name: str, claim: bool = True) -> str:
+    """
+    Pick a free path for file_name in target_dir, appending _1, _2, ...
+    on conflicts.
+    
+    The directory is listed once, on its first use, and names claimed by
+    earlier calls are added to that snapshot in _DIR_NAMES. Conflicts are
+    then resolved in memory, with no exists() call per file or attempt.
+    
+    Args:
+        target_dir: Destination directory
+        file_name: Desired file name
+        claim: Reserve the chosen name for subsequent calls
+        
+    Returns:
+        Conflict-free target path
+    """
+    names = _DIR_NAMES.get(target_dir)
+    if names is None:
+        try:
+            names = set(os.listdir(target_dir))
+        except OSError:
+            names = set()  # Not created yet
+        _DIR_NAMES[target_dir] = names
+    
+    candidate = file_name
+    if candidate in names:
+        stem, suffix = os.path.splitext(file_name)
+        counter = 1
+        while candidate in names:
+            candidate = f"{stem}_{counter}{suffix}"
+            counter += 1
+    
+    if claim:
+        names.add(candidate)
+    return os.path.join(target_dir, candidate)
+
+
+def _execute_move(
+    move: Tuple[Path, str, str, Optional[Dict]],
+    same_fs: bool = True
+) -> Optional[Exception]:
+    """
+    Perform one planned move (worker for organize_files).
+    
+    Args:
+        move: (source, target directory, target file, database record) tuple
+        same_fs: Whether source and target are on the same filesystem
+        
+    Returns:
+        None on success, otherwise the exception raised
+    """
+    source, target_dir, target_file, _ = move
+    try:
+        _move_into(source, target_dir, target_file, same_fs)
+        return None
+    except Exception as e:
+        return e
+
+
 def build_organized_path(
     base_output_dir: Path,
     category: str,
@@ -233,14 +487,23 @@ def build_organized_path(
     Returns:
         Path object for the target directory
     """
+    return Path(_organized_dir(str(base_output_dir), category, year, month, organize_by_date))
+
+
+def _organized_dir(
+    base_output_dir: str,
+    category: str,
+    year: int,
+    month: int,
+    organize_by_date: bool = True
+) -> str:
+    """String form of build_organized_path, used on the per-file path."""
     if organize_by_date:
         # Create path: organized/category/year/month/
-        target_dir = base_output_dir / category / str(year) / f"{month:02d}"
-    else:
-        # Create path: organized/category/
-        target_dir = base_output_dir / category
+        return os.path.join(base_output_dir, category, str(year), f"{month:02d}")
     
-    return target_dir
+    # Create path: organized/category/
+    return os.path.join(base_output_dir, category)
 
 
 def move_file(
@@ -248,7 +511,7 @@ def move_file(
     target_dir: Path,
     dry_run: bool = True,
     logger: Optional[logging.Logger] = None,
-    file_hash: Optional[str] = None,
+    file_hash: Optional[bytes] = None,
     file_info: Optional[Dict] = None
 ) -> bool:
     """
@@ -264,41 +527,36 @@ def move_file(
         True if successful (or would be successful in dry-run), False otherwise
     """
     if logger is None:
-        logger = logging.getLogger('FileOrganizer')
+        logger = _LOG
+    
+    target_dir = os.fspath(target_dir)
     
     try:
         # Create target directory if it doesn't exist (even in dry-run for validation)
         if not dry_run:
-            target_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Build target file path
-        target_file = target_dir / source.name
+            _ensure_dir(target_dir)
         
-        # Handle name conflicts by appending a number
-        counter = 1
-        original_target = target_file
-        while target_file.exists():
-            stem = original_target.stem
-            suffix = original_target.suffix
-            target_file = target_dir / f"{stem}_{counter}{suffix}"
-            counter += 1
+        # Build target file path, handling name conflicts by appending a number.
+        # Standalone calls may be far apart, so list the directory afresh.
+        _DIR_NAMES.pop(target_dir, None)
+        target_file = _resolve_target(target_dir, source.name, claim=not dry_run)
         
         # Log the action
         action = "WOULD MOVE" if dry_run else "MOVING"
-        logger.info(f"{action}: {source} -> {target_file}")
+        logger.info("%s: %s -> %s", action, source, target_file)
         
         # Perform the move if not in dry-run mode
         if not dry_run:
-            shutil.move(str(source), str(target_file))
-            logger.info(f"SUCCESS: Moved {source.name}")
+            _move_into(source, target_dir, target_file)
+            logger.info("SUCCESS: Moved %s", source.name)
         
         return True
     
     except PermissionError:
-        logger.error(f"PERMISSION DENIED: Cannot move {source}")
+        logger.error("PERMISSION DENIED: Cannot move %s", source)
         return False
     except Exception as e:
-        logger.error(f"ERROR moving {source}: {e}")
+        logger.error("ERROR moving %s: %s", source, e)
         return False
 
 
@@ -343,43 +601,44 @@ def organize_files(
     
     # Validate source directory
     if not source_path.exists():
-        logger.error(f"Source directory does not exist: {source_path}")
+        logger.error("Source directory does not exist: %s", source_path)
         return {'files_processed': 0, 'files_moved': 0, 'errors': 1, 'duplicates_found': 0}
     
     if not source_path.is_dir():
-        logger.error(f"Source path is not a directory: {source_path}")
+        logger.error("Source path is not a directory: %s", source_path)
         return {'files_processed': 0, 'files_moved': 0, 'errors': 1, 'duplicates_found': 0}
     
+    # Directories may have changed since a previous run in this process
+    _CREATED_DIRS.clear()
+    _DIR_NAMES.clear()
+    
     # Initialize database if enabled
     operation_id = None
     if enable_database and not dry_run:
         try:
             db.init_db(db_path)
             operation_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
-            logger.info(f"Database initialized: {db_path}")
-            logger.info(f"Operation ID: {operation_id}")
+            logger.info("Database initialized: %s", db_path)
+            logger.info("Operation ID: %s", operation_id)
         except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error("Failed to initialize database: %s", e)
             enable_database = False
     
     # Log operation start
     mode = "DRY-RUN MODE" if dry_run else "LIVE MODE"
     logger.info("=" * 70)
-    logger.info(f"FILE ORGANIZER PHASE 2 - {mode}")
+    logger.info("FILE ORGANIZER PHASE 2 - %s", mode)
     logger.info("=" * 70)
-    logger.info(f"Source directory: {source_path}")
-    logger.info(f"Output directory: {output_path}")
-    logger.info(f"Organize by date: {organize_by_date}")
-    logger.info(f"Recursive scan: {recursive}")
-    logger.info(f"Database tracking: {enable_database}")
-    logger.info(f"Duplicate detection: {check_duplicates}")
-    logger.info(f"Remove duplicates: {remove_duplicates}")
+    logger.info("Source directory: %s", source_path)
+    logger.info("Output directory: %s", output_path)
+    logger.info("Organize by date: %s", organize_by_date)
+    logger.info("Recursive scan: %s", recursive)
+    logger.info("Database tracking: %s", enable_database)
+    logger.info("Duplicate detection: %s", check_duplicates)
+    logger.info("Remove duplicates: %s", remove_duplicates)
     logger.info("=" * 70)
     
-    # Scan directory for files
     logger.info("Scanning directory for files...")
-    files = scan_directory(source_path, recursive=recursive)
-    logger.info(f"Found {len(files)} files to process")
     
     # Statistics
     stats = {
@@ -390,135 +649,221 @@ def organize_files(
         'duplicates_removed': 0
     }
     
-    # Process each file
-    for file_path in files:
-        stats['files_processed'] += 1
+    # Database records are buffered and written in batches; records not yet
+    # flushed are indexed by hash so duplicates within this run are still caught
+    pending_records = []
+    pending_by_hash = {}
+    
+    def flush_pending_records():
+        if not pending_records:
+            return
+        try:
+            db.insert_file_records(pending_records, db_path)
+        except Exception as e:
+            logger.error("Failed to insert database records: %s", e)
         
-        # Skip if file is in the output directory (avoid moving organized files)
+        # Moved files are no longer at the cached paths
         try:
-            if output_path in file_path.parents or file_path.parent == output_path:
-                logger.info(f"SKIPPING: {file_path.name} (already in output directory)")
+            db.forget_cached_hashes([r['original_path'] for r in pending_records], db_path)
+        except Exception as e:
+            logger.debug("Failed to prune hash cache: %s", e)
+        pending_records.clear()
+        pending_by_hash.clear()
+    
+    # An output directory inside the source tree is pruned from the scan, so
+    # already organized files are never visited. Only when the source itself
+    # lies inside the output directory is every file skipped here instead.
+    source_in_output = os.path.join(str(source_path), '').startswith(
+        os.path.join(str(output_path), '')
+    )
+    
+    # Decided once per run: same-volume moves are single renames, while
+    # cross-device moves go straight to shutil.move's copy and unlink
+    same_fs = _same_filesystem(source_path, output_path)
+    output_str = str(output_path)
+    
+    # Files are streamed from the scanner and handled in batches, so memory
+    # stays bounded by SCAN_BATCH_SIZE rather than the size of the tree
+    entries = scan_directory_entries(source_path, recursive=recursive, exclude=output_path)
+    while chunk := list(islice(entries, SCAN_BATCH_SIZE)):
+        logger.debug("Processing batch of %d files", len(chunk))
+        
+        # Stat each file once through its DirEntry; every later size, time
+        # and date lookup for the file reuses this stat_result
+        batch = []
+        for entry in chunk:
+            stats['files_processed'] += 1
+            
+            # Skip if file is in the output directory (avoid moving organized files)
+            if source_in_output:
+                logger.info("SKIPPING: %s (already in output directory)", entry.name)
                 continue
-        except Exception:
-            pass
-        
-        # Compute SHA-256 hash if duplicate checking is enabled
-        file_hash = None
-        if check_duplicates or enable_database:
+            
             try:
-                file_hash = db.compute_file_hash(file_path)
-            except Exception as e:
-                logger.error(f"Failed to compute hash for {file_path.name}: {e}")
-        
-        # Check for duplicates
-        is_duplicate = False
-        if check_duplicates and file_hash and enable_database:
+                batch.append((Path(entry.path), entry.stat()))
+            except OSError as e:
+                logger.error("ERROR reading %s: %s", entry.path, e)
+                stats['errors'] += 1
+        
+        # Hash the batch up front in parallel. Hashes are only used against
+        # the database: in a live run every hash is stored, while a dry run
+        # merely compares, so there only files whose size some recorded file
+        # shares are hashed. Unchanged files are served from the hash cache.
+        file_hashes = {}
+        if enable_database and (check_duplicates or not dry_run):
+            to_hash = batch
+            if dry_run:
+                try:
+                    recorded_sizes = db.get_recorded_sizes((st.st_size for _, st in batch), db_path)
+                except Exception:
+                    recorded_sizes = set()  # Nothing recorded to compare against
+                to_hash = [(f, st) for f, st in batch if st.st_size in recorded_sizes]
+            file_hashes = db.get_or_compute_hashes(to_hash, db_path)
+        
+        # Look up every hash of the batch in one go rather than per file
+        recorded = {}
+        if check_duplicates and enable_database and file_hashes:
             try:
-                duplicate = db.get_duplicate(file_hash, db_path)
-                if duplicate:
-                    stats['duplicates_found'] += 1
-                    is_duplicate = True
-                    logger.warning(f"DUPLICATE: {file_path.name} matches {duplicate['file_name']}")
-                    logger.warning(f"  Original: {duplicate['new_path']}")
-                    logger.warning(f"  Duplicate: {file_path}")
-                    
-                    # Handle duplicate removal
-                    if remove_duplicates:
-                        if dry_run:
-                            logger.info(f"WOULD DELETE duplicate: {file_path}")
-                        else:
-                            try:
-                                file_path.unlink()
-                                stats['duplicates_removed'] += 1
-                                logger.info(f"DELETED duplicate: {file_path}")
-                            except Exception as e:
-                                logger.error(f"Failed to delete duplicate {file_path}: {e}")
-                                stats['errors'] += 1
-                    continue  # Skip moving this file
+                recorded = db.get_duplicates(file_hashes.values(), db_path)
             except Exception as e:
-                logger.error(f"Error checking for duplicates: {e}")
-        
-        # Determine file category
-        category = get_file_category(file_path)
-        logger.debug(f"File: {file_path.name} -> Category: {category}")
-        
-        # Get creation date
-        year, month = get_file_creation_date(file_path)
-        logger.debug(f"Creation date: {year}-{month:02d}")
-        
-        # Get file stats for database
-        file_stat = file_path.stat()
-        file_size = file_stat.st_size
-        created_at = datetime.fromtimestamp(file_stat.st_ctime).isoformat()
-        modified_at = datetime.fromtimestamp(file_stat.st_mtime).isoformat()
+                logger.error("Error checking for duplicates: %s", e)
         
-        # Build target path
-        target_dir = build_organized_path(
-            output_path, category, year, month, organize_by_date
-        )
-        
-        # Build full target path for database
-        target_file = target_dir / file_path.name
-        
-        # Handle name conflicts
-        counter = 1
-        original_target = target_file
-        while target_file.exists():
-            stem = original_target.stem
-            suffix = original_target.suffix
-            target_file = target_dir / f"{stem}_{counter}{suffix}"
-            counter += 1
+        # Plan each file's destination; the moves themselves run afterwards
+        planned_moves = []
         
-        # Log the action
-        action = "WOULD MOVE" if dry_run else "MOVING"
-        logger.info(f"{action}: {file_path} -> {target_file}")
-        
-        # Move the file
-        try:
-            if not dry_run:
-                # Create target directory
-                target_dir.mkdir(parents=True, exist_ok=True)
-                # Move file
-                shutil.move(str(file_path), str(target_file))
-                logger.info(f"SUCCESS: Moved {file_path.name}")
+        for file_path, file_stat in batch:
+            # SHA-256 hash (None if hashing was disabled or failed)
+            file_hash = file_hashes.get(file_path)
             
-            stats['files_moved'] += 1
-            
-            # Insert into database
-            if enable_database and not dry_run and operation_id:
+            # Check for duplicates
+            is_duplicate = False
+            if check_duplicates and file_hash and enable_database:
                 try:
-                    file_info = {
-                        'original_path': str(file_path),
-                        'new_path': str(target_file),
-                        'file_name': file_path.name,
-                        'file_size': file_size,
-                        'file_type': category,
-                        'created_at': created_at,
-                        'modified_at': modified_at,
-                        'sha256_hash': file_hash or '',
-                        'operation_id': operation_id
-                    }
-                    db.insert_file_record(file_info, db_path)
+                    duplicate = pending_by_hash.get(file_hash) or recorded.get(file_hash)
+                    if duplicate:
+                        stats['duplicates_found'] += 1
+                        is_duplicate = True
+                        logger.warning("DUPLICATE: %s matches %s", file_path.name, duplicate['file_name'])
+                        logger.warning("  Original: %s", duplicate['new_path'])
+                        logger.warning("  Duplicate: %s", file_path)
+                        
+                        # Handle duplicate removal
+                        if remove_duplicates:
+                            if dry_run:
+                                logger.info("WOULD DELETE duplicate: %s", file_path)
+                            else:
+                                try:
+                                    # Re-read the content right before deleting,
+                                    # so a stale cached hash can never cost a file
+                                    if db.compute_file_hash(file_path) != file_hash:
+                                        logger.warning("Content changed, not deleting: %s", file_path)
+                                    else:
+                                        file_path.unlink()
+                                        stats['duplicates_removed'] += 1
+                                        logger.info("DELETED duplicate: %s", file_path)
+                                except Exception as e:
+                                    logger.error("Failed to delete duplicate %s: %s", file_path, e)
+                                    stats['errors'] += 1
+                        continue  # Skip moving this file
                 except Exception as e:
-                    logger.error(f"Failed to insert database record: {e}")
+                    logger.error("Error checking for duplicates: %s", e)
+            
+            # Determine file category
+            category = _EXT_TO_CATEGORY.get(_suffix_of(file_path.name), DEFAULT_CATEGORY)
+            logger.debug("File: %s -> Category: %s", file_path.name, category)
+            
+            # Get creation date (from the scan's stat)
+            year, month = get_file_creation_date(file_stat)
+            logger.debug("Creation date: %d-%02d", year, month)
+            
+            # Build target path
+            target_dir = _organized_dir(
+                output_str, category, year, month, organize_by_date
+            )
+            
+            # Build full target path for database, handling name conflicts
+            # (including names already claimed by other moves in this batch)
+            target_file = _resolve_target(target_dir, file_path.name, claim=not dry_run)
+            
+            # Log the action
+            action = "WOULD MOVE" if dry_run else "MOVING"
+            logger.info("%s: %s -> %s", action, file_path, target_file)
+            
+            if dry_run:
+                stats['files_moved'] += 1
+                continue
+            
+            # Database record, written once the move has succeeded. It is
+            # indexed by hash now so later duplicates in the batch are caught.
+            # The ISO timestamps are only formatted for files being recorded.
+            file_info = None
+            if enable_database and operation_id:
+                file_info = {
+                    'original_path': str(file_path),
+                    'new_path': str(target_file),
+                    'file_name': file_path.name,
+                    'file_size': file_stat.st_size,
+                    'file_type': category,
+                    'created_at': datetime.fromtimestamp(file_stat.st_ctime).isoformat(),
+                    'modified_at': datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+                    'sha256_hash': file_hash or b'',
+                    'operation_id': operation_id,
+                    'mtime_ns': file_stat.st_mtime_ns
+                }
+                if file_hash:
+                    pending_by_hash[file_hash] = file_info
+            
+            planned_moves.append((file_path, target_dir, target_file, file_info))
         
-        except PermissionError:
-            logger.error(f"PERMISSION DENIED: Cannot move {file_path}")
-            stats['errors'] += 1
-        except Exception as e:
-            logger.error(f"ERROR moving {file_path}: {e}")
-            stats['errors'] += 1
+        # Execute the batch's moves in parallel; they are independent and
+        # dominated by filesystem latency. Target directories are created
+        # up front, once per unique directory, so the workers only rename.
+        if planned_moves:
+            for target_dir in {move[1] for move in planned_moves}:
+                try:
+                    _ensure_dir(target_dir)
+                except OSError:
+                    pass  # Retried and reported by the move itself
+            
+            with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as executor:
+                results = list(executor.map(_execute_move, planned_moves, repeat(same_fs)))
+            
+            for (file_path, _, _, file_info), error in zip(planned_moves, results):
+                if error is None:
+                    logger.info("SUCCESS: Moved %s", file_path.name)
+                    stats['files_moved'] += 1
+                    
+                    # Queue database record
+                    if file_info is not None:
+                        pending_records.append(file_info)
+                        if len(pending_records) >= db.INSERT_BATCH_SIZE:
+                            flush_pending_records()
+                    continue
+                
+                if isinstance(error, PermissionError):
+                    logger.error("PERMISSION DENIED: Cannot move %s", file_path)
+                else:
+                    logger.error("ERROR moving %s: %s", file_path, error)
+                stats['errors'] += 1
+                
+                # The file was not moved, so it must not shadow later duplicates
+                if file_info is not None and file_info['sha256_hash']:
+                    if pending_by_hash.get(file_info['sha256_hash']) is file_info:
+                        del pending_by_hash[file_info['sha256_hash']]
+        
+    # Write any records still buffered
+    flush_pending_records()
     
     # Log summary
     logger.info("=" * 70)
     logger.info("ORGANIZATION COMPLETE")
     logger.info("=" * 70)
-    logger.info(f"Files processed: {stats['files_processed']}")
-    logger.info(f"Files moved: {stats['files_moved']}")
-    logger.info(f"Duplicates found: {stats['duplicates_found']}")
+    logger.info("Files processed: %s", stats['files_processed'])
+    logger.info("Files moved: %s", stats['files_moved'])
+    logger.info("Duplicates found: %s", stats['duplicates_found'])
     if remove_duplicates:
-        logger.info(f"Duplicates removed: {stats['duplicates_removed']}")
-    logger.info(f"Errors: {stats['errors']}")
+        logger.info("Duplicates removed: %s", stats['duplicates_removed'])
+    logger.info("Errors: %s", stats['errors'])
     
     if dry_run:
         logger.info("")
@@ -14,7 +14,7 @@ This module provides:
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, Counter
 from pathlib import Path
 
 import database_manager as db
@@ -24,13 +24,89 @@ import maintenance_engine as maintenance
 import diagnostic_engine as diagnostic
 
 
+# ============================================================================
+# MESSAGE TEMPLATES
+# ============================================================================
+
+# Weekly summary ladders, formatted with a single percentage
+CONF_EXCELLENT = "⭐ Excellent! Model confidence is very high at %.1f%%"
+CONF_GOOD = "✓ Model confidence is good at %.1f%%"
+CONF_FAIR = "⚠️  Model confidence is fair at %.1f%% - consider retraining"
+CONF_LOW = "🔴 Model confidence is low at %.1f%% - retrain recommended"
+
+ACCURACY_EXCELLENT = "📈 Accuracy is excellent at %.1f%%"
+ACCURACY_GOOD = "✓ Accuracy is good at %.1f%%"
+ACCURACY_FAIR = "⚠️  Accuracy needs improvement: %.1f%%"
+ACCURACY_LOW = "🔴 Accuracy is low: %.1f%% - review patterns"
+
+RETRAINS_FREQUENT = "⚙️  Model retrained %d times this week - possible instability"
+DATABASE_LARGE = "💾 Database is getting large (%.1f MB)"
+
+
+# ============================================================================
+# SHARED INPUTS
+# ============================================================================
+
+class SummaryContext:
+    """
+    Inputs shared by the insight generators, each loaded at most once.
+    
+    Building one context and passing it to several generators (as
+    generate_insight_report and print_smart_insights do) means the model, feedback, maintenance
+    log and database statistics are read once per report rather than once
+    per section. Everything is loaded lazily, so a generator that needs
+    only part of the data does not pay for the rest.
+    """
+    
+    def __init__(
+        self,
+        db_path: str = 'file_organizer.db',
+        learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR
+    ):
+        self.db_path = db_path
+        self.learning_dir = learning_dir
+        self._cache = {}
+    
+    def _get(self, name: str, loader):
+        if name not in self._cache:
+            self._cache[name] = loader()
+        return self._cache[name]
+    
+    @property
+    def model(self):
+        return self._get('model', lambda: learn.load_model(self.learning_dir))
+    
+    @property
+    def feedback_stats(self) -> Dict[str, Any]:
+        return self._get('feedback_stats', lambda: feedback.get_feedback_stats(self.learning_dir))
+    
+    @property
+    def maintenance_log(self):
+        return self._get('maintenance_log', lambda: maintenance.MaintenanceLog(self.learning_dir))
+    
+    @property
+    def db_exists(self) -> bool:
+        return self._get('db_exists', lambda: db.database_exists(self.db_path))
+    
+    @property
+    def db_stats(self) -> Dict[str, Any]:
+        return self._get('db_stats', lambda: db.get_database_stats(self.db_path))
+    
+    @property
+    def db_size_mb(self) -> float:
+        # Only the file size is needed here, so skip diagnose_database()
+        # and its full integrity check
+        return self._get('db_size_mb', lambda: Path(self.db_path).stat().st_size / (1024 * 1024))
+
+
 # ============================================================================
 # INSIGHT GENERATION
 # ============================================================================
 
 def generate_weekly_summary(
     db_path: str = 'file_organizer.db',
-    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR
+    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR,
+    context: Optional[SummaryContext] = None
 ) -> Dict[str, Any]:
     """
     Generate weekly performance summary.
@@ -38,6 +114,7 @@ def generate_weekly_summary(
     Args:
         db_path: Database path
         learning_dir: Learning data directory
+        context: Shared inputs to reuse (built from the paths if omitted)
         
     Returns:
         Summary dictionary with insights
@@ -51,43 +128,32 @@ def generate_weekly_summary(
     }
     
     # Get current metrics
-    model = learn.load_model(learning_dir)
-    fb_stats = feedback.get_feedback_stats(learning_dir)
-    mlog = maintenance.MaintenanceLog(learning_dir)
+    if context is None:
+        context = SummaryContext(db_path, learning_dir)
+    model = context.model
+    fb_stats = context.feedback_stats
+    mlog = context.maintenance_log
     
     # Model insights
     if model and model.total_samples > 0:
         # Calculate average confidence
-        confidences = []
-        for file_type, destinations in model.type_to_folder.items():
-            total = sum(destinations.values())
-            if total > 0:
-                max_count = max(destinations.values())
-                confidences.append((max_count / total) * 100)
+        aggregates = learn.get_confidence_aggregates(model)
+        avg_conf = aggregates['avg_confidence']
         
-        if confidences:
-            avg_conf = sum(confidences) / len(confidences)
+        if avg_conf is not None:
             summary['stats']['avg_confidence'] = avg_conf
-            summary['stats']['total_patterns'] = len(confidences)
-            summary['stats']['total_samples'] = model.total_samples
+            summary['stats']['total_patterns'] = aggregates['total_patterns']
+            summary['stats']['total_samples'] = aggregates['total_samples']
             
             # Insight: Model confidence
             if avg_conf >= 90:
-                summary['insights'].append(
-                    f"⭐ Excellent! Model confidence is very high at {avg_conf:.1f}%"
-                )
+                summary['insights'].append(CONF_EXCELLENT % avg_conf)
             elif avg_conf >= 75:
-                summary['insights'].append(
-                    f"✓ Model confidence is good at {avg_conf:.1f}%"
-                )
+                summary['insights'].append(CONF_GOOD % avg_conf)
             elif avg_conf >= 60:
-                summary['insights'].append(
-                    f"⚠️  Model confidence is fair at {avg_conf:.1f}% - consider retraining"
-                )
+                summary['insights'].append(CONF_FAIR % avg_conf)
             else:
-                summary['insights'].append(
-                    f"🔴 Model confidence is low at {avg_conf:.1f}% - retrain recommended"
-                )
+                summary['insights'].append(CONF_LOW % avg_conf)
                 summary['recommendations'].append("Run --relearn to retrain the model")
     else:
         summary['insights'].append("ℹ️  No trained model found")
@@ -100,21 +166,13 @@ def generate_weekly_summary(
         summary['stats']['total_feedback'] = fb_stats['total_feedback']
         
         if accuracy >= 90:
-            summary['insights'].append(
-                f"📈 Accuracy is excellent at {accuracy:.1f}%"
-            )
+            summary['insights'].append(ACCURACY_EXCELLENT % accuracy)
         elif accuracy >= 75:
-            summary['insights'].append(
-                f"✓ Accuracy is good at {accuracy:.1f}%"
-            )
+            summary['insights'].append(ACCURACY_GOOD % accuracy)
         elif accuracy >= 60:
-            summary['insights'].append(
-                f"⚠️  Accuracy needs improvement: {accuracy:.1f}%"
-            )
+            summary['insights'].append(ACCURACY_FAIR % accuracy)
         else:
-            summary['insights'].append(
-                f"🔴 Accuracy is low: {accuracy:.1f}% - review patterns"
-            )
+            summary['insights'].append(ACCURACY_LOW % accuracy)
             summary['recommendations'].append("Review weak patterns and retrain")
     
     # Maintenance insights
@@ -123,28 +181,24 @@ def generate_weekly_summary(
         summary['stats']['maintenance_operations'] = len(recent_ops)
         
         # Count retrains
-        retrains = [op for op in recent_ops if op['type'] == 'retrain']
-        if len(retrains) > 2:
-            summary['insights'].append(
-                f"⚙️  Model retrained {len(retrains)} times this week - possible instability"
-            )
+        op_counts = Counter(op['type'] for op in recent_ops)
+        retrains = op_counts['retrain']
+        if retrains > 2:
+            summary['insights'].append(RETRAINS_FREQUENT % retrains)
             summary['recommendations'].append("Check for conflicting patterns")
-        elif len(retrains) == 1:
+        elif retrains == 1:
             summary['insights'].append(
                 "🔄 Model retrained once this week - keeping fresh"
             )
     
     # Database insights
-    if db.database_exists(db_path):
-        db_stats = db.get_database_stats(db_path)
+    if context.db_exists:
+        db_stats = context.db_stats
         summary['stats']['total_files'] = db_stats['total_files']
         summary['stats']['total_operations'] = db_stats['total_operations']
         
-        db_diag = diagnostic.diagnose_database(db_path)
-        if db_diag['size_mb'] > 50:
-            summary['insights'].append(
-                f"💾 Database is getting large ({db_diag['size_mb']:.1f} MB)"
-            )
+        if context.db_size_mb > 50:
+            summary['insights'].append(DATABASE_LARGE % context.db_size_mb)
             summary['recommendations'].append("Run --optimize to clean up database")
     
     return summary
@@ -152,7 +206,8 @@ def generate_weekly_summary(
 
 def generate_cumulative_summary(
     db_path: str = 'file_organizer.db',
-    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR
+    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR,
+    context: Optional[SummaryContext] = None
 ) -> Dict[str, Any]:
     """
     Generate cumulative all-time summary.
@@ -160,6 +215,7 @@ def generate_cumulative_summary(
     Args:
         db_path: Database path
         learning_dir: Learning data directory
+        context: Shared inputs to reuse (built from the paths if omitted)
         
     Returns:
         Summary dictionary with insights
@@ -172,8 +228,11 @@ def generate_cumulative_summary(
         'milestones': []
     }
     
+    if context is None:
+        context = SummaryContext(db_path, learning_dir)
+    
     # Learning stats
-    model = learn.load_model(learning_dir)
+    model = context.model
     if model:
         summary['stats']['total_samples'] = model.total_samples
         summary['stats']['file_types_learned'] = len(model.type_to_folder)
@@ -188,7 +247,7 @@ def generate_cumulative_summary(
             summary['milestones'].append("✨ 100+ samples learned")
     
     # Feedback stats
-    fb_stats = feedback.get_feedback_stats(learning_dir)
+    fb_stats = context.feedback_stats
     if fb_stats['total_feedback'] > 0:
         summary['stats']['total_feedback'] = fb_stats['total_feedback']
         summary['stats']['overall_accuracy'] = fb_stats['overall_accuracy']
@@ -197,15 +256,15 @@ def generate_cumulative_summary(
             summary['milestones'].append("📊 100+ feedback events recorded")
     
     # Maintenance stats
-    mlog = maintenance.MaintenanceLog(learning_dir)
+    mlog = context.maintenance_log
     maint_stats = mlog.log['stats']
     summary['stats']['total_retrains'] = maint_stats['total_retrains']
     summary['stats']['total_optimizations'] = maint_stats['total_optimizations']
     summary['stats']['patterns_pruned'] = maint_stats['patterns_pruned']
     
     # Database stats
-    if db.database_exists(db_path):
-        db_stats = db.get_database_stats(db_path)
+    if context.db_exists:
+        db_stats = context.db_stats
         summary['stats']['total_files_organized'] = db_stats['total_files']
         summary['stats']['total_operations'] = db_stats['total_operations']
         
@@ -220,7 +279,8 @@ def generate_cumulative_summary(
 
 def detect_trends(
     db_path: str = 'file_organizer.db',
-    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR
+    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR,
+    context: Optional[SummaryContext] = None
 ) -> Dict[str, Any]:
     """
     Detect trends in model performance and accuracy.
@@ -228,6 +288,7 @@ def detect_trends(
     Args:
         db_path: Database path
         learning_dir: Learning data directory
+        context: Shared inputs to reuse (built from the paths if omitted)
         
     Returns:
         Trends dictionary
@@ -239,9 +300,12 @@ def detect_trends(
         'insights': []
     }
     
+    if context is None:
+        context = SummaryContext(db_path, learning_dir)
+    
     # Get current metrics
-    model_diag = diagnostic.diagnose_model_confidence(learning_dir)
-    fb_diag = diagnostic.diagnose_feedback_accuracy(learning_dir)
+    model_diag = diagnostic.diagnose_model_confidence(learning_dir, context.model)
+    fb_diag = diagnostic.diagnose_feedback_accuracy(learning_dir, context.feedback_stats)
     
     # Analyze confidence trend
     if model_diag['status'] != 'no_model':
@@ -274,7 +338,8 @@ def detect_trends(
 
 def generate_predictive_insights(
     db_path: str = 'file_organizer.db',
-    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR
+    learning_dir: Path = maintenance.DEFAULT_LEARNING_DIR,
+    context: Optional[SummaryContext] = None
 ) -> List[str]:
     """
     Generate predictive insights about future actions.
@@ -282,11 +347,14 @@ def generate_predictive_insights(
     Args:
         db_path: Database path
         learning_dir: Learning data directory
+        context: Shared inputs to reuse (built from the paths if omitted)
         
     Returns:
         List of predictive insights
     """
     insights = []
+    if context is None:
+        context = SummaryContext(db_path, learning_dir)
     
     # Check if maintenance will be needed soon
     health = maintenance.check_model_health(db_path, learning_dir)
@@ -297,18 +365,14 @@ def generate_predictive_insights(
         insights.append("🔮 Prediction: Immediate maintenance recommended")
     
     # Check database size trend
-    if db.database_exists(db_path):
-        db_diag = diagnostic.diagnose_database(db_path)
-        if db_diag['size_mb'] > 40:
+    if context.db_exists:
+        if context.db_size_mb > 40:
             insights.append("🔮 Prediction: Database will need optimization soon")
     
     # Check pattern growth
-    model = learn.load_model(learning_dir)
+    model = context.model
     if model:
-        weak_patterns = sum(
-            1 for _, dests in model.type_to_folder.items()
-            if sum(dests.values()) < 5
-        )
+        weak_patterns = learn.get_confidence_aggregates(model)['weak_patterns']
         
         if weak_patterns > 5:
             insights.append(f"🔮 Prediction: {weak_patterns} weak patterns may be pruned next optimization")
@@ -326,41 +390,47 @@ def print_weekly_insights(
 ):
     """Print formatted weekly insights."""
     logger = logging.getLogger('FileOrganizer')
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     summary = generate_weekly_summary(db_path, learning_dir)
     
-    logger.info("=" * 70)
-    logger.info("📊 WEEKLY PERFORMANCE SUMMARY")
-    logger.info("=" * 70)
-    logger.info(f"Generated: {summary['generated_at'][:10]}")
-    logger.info("")
+    # Emitted as one record rather than one per line
+    lines = []
+    lines.append("=" * 70)
+    lines.append("📊 WEEKLY PERFORMANCE SUMMARY")
+    lines.append("=" * 70)
+    lines.append(f"Generated: {summary['generated_at'][:10]}")
+    lines.append("")
     
     # Show insights
     if summary['insights']:
-        logger.info("Key Insights:")
+        lines.append("Key Insights:")
         for insight in summary['insights']:
-            logger.info(f"  {insight}")
-        logger.info("")
+            lines.append(f"  {insight}")
+        lines.append("")
     
     # Show stats
     if summary['stats']:
-        logger.info("Statistics:")
+        lines.append("Statistics:")
         for key, value in summary['stats'].items():
             key_formatted = key.replace('_', ' ').title()
             if isinstance(value, float):
-                logger.info(f"  {key_formatted}: {value:.1f}")
+                lines.append(f"  {key_formatted}: {value:.1f}")
             else:
-                logger.info(f"  {key_formatted}: {value}")
-        logger.info("")
+                lines.append(f"  {key_formatted}: {value}")
+        lines.append("")
     
     # Show recommendations
     if summary['recommendations']:
-        logger.info("💡 Recommendations:")
+        lines.append("💡 Recommendations:")
         for i, rec in enumerate(summary['recommendations'], 1):
-            logger.info(f"  {i}. {rec}")
-        logger.info("")
+            lines.append(f"  {i}. {rec}")
+        lines.append("")
+    
+    lines.append("=" * 70)
     
-    logger.info("=" * 70)
+    logger.info('\n'.join(lines))
 
 
 def print_cumulative_insights(
@@ -369,33 +439,39 @@ def print_cumulative_insights(
 ):
     """Print formatted cumulative insights."""
     logger = logging.getLogger('FileOrganizer')
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     summary = generate_cumulative_summary(db_path, learning_dir)
     
-    logger.info("=" * 70)
-    logger.info("🏆 CUMULATIVE PERFORMANCE SUMMARY")
-    logger.info("=" * 70)
-    logger.info("")
+    # Emitted as one record rather than one per line
+    lines = []
+    lines.append("=" * 70)
+    lines.append("🏆 CUMULATIVE PERFORMANCE SUMMARY")
+    lines.append("=" * 70)
+    lines.append("")
     
     # Show milestones
     if summary['milestones']:
-        logger.info("Milestones Achieved:")
+        lines.append("Milestones Achieved:")
         for milestone in summary['milestones']:
-            logger.info(f"  {milestone}")
-        logger.info("")
+            lines.append(f"  {milestone}")
+        lines.append("")
     
     # Show stats
     if summary['stats']:
-        logger.info("All-Time Statistics:")
+        lines.append("All-Time Statistics:")
         for key, value in summary['stats'].items():
             key_formatted = key.replace('_', ' ').title()
             if isinstance(value, float):
-                logger.info(f"  {key_formatted}: {value:.1f}")
+                lines.append(f"  {key_formatted}: {value:.1f}")
             else:
-                logger.info(f"  {key_formatted}: {value}")
-        logger.info("")
+                lines.append(f"  {key_formatted}: {value}")
+        lines.append("")
     
-    logger.info("=" * 70)
+    lines.append("=" * 70)
+    
+    logger.info('\n'.join(lines))
 
 
 def print_smart_insights(
@@ -404,47 +480,55 @@ def print_smart_insights(
 ):
     """Print comprehensive smart insights."""
     logger = logging.getLogger('FileOrganizer')
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    # Emitted as one record rather than one per line
+    lines = []
+    lines.append("=" * 70)
+    lines.append("🧠 SMART INSIGHTS & ANALYSIS")
+    lines.append("=" * 70)
+    lines.append("")
     
-    logger.info("=" * 70)
-    logger.info("🧠 SMART INSIGHTS & ANALYSIS")
-    logger.info("=" * 70)
-    logger.info("")
+    context = SummaryContext(db_path, learning_dir)
     
     # Weekly summary
-    weekly = generate_weekly_summary(db_path, learning_dir)
+    weekly = generate_weekly_summary(db_path, learning_dir, context)
     
-    logger.info("📈 This Week:")
+    lines.append("📈 This Week:")
     for insight in weekly['insights']:
-        logger.info(f"  {insight}")
-    logger.info("")
+        lines.append(f"  {insight}")
+    lines.append("")
     
     # Trends
-    trends = detect_trends(db_path, learning_dir)
+    trends = detect_trends(db_path, learning_dir, context)
     
-    logger.info("📊 Trends:")
-    logger.info(f"  Confidence: {trends['confidence_trend']}")
-    logger.info(f"  Accuracy: {trends['accuracy_trend']}")
+    lines.append("📊 Trends:")
+    lines.append(f"  Confidence: {trends['confidence_trend']}")
+    lines.append(f"  Accuracy: {trends['accuracy_trend']}")
     for insight in trends['insights']:
-        logger.info(f"  {insight}")
-    logger.info("")
+        lines.append(f"  {insight}")
+    lines.append("")
     
     # Predictions
-    predictions = generate_predictive_insights(db_path, learning_dir)
+    predictions = generate_predictive_insights(db_path, learning_dir, context)
     
     if predictions:
-        logger.info("🔮 Predictions:")
+        lines.append("🔮 Predictions:")
         for pred in predictions:
-            logger.info(f"  {pred}")
-        logger.info("")
+            lines.append(f"  {pred}")
+        lines.append("")
     
     # Recommendations
     if weekly['recommendations']:
-        logger.info("💡 Action Items:")
+        lines.append("💡 Action Items:")
         for i, rec in enumerate(weekly['recommendations'], 1):
-            logger.info(f"  {i}. {rec}")
-        logger.info("")
+            lines.append(f"  {i}. {rec}")
+        lines.append("")
     
-    logger.info("=" * 70)
+    lines.append("=" * 70)
+    
+    logger.info('\n'.join(lines))
 
 
 def generate_insight_report(
@@ -457,10 +541,12 @@ def generate_insight_report(
     Returns:
         Complete insight report
     """
+    context = SummaryContext(db_path, learning_dir)
+    
     return {
         'generated_at': datetime.now().isoformat(),
-        'weekly_summary': generate_weekly_summary(db_path, learning_dir),
-        'cumulative_summary': generate_cumulative_summary(db_path, learning_dir),
-        'trends': detect_trends(db_path, learning_dir),
-        'predictions': generate_predictive_insights(db_path, learning_dir)
+        'weekly_summary': generate_weekly_summary(db_path, learning_dir, context),
+        'cumulative_summary': generate_cumulative_summary(db_path, learning_dir, context),
+        'trends': detect_trends(db_path, learning_dir, context),
+        'predictions': generate_predictive_insights(db_path, learning_dir, context)
     }
@@ -12,13 +12,17 @@ This module provides adaptive learning capabilities:
 - 100% offline operation
 """
 
+import os
+import re
 import json
 import pickle
+import zlib
 import logging
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from collections import defaultdict, Counter
 from datetime import datetime
+from functools import lru_cache
 
 import database_manager as db
 
@@ -31,6 +35,10 @@ DEFAULT_LEARNING_DIR = Path('learning_data')
 PREFERENCES_FILE = 'preferences.json'
 MODEL_FILE = 'model.pkl'
 
+# zlib level for the saved model. The snapshot repeats the same destination
+# strings over and over, so even a fast level shrinks it several times over.
+MODEL_COMPRESSION_LEVEL = 3
+
 # Confidence thresholds
 CONFIDENCE_HIGH = 0.8    # >80% = auto-organize safe
 CONFIDENCE_MEDIUM = 0.5  # 50-80% = suggest
@@ -39,6 +47,9 @@ CONFIDENCE_LOW = 0.5     # <50% = ask user
 # Minimum samples required to make predictions
 MIN_SAMPLES_FOR_PREDICTION = 3
 
+# Distinct (type, extension, filename pattern) predictions memoized per model
+PREDICTION_CACHE_SIZE = 4096
+
 # Phase 5: Learning parameters
 DECAY_FACTOR = 0.95           # Exponential decay for old patterns
 NEW_WEIGHT_FACTOR = 0.05      # Weight for new observations
@@ -80,15 +91,101 @@ class FileOrganizationModel:
         self.total_samples = 0
         self.last_trained = None
         self.version = '4.0'
+        
+        # Precomputed (top_destination, top_count, total) and the three
+        # leading destinations per key, built by _finalize() and dropped
+        # whenever the counters change
+        self.type_top = None
+        self.ext_top = None
+        self.name_top = None
+        self.type_leaders = None
+        self.ext_leaders = None
+        self.name_leaders = None
+        
+        # Memoized predictions keyed by (file_type, file_ext, name_pattern),
+        # valid for as long as the summaries above
+        self.prediction_cache = None
     
     def __repr__(self):
         return f"<FileOrganizationModel samples={self.total_samples} trained={self.last_trained}>"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to plain dicts of counts (the on-disk snapshot format)."""
+        return {
+            'version': self.version,
+            'total_samples': self.total_samples,
+            'last_trained': self.last_trained,
+            'type_to_folder': {k: dict(v) for k, v in self.type_to_folder.items()},
+            'ext_to_folder': {k: dict(v) for k, v in self.ext_to_folder.items()},
+            'name_pattern_to_folder': {k: dict(v) for k, v in self.name_pattern_to_folder.items()},
+            'temporal_patterns': {
+                year: {ftype: dict(dests) for ftype, dests in types.items()}
+                for year, types in self.temporal_patterns.items()
+            }
+        }
+    
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'FileOrganizationModel':
+        """Create from a snapshot produced by to_dict()."""
+        model = FileOrganizationModel()
+        for name in ('type_to_folder', 'ext_to_folder', 'name_pattern_to_folder'):
+            table = getattr(model, name)
+            for key, dests in data.get(name, {}).items():
+                table[key] = Counter(dests)
+        for year, types in data.get('temporal_patterns', {}).items():
+            for ftype, dests in types.items():
+                model.temporal_patterns[year][ftype] = Counter(dests)
+        model.total_samples = data.get('total_samples', 0)
+        model.last_trained = data.get('last_trained')
+        model.version = data.get('version', model.version)
+        return model
+    
+    def _finalize(self):
+        """Precompute the leading destinations and total count for every pattern."""
+        def summarize(table):
+            top, leaders = {}, {}
+            for key, counts in table.items():
+                best = counts.most_common(3)
+                leaders[key] = dict(best)
+                if best:
+                    top[key] = best[0] + (sum(counts.values()),)
+            return top, leaders
+        
+        self.type_top, self.type_leaders = summarize(self.type_to_folder)
+        self.ext_top, self.ext_leaders = summarize(self.ext_to_folder)
+        self.name_top, self.name_leaders = summarize(self.name_pattern_to_folder)
+        self.prediction_cache = {}
+    
+    def _ensure_finalized(self):
+        """Build the summaries if missing (changed model or legacy pickle)."""
+        if getattr(self, 'type_top', None) is None:
+            self._finalize()
+    
+    def _invalidate(self):
+        """Drop the precomputed summaries after the counters were modified."""
+        self.type_top = None
+        self.ext_top = None
+        self.name_top = None
+        self.type_leaders = None
+        self.ext_leaders = None
+        self.name_leaders = None
+        self.prediction_cache = None
 
 
 # ============================================================================
 # PATTERN EXTRACTION
 # ============================================================================
 
+# First run of characters that are not separators ('_', '-', whitespace)
+_FIRST_TOKEN = re.compile(r'[^_\-\s]+')
+
+# Entries kept by the pattern extractor caches. Both extractors are pure
+# and see heavily repeated inputs (recurring names, shared destinations)
+# during training and batch prediction.
+PATTERN_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
 def extract_filename_pattern(filename: str) -> str:
     """
     Extract pattern from filename for learning.
@@ -104,19 +201,23 @@ def extract_filename_pattern(filename: str) -> str:
     Returns:
         Pattern string (first word or prefix)
     """
-    # Remove extension
-    name_no_ext = Path(filename).stem
-    
-    # Split by common separators
-    parts = name_no_ext.replace('_', ' ').replace('-', ' ').split()
-    
-    if parts:
+    # Remove extension (same rule as Path.stem, without building a Path)
+    dot = filename.rfind('.')
+    if 0 < dot < len(filename) - 1:
+        filename = filename[:dot]
+    elif filename == '.':
+        return 'unknown'
+    
+    # First token between common separators, found in a single regex scan
+    match = _FIRST_TOKEN.search(filename)
+    if match:
         # Return first meaningful part (lowercase for consistency)
-        return parts[0].lower()
+        return match.group().lower()
     
     return 'unknown'
 
 
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
 def extract_destination_pattern(path: str) -> str:
     """
     Extract meaningful destination pattern from full path.
@@ -131,29 +232,86 @@ def extract_destination_pattern(path: str) -> str:
     Returns:
         Destination category or folder name
     """
-    path_obj = Path(path)
-    parts = path_obj.parts
+    # Split into components with plain string operations, dropping empty
+    # and '.' components the same way Path.parts does
+    if os.altsep:
+        path = path.replace(os.altsep, os.sep)
+    parts = [part for part in path.split(os.sep) if part and part != '.']
     
     # Look for 'organized' in path and get the next folder
     try:
-        if 'organized' in parts:
-            idx = parts.index('organized')
-            if idx + 1 < len(parts):
-                return parts[idx + 1]
-    except (ValueError, IndexError):
+        idx = parts.index('organized')
+        if idx + 1 < len(parts):
+            return parts[idx + 1]
+    except ValueError:
         pass
     
     # Fallback: use parent folder name
-    if path_obj.parent.name:
-        return path_obj.parent.name
+    if len(parts) >= 2:
+        return parts[-2]
     
     return 'unknown'
 
 
+def pattern_cache_info() -> Dict[str, Any]:
+    """
+    Hit/miss statistics of the pattern extractor caches.
+    
+    Returns:
+        Dictionary mapping each extractor name to its lru_cache CacheInfo
+    """
+    return {
+        'filename_pattern': extract_filename_pattern.cache_info(),
+        'destination_pattern': extract_destination_pattern.cache_info()
+    }
+
+
 # ============================================================================
 # TRAINING & LEARNING
 # ============================================================================
 
+# Rows fetched per fetchmany() call while reading the history
+LEARN_FETCH_SIZE = 1024
+
+# History is aggregated inside SQLite: the pattern extractors are registered
+# as SQL functions and rows are grouped by everything the model learns from,
+# so Python only sees one row per distinct combination together with its
+# count. Only the counts matter, so groups come back in no particular order;
+# equal counts in most_common() are therefore not broken by history order.
+SQL_LEARN_GROUPS = """
+SELECT file_type,
+       fg_extension(file_name) AS file_ext,
+       fg_name_pattern(file_name) AS name_pattern,
+       fg_destination(new_path) AS destination,
+       CASE WHEN created_at GLOB '[0-9][0-9][0-9][0-9]-*'
+            THEN CAST(substr(created_at, 1, 4) AS INTEGER)
+       END AS year,
+       COUNT(*) AS samples
+FROM files
+GROUP BY 1, 2, 3, 4, 5
+"""
+
+
+def _file_extension(file_name: str) -> str:
+    """
+    Lower-cased extension of a file name (SQL function fg_extension).
+    
+    Same result as Path(file_name).suffix.lower() for bare file names ('' for
+    dotfiles and names ending in '.'), without building a Path per row.
+    """
+    head, _, tail = file_name.rpartition('.')
+    if head and tail:
+        return '.' + tail.lower()
+    return ''
+
+
+def _register_learning_functions(conn) -> None:
+    """Make the pattern extractors callable from SQL on this connection."""
+    conn.create_function('fg_extension', 1, _file_extension, deterministic=True)
+    conn.create_function('fg_name_pattern', 1, extract_filename_pattern, deterministic=True)
+    conn.create_function('fg_destination', 1, extract_destination_pattern, deterministic=True)
+
+
 def learn_from_history(db_path: str = 'file_organizer.db') -> FileOrganizationModel:
     """
     Learn user organization patterns from database history.
@@ -164,6 +322,10 @@ def learn_from_history(db_path: str = 'file_organizer.db') -> FileOrganizationMo
     - Filename pattern associations
     - Temporal organization trends
     
+    History rows are read in no guaranteed order; the model only keeps
+    counts, so the order does not affect what is learned beyond how ties
+    between equally frequent destinations are broken.
+    
     Args:
         db_path: Path to SQLite database
         
@@ -185,50 +347,68 @@ def learn_from_history(db_path: str = 'file_organizer.db') -> FileOrganizationMo
     logger.info("Learning from organization history...")
     
     try:
-        with db.get_db_connection(db_path) as conn:
+        with db.get_read_connection(db_path) as conn:
+            _register_learning_functions(conn)
             cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples, unpacked below
+            cursor.arraysize = LEARN_FETCH_SIZE
             
-            # Get all file records
-            cursor.execute("""
-                SELECT file_name, file_type, new_path, created_at
-                FROM files
-                ORDER BY operation_date ASC
-            """)
+            # One row per distinct (type, extension, pattern, destination,
+            # year) combination, with the number of files sharing it
+            cursor.execute(SQL_LEARN_GROUPS)
             
-            records = cursor.fetchall()
+            # Counts are accumulated in plain dicts with get() (no
+            # defaultdict/Counter hooks per row) and wrapped afterwards
+            type_counts = {}
+            ext_counts = {}
+            name_counts = {}
+            year_counts = {}
             
-            for record in records:
-                file_name = record['file_name']
-                file_type = record['file_type']
-                new_path = record['new_path']
-                created_at = record['created_at']
-                
-                # Extract patterns
-                file_ext = Path(file_name).suffix.lower()
-                name_pattern = extract_filename_pattern(file_name)
-                destination = extract_destination_pattern(new_path)
-                
-                # Learn type -> folder association
-                model.type_to_folder[file_type][destination] += 1
-                
-                # Learn extension -> folder association
-                if file_ext:
-                    model.ext_to_folder[file_ext][destination] += 1
-                
-                # Learn filename pattern -> folder association
-                model.name_pattern_to_folder[name_pattern][destination] += 1
-                
-                # Learn temporal patterns (year)
-                try:
-                    created_date = datetime.fromisoformat(created_at)
-                    year = created_date.year
-                    model.temporal_patterns[year][file_type][destination] += 1
-                except Exception:
-                    pass
-                
-                model.total_samples += 1
+            # Stream the groups rather than materializing them all at once
+            while records := cursor.fetchmany():
+                for file_type, file_ext, name_pattern, destination, year, samples in records:
+                    # Learn type -> folder association
+                    dests = type_counts.get(file_type)
+                    if dests is None:
+                        dests = type_counts[file_type] = {}
+                    dests[destination] = dests.get(destination, 0) + samples
+                    
+                    # Learn extension -> folder association
+                    if file_ext:
+                        dests = ext_counts.get(file_ext)
+                        if dests is None:
+                            dests = ext_counts[file_ext] = {}
+                        dests[destination] = dests.get(destination, 0) + samples
+                    
+                    # Learn filename pattern -> folder association
+                    dests = name_counts.get(name_pattern)
+                    if dests is None:
+                        dests = name_counts[name_pattern] = {}
+                    dests[destination] = dests.get(destination, 0) + samples
+                    
+                    # Learn temporal patterns (year)
+                    if year is not None:
+                        types = year_counts.get(year)
+                        if types is None:
+                            types = year_counts[year] = {}
+                        dests = types.get(file_type)
+                        if dests is None:
+                            dests = types[file_type] = {}
+                        dests[destination] = dests.get(destination, 0) + samples
+                    
+                    model.total_samples += samples
+            
+            for table, counts in ((model.type_to_folder, type_counts),
+                                  (model.ext_to_folder, ext_counts),
+                                  (model.name_pattern_to_folder, name_counts)):
+                for key, dests in counts.items():
+                    table[key] = Counter(dests)
+            for year, types in year_counts.items():
+                for file_type, dests in types.items():
+                    model.temporal_patterns[year][file_type] = Counter(dests)
             
             model.last_trained = datetime.now().isoformat()
+            model._finalize()
             
             logger.info(f"✓ Learned from {model.total_samples} files")
             logger.info(f"  • {len(model.type_to_folder)} file types")
@@ -278,83 +458,101 @@ def predict_destination(
     file_type = file_metadata.get('file_type', '')
     file_ext = file_metadata.get('file_ext', '').lower()
     
+    return _predict_for_key(model, file_type, file_ext, extract_filename_pattern(file_name))
+
+
+def _predict_for_key(
+    model: FileOrganizationModel,
+    file_type: str,
+    file_ext: str,
+    name_pattern: str
+) -> Optional[Tuple[str, float, str]]:
+    """
+    Prediction for one (type, extension, filename pattern) combination.
+    
+    Every file sharing the combination gets the same vote, so results are
+    memoized on the model until its counters change.
+    """
+    model._ensure_finalized()
+    cache = model.prediction_cache
+    key = (file_type, file_ext, name_pattern)
+    
+    if key in cache:
+        return cache[key]
+    
+    if len(cache) >= PREDICTION_CACHE_SIZE:
+        cache.clear()
+    
+    cache[key] = prediction = _vote(model, file_type, file_ext, name_pattern)
+    return prediction
+
+
+def _vote(
+    model: FileOrganizationModel,
+    file_type: str,
+    file_ext: str,
+    name_pattern: str
+) -> Optional[Tuple[str, float, str]]:
+    """Combine the type, extension and filename-pattern strategies."""
+    # (destination, confidence, reason, weight) per matching strategy
     predictions = []
     
     # Strategy 1: File type frequency
-    if file_type in model.type_to_folder:
-        type_counts = model.type_to_folder[file_type]
-        if type_counts:
-            most_common_dest, count = type_counts.most_common(1)[0]
-            total = sum(type_counts.values())
-            confidence = count / total
-            
-            predictions.append({
-                'destination': most_common_dest,
-                'confidence': confidence,
-                'reason': f"Based on {count}/{total} prior {file_type} files moved to '{most_common_dest}'",
-                'weight': 0.5  # Type matching is moderately strong
-            })
+    top = model.type_top.get(file_type)
+    if top:
+        most_common_dest, count, total = top
+        confidence = count / total
+        
+        reason = f"Based on {count}/{total} prior {file_type} files moved to '{most_common_dest}'"
+        predictions.append((most_common_dest, confidence, reason, 0.5))  # Type matching is moderately strong
     
     # Strategy 2: File extension frequency
-    if file_ext and file_ext in model.ext_to_folder:
-        ext_counts = model.ext_to_folder[file_ext]
-        if ext_counts:
-            most_common_dest, count = ext_counts.most_common(1)[0]
-            total = sum(ext_counts.values())
-            confidence = count / total
-            
-            predictions.append({
-                'destination': most_common_dest,
-                'confidence': confidence,
-                'reason': f"Based on {count}/{total} prior {file_ext} files moved to '{most_common_dest}'",
-                'weight': 0.3  # Extension is weaker signal than type
-            })
+    top = model.ext_top.get(file_ext) if file_ext else None
+    if top:
+        most_common_dest, count, total = top
+        confidence = count / total
+        
+        reason = f"Based on {count}/{total} prior {file_ext} files moved to '{most_common_dest}'"
+        predictions.append((most_common_dest, confidence, reason, 0.3))  # Extension is weaker signal than type
     
     # Strategy 3: Filename pattern
-    name_pattern = extract_filename_pattern(file_name)
-    if name_pattern in model.name_pattern_to_folder:
-        pattern_counts = model.name_pattern_to_folder[name_pattern]
-        if pattern_counts:
-            most_common_dest, count = pattern_counts.most_common(1)[0]
-            total = sum(pattern_counts.values())
-            confidence = count / total
-            
-            predictions.append({
-                'destination': most_common_dest,
-                'confidence': confidence,
-                'reason': f"Files starting with '{name_pattern}' usually go to '{most_common_dest}' ({count}/{total})",
-                'weight': 0.2  # Filename pattern is weakest but can be useful
-            })
+    top = model.name_top.get(name_pattern)
+    if top:
+        most_common_dest, count, total = top
+        confidence = count / total
+        
+        reason = f"Files starting with '{name_pattern}' usually go to '{most_common_dest}' ({count}/{total})"
+        predictions.append((most_common_dest, confidence, reason, 0.2))  # Filename pattern is weakest but can be useful
     
     # No predictions available
     if not predictions:
         return None
     
-    # Weighted voting: combine predictions
-    destination_scores = defaultdict(lambda: {'total_confidence': 0, 'total_weight': 0, 'reasons': []})
+    # Weighted voting: combine predictions. Per destination keep
+    # [weighted confidence sum, weight sum] and the supporting reasons.
+    scores = {}
+    reasons = {}
     
-    for pred in predictions:
-        dest = pred['destination']
-        weighted_conf = pred['confidence'] * pred['weight']
-        
-        destination_scores[dest]['total_confidence'] += weighted_conf
-        destination_scores[dest]['total_weight'] += pred['weight']
-        destination_scores[dest]['reasons'].append(pred['reason'])
+    for dest, confidence, reason, weight in predictions:
+        score = scores.get(dest)
+        if score is None:
+            score = scores[dest] = [0.0, 0.0]
+            reasons[dest] = []
+        score[0] += confidence * weight
+        score[1] += weight
+        reasons[dest].append(reason)
     
     # Find best destination
-    best_dest = max(
-        destination_scores.items(),
-        key=lambda x: x[1]['total_confidence']
+    destination, (total_confidence, total_weight) = max(
+        scores.items(),
+        key=lambda x: x[1][0]
     )
     
-    destination = best_dest[0]
-    score_data = best_dest[1]
-    
     # Normalize confidence
-    final_confidence = score_data['total_confidence'] / score_data['total_weight']
+    final_confidence = total_confidence / total_weight
     
     # Combine reasons
-    reason = '; '.join(score_data['reasons'])
+    reason = '; '.join(reasons[destination])
     
     return destination, final_confidence, reason
 
@@ -373,10 +571,21 @@ def predict_batch(
     Returns:
         List of predictions with confidence and reasons
     """
+    # Column layout: a prediction depends only on the (type, extension,
+    # filename pattern) triple, so each distinct triple is voted on once
+    names = [f.get('file_name', '') for f in files]
+    types = [f.get('file_type', '') for f in files]
+    exts = [f.get('file_ext', '').lower() for f in files]
+    patterns = list(map(extract_filename_pattern, names))
+    
+    trained = model.total_samples >= MIN_SAMPLES_FOR_PREDICTION
     predictions = []
     
-    for file_meta in files:
-        prediction = predict_destination(file_meta, model)
+    for file_meta, file_type, file_ext, name_pattern in zip(files, types, exts, patterns):
+        if trained:
+            prediction = _predict_for_key(model, file_type, file_ext, name_pattern)
+        else:
+            prediction = None
         
         if prediction:
             dest, conf, reason = prediction
@@ -449,8 +658,13 @@ def save_model(model: FileOrganizationModel, learning_dir: Path = DEFAULT_LEARNI
         
         model_path = learning_dir / MODEL_FILE
         
+        # Pickle a snapshot of builtin dicts and ints rather than the object
+        # graph itself: it skips the per-Counter/defaultdict reduce calls on
+        # save and the class reconstruction on load, and is smaller on disk.
+        # The pickle is then zlib-compressed and written in one call.
+        data = pickle.dumps(model.to_dict(), protocol=pickle.HIGHEST_PROTOCOL)
         with open(model_path, 'wb') as f:
-            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.write(zlib.compress(data, MODEL_COMPRESSION_LEVEL))
         
         logger.info(f"✓ Model saved: {model_path}")
         logger.info(f"  • {model.total_samples} training samples")
@@ -486,7 +700,17 @@ def load_model(learning_dir: Path = DEFAULT_LEARNING_DIR) -> Optional[FileOrgani
     
     try:
         with open(model_path, 'rb') as f:
-            model = pickle.load(f)
+            data = f.read()
+        
+        # Older versions wrote the pickle uncompressed (it starts with the
+        # PROTO opcode, which is never a valid zlib header byte)
+        if not data.startswith(pickle.PROTO):
+            data = zlib.decompress(data)
+        model = pickle.loads(data)
+        
+        # Models saved by older versions are pickled objects, not snapshots
+        if isinstance(model, dict):
+            model = FileOrganizationModel.from_dict(model)
         
         logger.info(f"✓ Model loaded: {model_path}")
         logger.info(f"  • {model.total_samples} training samples")
@@ -502,29 +726,22 @@ def load_model(learning_dir: Path = DEFAULT_LEARNING_DIR) -> Optional[FileOrgani
 def save_preferences_json(model: FileOrganizationModel, learning_dir: Path) -> bool:
     """Save human-readable preferences file."""
     try:
+        model._ensure_finalized()
         prefs = {
             'metadata': {
                 'version': model.version,
                 'total_samples': model.total_samples,
                 'last_trained': model.last_trained
             },
-            'type_patterns': {
-                file_type: dict(folders.most_common(3))
-                for file_type, folders in model.type_to_folder.items()
-            },
-            'extension_patterns': {
-                ext: dict(folders.most_common(3))
-                for ext, folders in model.ext_to_folder.items()
-            },
-            'name_patterns': {
-                pattern: dict(folders.most_common(3))
-                for pattern, folders in model.name_pattern_to_folder.items()
-            }
+            'type_patterns': model.type_leaders,
+            'extension_patterns': model.ext_leaders,
+            'name_patterns': model.name_leaders
         }
         
+        # Encode in memory and write once; json.dump() writes chunk by chunk
         prefs_path = learning_dir / PREFERENCES_FILE
         with open(prefs_path, 'w', encoding='utf-8') as f:
-            json.dump(prefs, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(prefs, indent=2, ensure_ascii=False))
         
         return True
     
@@ -639,9 +856,10 @@ def update_model_incremental(
         
         # Update sample count
         model.total_samples += 1
+        model._invalidate()
         model.last_trained = datetime.now().isoformat()
         
-        logger.info(f"[LEARNING] Updated model: {file_type} → {destination}")
+        logger.info("[LEARNING] Updated model: %s → %s", file_type, destination)
         
         # Check if should sync to disk
         if _should_sync(learning_dir):
@@ -685,6 +903,8 @@ def _apply_decay_to_model(model: FileOrganizationModel, decay_factor: float = DE
             model.name_pattern_to_folder[pattern][dest] = int(
                 destinations[dest] * decay_factor
             )
+    
+    model._invalidate()
 
 
 def _should_sync(learning_dir: Path) -> bool:
@@ -770,6 +990,45 @@ def get_learning_stats(model: FileOrganizationModel) -> Dict[str, Any]:
     }
 
 
+def get_confidence_aggregates(
+    model: FileOrganizationModel,
+    weak_threshold: int = 5
+) -> Dict[str, Any]:
+    """
+    Aggregate per-type confidence figures in a single pass over the model.
+    
+    A type's confidence is the share of its samples that went to its most
+    common destination; types with fewer than weak_threshold samples count
+    as weak patterns.
+    
+    Args:
+        model: Trained model
+        weak_threshold: Sample count below which a pattern is weak
+        
+    Returns:
+        Dictionary with avg_confidence (percent, None without patterns),
+        total_patterns, total_samples and weak_patterns
+    """
+    confidence_sum = 0.0
+    total_patterns = 0
+    weak_patterns = 0
+    
+    for destinations in model.type_to_folder.values():
+        total = sum(destinations.values())
+        if total < weak_threshold:
+            weak_patterns += 1
+        if total > 0:
+            confidence_sum += max(destinations.values()) / total * 100
+            total_patterns += 1
+    
+    return {
+        'avg_confidence': confidence_sum / total_patterns if total_patterns else None,
+        'total_patterns': total_patterns,
+        'total_samples': model.total_samples,
+        'weak_patterns': weak_patterns
+    }
+
+
 def print_learning_summary(model: FileOrganizationModel):
     """
     Print human-readable summary of learned patterns.
@@ -778,21 +1037,29 @@ def print_learning_summary(model: FileOrganizationModel):
         model: Trained model
     """
     logger = logging.getLogger('FileOrganizer')
-    
-    logger.info("=" * 70)
-    logger.info("LEARNING SUMMARY")
-    logger.info("=" * 70)
-    logger.info(f"Training samples: {model.total_samples}")
-    logger.info(f"Last trained: {model.last_trained}")
-    logger.info("")
-    
-    logger.info("📁 File Type Patterns:")
-    for file_type, folders in list(model.type_to_folder.items())[:5]:
-        if folders:
-            dest, count = folders.most_common(1)[0]
-            total = sum(folders.values())
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    model._ensure_finalized()
+    
+    # Emitted as one record rather than one per line
+    lines = []
+    lines.append("=" * 70)
+    lines.append("LEARNING SUMMARY")
+    lines.append("=" * 70)
+    lines.append(f"Training samples: {model.total_samples}")
+    lines.append(f"Last trained: {model.last_trained}")
+    lines.append("")
+    
+    lines.append("📁 File Type Patterns:")
+    for file_type in list(model.type_to_folder)[:5]:
+        top = model.type_top.get(file_type)
+        if top:
+            dest, count, total = top
             pct = (count / total * 100) if total > 0 else 0
-            logger.info(f"  • {file_type:15s} → {dest:20s} ({count}/{total} = {pct:.0f}%)")
+            lines.append(f"  • {file_type:15s} → {dest:20s} ({count}/{total} = {pct:.0f}%)")
+    
+    lines.append("")
+    lines.append("=" * 70)
     
-    logger.info("")
-    logger.info("=" * 70)
+    logger.info('\n'.join(lines))
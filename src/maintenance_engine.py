@@ -11,6 +11,7 @@ This module provides:
 - Background monitoring and polling
 """
 
+import os
 import json
 import logging
 import sqlite3
@@ -49,6 +50,31 @@ MAX_AUTONOMOUS_OPS = 100         # Safety limit per session
 # MAINTENANCE LOG
 # ============================================================================
 
+# Raw log contents per file path, with the (st_mtime_ns, st_size) they were
+# read at. A MaintenanceLog for an unchanged file skips the disk read; a
+# changed mtime or size forces a fresh one. The size catches rewrites that
+# land within the filesystem's timestamp granularity. The bytes are parsed
+# per instance, so instances never share (and mutate) the same dict.
+_LOG_CACHE: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def _default_log() -> Dict[str, Any]:
+    """Empty maintenance log structure."""
+    return {
+        'version': '6.0',
+        'created_at': datetime.now().isoformat(),
+        'operations': [],
+        'last_maintenance': None,
+        'stats': {
+            'total_retrains': 0,
+            'total_optimizations': 0,
+            'total_cleanups': 0,
+            'patterns_pruned': 0,
+            'feedback_archived': 0
+        }
+    }
+
+
 class MaintenanceLog:
     """Track maintenance operations and history."""
     
@@ -58,33 +84,42 @@ class MaintenanceLog:
         self.log = self._load_log()
     
     def _load_log(self) -> Dict[str, Any]:
-        """Load maintenance log from disk."""
-        if not self.log_path.exists():
-            return {
-                'version': '6.0',
-                'created_at': datetime.now().isoformat(),
-                'operations': [],
-                'last_maintenance': None,
-                'stats': {
-                    'total_retrains': 0,
-                    'total_optimizations': 0,
-                    'total_cleanups': 0,
-                    'patterns_pruned': 0,
-                    'feedback_archived': 0
-                }
-            }
+        """Load maintenance log from disk (or the cache if unchanged)."""
+        key = os.path.abspath(self.log_path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            _LOG_CACHE.pop(key, None)
+            return _default_log()
+        
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = _LOG_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            raw = cached[1]
+        else:
+            try:
+                with open(key, 'rb') as f:
+                    raw = f.read()
+            except OSError:
+                return _default_log()
+            _LOG_CACHE[key] = (signature, raw)
         
         try:
-            with open(self.log_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return json.loads(raw)
         except Exception:
-            return self._load_log()  # Return default if corrupted
+            return _default_log()  # Return default if corrupted
     
     def _save_log(self):
         """Save maintenance log to disk."""
         self.learning_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.log_path, 'w', encoding='utf-8') as f:
-            json.dump(self.log, f, indent=2, ensure_ascii=False)
+        raw = json.dumps(self.log, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(self.log_path, 'wb') as f:
+            f.write(raw)
+        
+        # Keep the cache in step with what was just written
+        key = os.path.abspath(self.log_path)
+        st = os.stat(key)
+        _LOG_CACHE[key] = ((st.st_mtime_ns, st.st_size), raw)
     
     def record_operation(self, operation_type: str, details: Dict[str, Any]):
         """Record a maintenance operation."""
@@ -306,6 +341,7 @@ def prune_weak_patterns(
         logger.info(f"[MAINTENANCE] Pruned weak pattern: ext={ext}")
     
     if pruned_count > 0:
+        model._invalidate()
         learn.save_model(model, learning_dir)
         
         # Log maintenance
@@ -556,7 +592,7 @@ def autonomous_organize_file(
             # Update model incrementally
             learn.update_model_incremental(file_meta, dest_folder, model, learning_dir)
             
-            logger.info(f"[AUTONOMOUS] ✓ {file_name} → {dest_folder} ({confidence*100:.0f}%)")
+            logger.info("[AUTONOMOUS] ✓ %s → %s (%.0f%%)", file_name, dest_folder, confidence * 100)
         
         except Exception as e:
             result['action'] = 'failed'
@@ -195,8 +195,8 @@ def load_preferences(
         return prefs
     
     try:
-        with open(prefs_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(prefs_path, 'rb') as f:
+            data = json.loads(f.read())
         
         return UserPreferences.from_dict(data)
     
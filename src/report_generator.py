@@ -10,12 +10,15 @@ Supports:
 - Statistics and insights
 """
 
+import os
 import json
 import csv
+import time
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from operator import itemgetter
 
 import database_manager as db
 import suggestion_engine as suggest
@@ -25,6 +28,26 @@ import maintenance_engine as maintenance
 import diagnostic_engine as diagnostic
 
 
+# Write buffer for exported report files, so streamed output reaches the
+# OS in large blocks rather than one write per encoded chunk
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Bytes -> MB factor (exact, as 2**20 is a power of two)
+_INV_MB = 1.0 / (1024 * 1024)
+
+# Longest distribution bar (100% scaled to 50 chars); shorter bars are slices
+_FULL_BAR = '█' * 50
+
+# Seconds a diagnostics result is reused while none of its inputs change.
+# Diagnostics load the model and run a database integrity check, so
+# regenerating a report (or a quick summary right after one) should not
+# repeat them.
+DIAGNOSTIC_CACHE_TTL = 60.0
+
+# (db path, learning dir) -> (computed at, inputs signature, result)
+_diagnostic_cache: Dict[Tuple[str, str], Tuple[float, tuple, Dict[str, Any]]] = {}
+
+
 # ============================================================================
 # REPORT GENERATION
 # ============================================================================
@@ -45,13 +68,19 @@ def generate_report_data(db_path: str = 'file_organizer.db') -> Dict[str, Any]:
         logger.error(f"Database not found: {db_path}")
         return {}
     
-    # Get all analyses
-    stats = db.get_database_stats(db_path)
-    distribution = suggest.analyze_file_distribution(db_path)
-    duplicates = suggest.analyze_duplicates(db_path)
-    large_files = suggest.analyze_large_files(db_path, limit=10)
-    temporal = suggest.analyze_temporal_patterns(db_path)
-    operations = suggest.analyze_operations(db_path)
+    # Get all analyses. The query-backed sections run in one read
+    # transaction on the shared connection, so they see the same snapshot
+    # of the database. The block holds the connection lock, so it is kept
+    # to these queries: suggestions load the model and run predictions, and
+    # would hold up every other database user meanwhile.
+    with db.get_read_connection(db_path):
+        stats = db.get_database_stats(db_path)
+        distribution = suggest.analyze_file_distribution(db_path)
+        duplicates = suggest.analyze_duplicates(db_path)
+        large_files = suggest.analyze_large_files(db_path, limit=10)
+        temporal = suggest.analyze_temporal_patterns(db_path)
+        operations = suggest.analyze_operations(db_path)
+    
     suggestions = suggest.generate_suggestions(db_path)
     
     # Phase 5: Get learning and feedback analytics
@@ -92,18 +121,7 @@ def generate_report_data(db_path: str = 'file_organizer.db') -> Dict[str, Any]:
         },
         'temporal_analysis': temporal,
         'operations_history': operations,
-        'suggestions': [
-            {
-                'type': s.type,
-                'priority': s.priority,
-                'description': s.description,
-                'details': s.details,
-                'action': s.action,
-                'confidence': s.confidence,
-                'reason': s.reason
-            }
-            for s in suggestions
-        ],
+        'suggestions': [s.to_dict() for s in suggestions],
         # Phase 5: Learning and feedback insights
         'learning_insights': learning_analytics,
         'feedback_insights': feedback_analytics,
@@ -115,6 +133,26 @@ def generate_report_data(db_path: str = 'file_organizer.db') -> Dict[str, Any]:
     return report
 
 
+def _distribution_rows(report_data: Dict[str, Any]) -> List[Tuple[str, int, float, int]]:
+    """
+    Flatten the distribution into (file_type, count, percentage, bar_length) rows.
+    
+    generate_report builds these once and passes them to both the CSV
+    export and the console summary, so they share one pass over the
+    percentages.
+    
+    Args:
+        report_data: Report data dictionary
+        
+    Returns:
+        List of row tuples; bar_length is the percentage scaled to 50 chars
+    """
+    return [
+        (file_type, data['count'], data['percentage'], int(data['percentage'] * 0.5))
+        for file_type, data in report_data['file_distribution']['percentages'].items()
+    ]
+
+
 # ============================================================================
 # PHASE 5: LEARNING & FEEDBACK ANALYTICS
 # ============================================================================
@@ -138,39 +176,22 @@ def _get_learning_analytics() -> Dict[str, Any]:
         
         stats = learn.get_learning_stats(model)
         
-        # Calculate pattern strengths
+        # Calculate pattern strengths from the model's precomputed
+        # (top destination, count, total) summaries
+        model._ensure_finalized()
         pattern_strengths = []
         
-        # Type patterns
-        for file_type, destinations in model.type_to_folder.items():
-            total_count = sum(destinations.values())
-            most_common = destinations.most_common(1)
-            if most_common:
-                dest, count = most_common[0]
-                confidence = (count / total_count) * 100
+        for prefix, summaries in (('type', model.type_top), ('ext', model.ext_top)):
+            for key, (dest, count, total_count) in summaries.items():
                 pattern_strengths.append({
-                    'pattern': f'type:{file_type}',
+                    'pattern': f'{prefix}:{key}',
                     'destination': dest,
-                    'confidence': confidence,
-                    'sample_count': total_count
-                })
-        
-        # Extension patterns
-        for ext, destinations in model.ext_to_folder.items():
-            total_count = sum(destinations.values())
-            most_common = destinations.most_common(1)
-            if most_common:
-                dest, count = most_common[0]
-                confidence = (count / total_count) * 100
-                pattern_strengths.append({
-                    'pattern': f'ext:{ext}',
-                    'destination': dest,
-                    'confidence': confidence,
+                    'confidence': (count / total_count) * 100,
                     'sample_count': total_count
                 })
         
         # Sort by confidence
-        pattern_strengths.sort(key=lambda x: x['confidence'], reverse=True)
+        pattern_strengths.sort(key=itemgetter('confidence'), reverse=True)
         
         # Calculate average confidence
         avg_confidence = sum(p['confidence'] for p in pattern_strengths) / len(pattern_strengths) if pattern_strengths else 0
@@ -242,24 +263,45 @@ def _get_feedback_analytics() -> Dict[str, Any]:
 # EXPORT FUNCTIONS
 # ============================================================================
 
-def export_to_json(report_data: Dict[str, Any], output_path: str) -> bool:
+def export_to_json(
+    report_data: Dict[str, Any],
+    output_path: str,
+    indent: Optional[int] = 2
+) -> bool:
     """
     Export report data to JSON file.
     
+    Report files are not fsync'd; they can be regenerated from the database.
+    
     Args:
         report_data: Report data dictionary
         output_path: Path to output JSON file
+        indent: Indentation for readable output; None writes compact JSON,
+            which the stdlib encodes in C (about twice as fast on large
+            reports, since indented output goes through the pure-Python
+            encoder)
         
     Returns:
         True if successful, False otherwise
     """
     logger = logging.getLogger('FileOrganizer')
     
+    output_file = Path(output_path)
+    temp_file = output_file.with_name(output_file.name + '.tmp')
+    
     try:
-        output_file = Path(output_path)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        # Indented output is streamed chunk by chunk into a large buffer
+        # instead of being built as one string first. Compact output is
+        # encoded in one shot, the only way the C encoder is used. Either
+        # way it goes to a temporary file, so a failure never leaves a
+        # truncated report behind.
+        with open(temp_file, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            if indent is None:
+                f.write(json.dumps(report_data, ensure_ascii=False))
+            else:
+                encoder = json.JSONEncoder(indent=indent, ensure_ascii=False)
+                f.writelines(encoder.iterencode(report_data))
+        os.replace(temp_file, output_file)
         
         logger.info(f"JSON report exported: {output_file}")
         logger.info(f"File size: {output_file.stat().st_size} bytes")
@@ -267,17 +309,30 @@ def export_to_json(report_data: Dict[str, Any], output_path: str) -> bool:
     
     except Exception as e:
         logger.error(f"Failed to export JSON report: {e}")
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
         return False
 
 
-def export_to_csv(report_data: Dict[str, Any], output_path: str) -> bool:
+def export_to_csv(
+    report_data: Dict[str, Any],
+    output_path: str,
+    distribution_rows: Optional[List[Tuple[str, int, float, int]]] = None
+) -> bool:
     """
     Export report data to CSV file.
     Creates multiple CSV files for different data sections.
     
+    Like the JSON export, the CSV files are not fsync'd; they can be
+    regenerated from the database.
+    
     Args:
         report_data: Report data dictionary
         output_path: Path to output CSV file (base name)
+        distribution_rows: Prebuilt _distribution_rows() of report_data
+            (built here if not given)
         
     Returns:
         True if successful, False otherwise
@@ -289,70 +344,65 @@ def export_to_csv(report_data: Dict[str, Any], output_path: str) -> bool:
         base_name = output_file.stem
         output_dir = output_file.parent
         
+        if distribution_rows is None:
+            distribution_rows = _distribution_rows(report_data)
+        
         # Export summary
         summary_file = output_dir / f"{base_name}_summary.csv"
-        with open(summary_file, 'w', newline='', encoding='utf-8') as f:
+        with open(summary_file, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow(['Metric', 'Value'])
-            for key, value in report_data['summary'].items():
-                writer.writerow([key, value])
+            writer.writerows(report_data['summary'].items())
         logger.info(f"Summary exported: {summary_file}")
         
         # Export file distribution
         dist_file = output_dir / f"{base_name}_distribution.csv"
-        with open(dist_file, 'w', newline='', encoding='utf-8') as f:
+        with open(dist_file, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow(['File Type', 'Count', 'Percentage'])
-            for file_type, data in report_data['file_distribution']['percentages'].items():
-                writer.writerow([
-                    file_type,
-                    data['count'],
-                    f"{data['percentage']}%"
-                ])
+            writer.writerows(
+                (file_type, count, f"{percentage}%")
+                for file_type, count, percentage, _ in distribution_rows
+            )
         logger.info(f"Distribution exported: {dist_file}")
         
         # Export large files
         if report_data['large_files']['top_10']:
             large_file = output_dir / f"{base_name}_large_files.csv"
-            with open(large_file, 'w', newline='', encoding='utf-8') as f:
+            with open(large_file, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 writer.writerow(['File Name', 'Size (MB)', 'Type', 'Path'])
-                for file_info in report_data['large_files']['top_10']:
-                    writer.writerow([
-                        file_info['file_name'],
-                        file_info['file_size_mb'],
-                        file_info['file_type'],
-                        file_info['path']
-                    ])
+                writer.writerows(
+                    (file_info['file_name'], file_info['file_size_mb'],
+                     file_info['file_type'], file_info['path'])
+                    for file_info in report_data['large_files']['top_10']
+                )
             logger.info(f"Large files exported: {large_file}")
         
         # Export duplicates
         if report_data['duplicates']['details']:
             dup_file = output_dir / f"{base_name}_duplicates.csv"
-            with open(dup_file, 'w', newline='', encoding='utf-8') as f:
+            with open(dup_file, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 writer.writerow(['File Name', 'Duplicate Count', 'Size (MB)', 'Wasted Space (MB)'])
-                for dup_info in report_data['duplicates']['details']:
-                    writer.writerow([
-                        dup_info['file_name'],
-                        dup_info['count'],
-                        round(dup_info['size_bytes'] / (1024 * 1024), 2),
-                        round(dup_info['wasted_bytes'] / (1024 * 1024), 2)
-                    ])
+                writer.writerows(
+                    (dup_info['file_name'], dup_info['count'],
+                     round(dup_info['size_bytes'] * _INV_MB, 2),
+                     round(dup_info['wasted_bytes'] * _INV_MB, 2))
+                    for dup_info in report_data['duplicates']['details']
+                )
             logger.info(f"Duplicates exported: {dup_file}")
         
         # Export operations
         if report_data['operations_history']['operations']:
             ops_file = output_dir / f"{base_name}_operations.csv"
-            with open(ops_file, 'w', newline='', encoding='utf-8') as f:
+            with open(ops_file, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 writer.writerow(['Operation ID', 'Date', 'Files Moved'])
-                for op in report_data['operations_history']['operations']:
-                    writer.writerow([
-                        op['operation_id'],
-                        op['operation_date'],
-                        op['file_count']
-                    ])
+                writer.writerows(
+                    (op['operation_id'], op['operation_date'], op['file_count'])
+                    for op in report_data['operations_history']['operations']
+                )
             logger.info(f"Operations exported: {ops_file}")
         
         logger.info(f"CSV reports exported to: {output_dir}")
@@ -367,13 +417,59 @@ def export_to_csv(report_data: Dict[str, Any], output_path: str) -> bool:
 # PHASE 6: DIAGNOSTICS & MAINTENANCE ANALYTICS
 # ============================================================================
 
+def _diagnostic_inputs_signature(db_path: str, learning_dir: Path) -> tuple:
+    """
+    Stat fingerprint (mtime and size) of the main files the diagnostics
+    read: the database with its WAL file, the model and the feedback file.
+    Other learning files only feed the storage totals, which the TTL keeps
+    reasonably fresh.
+    """
+    signature = []
+    
+    for path in (db_path, db_path + '-wal',
+                 os.path.join(learning_dir, learn.MODEL_FILE),
+                 os.path.join(learning_dir, feedback.FEEDBACK_FILE)):
+        try:
+            st = os.stat(path)
+            signature.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append(None)
+    
+    return tuple(signature)
+
+
+def _copy_diagnostics(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a diagnostics result; its sections hold only scalars."""
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in result.items()}
+
+
 def _get_diagnostic_analytics(db_path: str = 'file_organizer.db') -> Dict[str, Any]:
     """
     Get system diagnostics for report.
     
+    Results are reused for up to DIAGNOSTIC_CACHE_TTL seconds as long as
+    the database, model and feedback files are unchanged.
+    
     Returns:
         Dictionary with diagnostic results
     """
+    learning_dir = maintenance.DEFAULT_LEARNING_DIR
+    key = (os.path.abspath(db_path), os.path.abspath(learning_dir))
+    signature = _diagnostic_inputs_signature(db_path, learning_dir)
+    
+    cached = _diagnostic_cache.get(key)
+    if (cached is not None and cached[1] == signature
+            and time.monotonic() - cached[0] < DIAGNOSTIC_CACHE_TTL):
+        return _copy_diagnostics(cached[2])
+    
+    result = _compute_diagnostic_analytics(db_path)
+    if result['enabled']:
+        _diagnostic_cache[key] = (time.monotonic(), signature, _copy_diagnostics(result))
+    return result
+
+
+def _compute_diagnostic_analytics(db_path: str) -> Dict[str, Any]:
+    """Run the diagnostics behind _get_diagnostic_analytics."""
     try:
         # Run lightweight diagnostics
         model_diag = diagnostic.diagnose_model_confidence()
@@ -455,169 +551,180 @@ def _get_maintenance_analytics() -> Dict[str, Any]:
 # CONSOLE REPORTING
 # ============================================================================
 
-def print_summary_report(report_data: Dict[str, Any]):
+def print_summary_report(
+    report_data: Dict[str, Any],
+    distribution_rows: Optional[List[Tuple[str, int, float, int]]] = None
+):
     """
     Print a human-readable summary report to console.
     
     Args:
         report_data: Report data dictionary
+        distribution_rows: Prebuilt _distribution_rows() of report_data
+            (built here if not given)
     """
     logger = logging.getLogger('FileOrganizer')
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
-    logger.info("=" * 70)
-    logger.info("FILE ORGANIZER - COMPREHENSIVE REPORT")
-    logger.info("=" * 70)
-    logger.info(f"Generated: {report_data['report_metadata']['generated_at']}")
-    logger.info("")
+    # Emitted as one record rather than one per line
+    lines = []
+    lines.append("=" * 70)
+    lines.append("FILE ORGANIZER - COMPREHENSIVE REPORT")
+    lines.append("=" * 70)
+    lines.append(f"Generated: {report_data['report_metadata']['generated_at']}")
+    lines.append("")
     
     # Summary
     summary = report_data['summary']
-    logger.info("📊 SUMMARY")
-    logger.info("-" * 70)
-    logger.info(f"Total Files Tracked: {summary['total_files']}")
-    logger.info(f"Total Size: {summary['total_size_mb']} MB ({summary['total_size_bytes']} bytes)")
-    logger.info(f"Total Operations: {summary['total_operations']}")
-    logger.info(f"File Categories: {summary['file_categories']}")
-    logger.info("")
+    lines.append("📊 SUMMARY")
+    lines.append("-" * 70)
+    lines.append(f"Total Files Tracked: {summary['total_files']}")
+    lines.append(f"Total Size: {summary['total_size_mb']} MB ({summary['total_size_bytes']} bytes)")
+    lines.append(f"Total Operations: {summary['total_operations']}")
+    lines.append(f"File Categories: {summary['file_categories']}")
+    lines.append("")
     
     # File Distribution
-    logger.info("📁 FILE DISTRIBUTION")
-    logger.info("-" * 70)
-    for file_type, data in report_data['file_distribution']['percentages'].items():
-        bar_length = int(data['percentage'] / 2)  # Scale to 50 chars max
-        bar = '█' * bar_length
-        logger.info(f"{file_type:15s} {bar} {data['percentage']:5.1f}% ({data['count']} files)")
-    logger.info("")
+    lines.append("📁 FILE DISTRIBUTION")
+    lines.append("-" * 70)
+    if distribution_rows is None:
+        distribution_rows = _distribution_rows(report_data)
+    for file_type, count, percentage, bar_length in distribution_rows:
+        lines.append(f"{file_type:15s} {_FULL_BAR[:bar_length]} {percentage:5.1f}% ({count} files)")
+    lines.append("")
     
     # Duplicates
     dup_info = report_data['duplicates']
     if dup_info['total_duplicate_files'] > 0:
-        logger.info("🔄 DUPLICATES")
-        logger.info("-" * 70)
-        logger.info(f"Duplicate Groups: {dup_info['total_duplicate_groups']}")
-        logger.info(f"Total Duplicate Files: {dup_info['total_duplicate_files']}")
-        logger.info(f"Wasted Space: {dup_info['wasted_space_mb']} MB")
-        logger.info("")
+        lines.append("🔄 DUPLICATES")
+        lines.append("-" * 70)
+        lines.append(f"Duplicate Groups: {dup_info['total_duplicate_groups']}")
+        lines.append(f"Total Duplicate Files: {dup_info['total_duplicate_files']}")
+        lines.append(f"Wasted Space: {dup_info['wasted_space_mb']} MB")
+        lines.append("")
         
         if dup_info['details']:
-            logger.info("Top duplicate files:")
+            lines.append("Top duplicate files:")
             for i, dup in enumerate(dup_info['details'][:5], 1):
-                size_mb = round(dup['wasted_bytes'] / (1024 * 1024), 2)
-                logger.info(f"  {i}. {dup['file_name']} - {dup['count']} copies, wastes {size_mb} MB")
-            logger.info("")
+                size_mb = round(dup['wasted_bytes'] * _INV_MB, 2)
+                lines.append(f"  {i}. {dup['file_name']} - {dup['count']} copies, wastes {size_mb} MB")
+            lines.append("")
     
     # Large Files
     large_files = report_data['large_files']['top_10']
     if large_files:
-        logger.info("📦 LARGEST FILES (Top 10)")
-        logger.info("-" * 70)
+        lines.append("📦 LARGEST FILES (Top 10)")
+        lines.append("-" * 70)
         for i, file_info in enumerate(large_files, 1):
-            logger.info(f"{i:2d}. {file_info['file_name']:40s} {file_info['file_size_mb']:8.2f} MB ({file_info['file_type']})")
-        logger.info("")
+            lines.append(f"{i:2d}. {file_info['file_name']:40s} {file_info['file_size_mb']:8.2f} MB ({file_info['file_type']})")
+        lines.append("")
     
     # Temporal Analysis
     temporal = report_data['temporal_analysis']
     if temporal.get('years'):
-        logger.info("📅 TEMPORAL DISTRIBUTION")
-        logger.info("-" * 70)
-        logger.info("Files by year:")
+        lines.append("📅 TEMPORAL DISTRIBUTION")
+        lines.append("-" * 70)
+        lines.append("Files by year:")
         for year, count in sorted(temporal['years'].items(), reverse=True):
-            logger.info(f"  {year}: {count} files")
-        logger.info("")
+            lines.append(f"  {year}: {count} files")
+        lines.append("")
     
     # Operations
     operations = report_data['operations_history']
     if operations['total_operations'] > 0:
-        logger.info("🔧 RECENT OPERATIONS")
-        logger.info("-" * 70)
-        logger.info(f"Total: {operations['total_operations']} operations")
+        lines.append("🔧 RECENT OPERATIONS")
+        lines.append("-" * 70)
+        lines.append(f"Total: {operations['total_operations']} operations")
         if operations['operations']:
-            logger.info("Most recent:")
+            lines.append("Most recent:")
             for op in operations['operations'][:5]:
-                logger.info(f"  • {op['operation_id'][:30]}... - {op['file_count']} files ({op['operation_date'][:10]})")
-            logger.info("")
+                lines.append(f"  • {op['operation_id'][:30]}... - {op['file_count']} files ({op['operation_date'][:10]})")
+            lines.append("")
     
     # Phase 5: Learning Insights
     learning_insights = report_data.get('learning_insights', {})
     if learning_insights.get('enabled'):
-        logger.info("🧠 LEARNING INSIGHTS")
-        logger.info("-" * 70)
-        logger.info(f"Status: {learning_insights['status']}")
-        logger.info(f"Training Samples: {learning_insights['total_samples']}")
-        logger.info(f"Average Confidence: {learning_insights.get('average_confidence', 0):.1f}%")
-        logger.info("")
+        lines.append("🧠 LEARNING INSIGHTS")
+        lines.append("-" * 70)
+        lines.append(f"Status: {learning_insights['status']}")
+        lines.append(f"Training Samples: {learning_insights['total_samples']}")
+        lines.append(f"Average Confidence: {learning_insights.get('average_confidence', 0):.1f}%")
+        lines.append("")
         
         strongest = learning_insights.get('strongest_pattern')
         if strongest:
-            logger.info(f"Strongest Pattern: {strongest['pattern']} → {strongest['destination']}")
-            logger.info(f"  Confidence: {strongest['confidence']:.1f}% ({strongest['sample_count']} samples)")
+            lines.append(f"Strongest Pattern: {strongest['pattern']} → {strongest['destination']}")
+            lines.append(f"  Confidence: {strongest['confidence']:.1f}% ({strongest['sample_count']} samples)")
         
         weakest = learning_insights.get('weakest_pattern')
         if weakest and learning_insights.get('file_types_learned', 0) > 1:
-            logger.info(f"Weakest Pattern: {weakest['pattern']} → {weakest['destination']}")
-            logger.info(f"  Confidence: {weakest['confidence']:.1f}% ({weakest['sample_count']} samples)")
+            lines.append(f"Weakest Pattern: {weakest['pattern']} → {weakest['destination']}")
+            lines.append(f"  Confidence: {weakest['confidence']:.1f}% ({weakest['sample_count']} samples)")
         
-        logger.info("")
+        lines.append("")
     
     # Phase 5: Feedback Insights
     feedback_insights = report_data.get('feedback_insights', {})
     if feedback_insights.get('enabled') and feedback_insights.get('total_feedback', 0) > 0:
-        logger.info("📊 FEEDBACK INSIGHTS")
-        logger.info("-" * 70)
-        logger.info(f"Overall Accuracy: {feedback_insights['overall_accuracy']:.1f}%")
-        logger.info(f"Total Feedback Events: {feedback_insights['total_feedback']}")
-        logger.info(f"  ✓ Correct: {feedback_insights['total_correct']}")
-        logger.info(f"  ✗ Wrong: {feedback_insights['total_wrong']}")
-        logger.info("")
+        lines.append("📊 FEEDBACK INSIGHTS")
+        lines.append("-" * 70)
+        lines.append(f"Overall Accuracy: {feedback_insights['overall_accuracy']:.1f}%")
+        lines.append(f"Total Feedback Events: {feedback_insights['total_feedback']}")
+        lines.append(f"  ✓ Correct: {feedback_insights['total_correct']}")
+        lines.append(f"  ✗ Wrong: {feedback_insights['total_wrong']}")
+        lines.append("")
     
     # Phase 6: System Diagnostics
     diagnostics = report_data.get('system_diagnostics', {})
     if diagnostics.get('enabled'):
-        logger.info("🔍 SYSTEM HEALTH")
-        logger.info("-" * 70)
+        lines.append("🔍 SYSTEM HEALTH")
+        lines.append("-" * 70)
         
         health_emoji = {'healthy': '✅', 'needs_attention': '⚠️', 'critical': '🔴'}
         emoji = health_emoji.get(diagnostics['overall_health'], '❓')
-        logger.info(f"{emoji} Overall Health: {diagnostics['overall_health'].upper()}")
+        lines.append(f"{emoji} Overall Health: {diagnostics['overall_health'].upper()}")
         
         model_status = diagnostics['model']
-        logger.info(f"  Model: {model_status['status']} ({model_status['avg_confidence']:.1f}% avg confidence)")
+        lines.append(f"  Model: {model_status['status']} ({model_status['avg_confidence']:.1f}% avg confidence)")
         
         db_status = diagnostics['database']
-        logger.info(f"  Database: {db_status['status']} ({db_status['size_mb']:.2f} MB, {db_status['integrity']})")
+        lines.append(f"  Database: {db_status['status']} ({db_status['size_mb']:.2f} MB, {db_status['integrity']})")
         
-        logger.info("")
+        lines.append("")
     
     # Phase 6: Maintenance History
     maintenance_history = report_data.get('maintenance_history', {})
     if maintenance_history.get('enabled'):
-        logger.info("🔧 MAINTENANCE")
-        logger.info("-" * 70)
+        lines.append("🔧 MAINTENANCE")
+        lines.append("-" * 70)
         
         last_maint = maintenance_history.get('last_maintenance')
         if last_maint:
-            logger.info(f"Last Maintenance: {last_maint[:19]}")
+            lines.append(f"Last Maintenance: {last_maint[:19]}")
         else:
-            logger.info("Last Maintenance: Never")
+            lines.append("Last Maintenance: Never")
         
         stats = maintenance_history.get('stats', {})
-        logger.info(f"Total Retrains: {stats.get('total_retrains', 0)}")
-        logger.info(f"Total Optimizations: {stats.get('total_optimizations', 0)}")
-        logger.info(f"Patterns Pruned: {stats.get('patterns_pruned', 0)}")
-        logger.info("")
+        lines.append(f"Total Retrains: {stats.get('total_retrains', 0)}")
+        lines.append(f"Total Optimizations: {stats.get('total_optimizations', 0)}")
+        lines.append(f"Patterns Pruned: {stats.get('patterns_pruned', 0)}")
+        lines.append("")
     
     # Suggestions
     suggestions = report_data['suggestions']
     if suggestions:
-        logger.info("💡 SUGGESTIONS")
-        logger.info("-" * 70)
+        lines.append("💡 SUGGESTIONS")
+        lines.append("-" * 70)
+        priority_emoji = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
         for i, sugg in enumerate(suggestions, 1):
-            priority_emoji = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
             emoji = priority_emoji.get(sugg['priority'], '⚪')
-            logger.info(f"{i}. {emoji} [{sugg['priority'].upper()}] {sugg['description']}")
-        logger.info("")
+            lines.append(f"{i}. {emoji} [{sugg['priority'].upper()}] {sugg['description']}")
+        lines.append("")
     
-    logger.info("=" * 70)
+    lines.append("=" * 70)
+    
+    logger.info('\n'.join(lines))
 
 
 # ============================================================================
@@ -651,6 +758,9 @@ def generate_report(output_path: str, db_path: str = 'file_organizer.db',
         logger.error("Failed to generate report data")
         return False
     
+    # Distribution rows shared by the CSV export and the console summary
+    distribution_rows = _distribution_rows(report_data)
+    
     # Determine format from extension
     output_file = Path(output_path)
     extension = output_file.suffix.lower()
@@ -660,7 +770,7 @@ def generate_report(output_path: str, db_path: str = 'file_organizer.db',
     if extension == '.json':
         success = export_to_json(report_data, output_path)
     elif extension == '.csv':
-        success = export_to_csv(report_data, output_path)
+        success = export_to_csv(report_data, output_path, distribution_rows)
     else:
         logger.error(f"Unsupported format: {extension}. Use .json or .csv")
         return False
@@ -668,7 +778,7 @@ def generate_report(output_path: str, db_path: str = 'file_organizer.db',
     # Print console summary
     if print_console and success:
         logger.info("")
-        print_summary_report(report_data)
+        print_summary_report(report_data, distribution_rows)
     
     if success:
         logger.info(f"✓ Report generated successfully: {output_path}")
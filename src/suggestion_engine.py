@@ -14,7 +14,7 @@ This module provides intelligent suggestions based on:
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from collections import defaultdict, Counter
 
 import database_manager as db
@@ -28,6 +28,10 @@ import learning_engine as learn
 class Suggestion:
     """Base class for organization suggestions."""
     
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ('type', 'priority', 'description', 'details', 'action',
+                 'confidence', 'reason')
+    
     def __init__(self, suggestion_type: str, priority: str, description: str, 
                  details: Dict[str, Any], action: Optional[str] = None,
                  confidence: Optional[float] = None, reason: Optional[str] = None):
@@ -59,6 +63,18 @@ class Suggestion:
         if self.action:
             output += f"  💡 Suggested action: {self.action}\n"
         return output
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form used in exported reports."""
+        return {
+            'type': self.type,
+            'priority': self.priority,
+            'description': self.description,
+            'details': self.details,
+            'action': self.action,
+            'confidence': self.confidence,
+            'reason': self.reason
+        }
 
 
 # ============================================================================
@@ -118,11 +134,13 @@ def analyze_duplicates(db_path: str = 'file_organizer.db') -> Dict[str, Any]:
     try:
         duplicate_groups = db.get_all_duplicates(db_path)
         
-        total_duplicates = sum(len(group) - 1 for group in duplicate_groups)
+        total_duplicates = 0
         wasted_space = 0
         
         duplicate_details = []
         for group in duplicate_groups:
+            total_duplicates += len(group) - 1
+            
             if len(group) > 1:
                 file_size = group[0]['file_size']
                 wasted_size = file_size * (len(group) - 1)
@@ -190,6 +208,24 @@ def analyze_large_files(db_path: str = 'file_organizer.db', limit: int = 10) ->
         return []
 
 
+def _year_and_month(timestamp: str) -> Tuple[int, str]:
+    """
+    Year and 'YYYY-MM' month of an ISO timestamp.
+    
+    Timestamps written by the organizer start with 'YYYY-MM-', so both are
+    sliced out directly instead of parsing the full datetime; anything else
+    goes through datetime.fromisoformat (which raises if it is invalid).
+    """
+    if (len(timestamp) >= 8 and timestamp[4] == '-' and timestamp[7] == '-'
+            and timestamp[:4].isdigit() and timestamp[5:7].isdigit()
+            and '01' <= timestamp[5:7] <= '12'):
+        year = int(timestamp[:4])
+        return year, f"{year}-{timestamp[5:7]}"
+    
+    created = datetime.fromisoformat(timestamp)
+    return created.year, f"{created.year}-{created.month:02d}"
+
+
 def analyze_temporal_patterns(db_path: str = 'file_organizer.db') -> Dict[str, Any]:
     """
     Analyze when files were created/modified.
@@ -217,9 +253,7 @@ def analyze_temporal_patterns(db_path: str = 'file_organizer.db') -> Dict[str, A
             
             for row in cursor.fetchall():
                 try:
-                    created = datetime.fromisoformat(row['created_at'])
-                    year = created.year
-                    month = f"{year}-{created.month:02d}"
+                    year, month = _year_and_month(row['created_at'])
                     
                     years[year] += 1
                     months[month] += 1
@@ -0,0 +1,119 @@
+"""Test duplicate detection and removal during organization"""
+
+import os
+import tempfile
+from pathlib import Path
+
+print("=" * 70)
+print("TESTING DUPLICATE REMOVAL")
+print("=" * 70)
+
+failures = 0
+
+
+def check(condition, message):
+    """Print a result line and count failures."""
+    global failures
+    if condition:
+        print(f"   ✓ {message}")
+    else:
+        failures += 1
+        print(f"   ✗ {message}")
+
+
+def write_file(path: Path, content: str, mtime_ns: int = None):
+    """Create a file, optionally with a fixed modification time."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+# Test imports
+print("\n1. Testing imports...")
+try:
+    import file_organizer as organizer
+    print("   ✓ File organizer imported successfully")
+except Exception as e:
+    print(f"   ✗ Import failed: {e}")
+    exit(1)
+
+work_dir = Path(tempfile.mkdtemp(prefix='filegenius_test_'))
+db_path = str(work_dir / 'organizer.db')
+output_dir = work_dir / 'organized'
+mtime_ns = 1_700_000_000_000_000_000
+
+# First run records the originals
+print("\n2. Organizing original files...")
+try:
+    write_file(work_dir / 'first' / 'report.txt', 'quarterly numbers', mtime_ns)
+    write_file(work_dir / 'first' / 'notes.txt', 'meeting notes')
+    
+    stats = organizer.organize_files(
+        str(work_dir / 'first'), str(output_dir), dry_run=False,
+        remove_duplicates=True, db_path=db_path
+    )
+    check(stats['files_moved'] == 2, f"originals moved: {stats['files_moved']}")
+    check(stats['duplicates_found'] == 0, "no duplicates on the first run")
+except Exception as e:
+    failures += 1
+    print(f"   ✗ First run failed: {e}")
+
+# Second run: one real copy, one look-alike with different content
+print("\n3. Organizing copies and look-alikes...")
+try:
+    second = work_dir / 'second'
+    # Same content as notes.txt under another name: a real duplicate
+    write_file(second / 'notes_copy.txt', 'meeting notes')
+    # Same name, size and mtime as report.txt, but different content
+    write_file(second / 'report.txt', 'QUARTERLY NUMBERS', mtime_ns)
+    
+    dry_stats = organizer.organize_files(
+        str(second), str(output_dir), dry_run=True,
+        remove_duplicates=True, db_path=db_path
+    )
+    check(dry_stats['duplicates_found'] == 1,
+          f"dry run duplicates found: {dry_stats['duplicates_found']}")
+    check(dry_stats['duplicates_removed'] == 0, "dry run deletes nothing")
+    check((second / 'notes_copy.txt').exists() and (second / 'report.txt').exists(),
+          "dry run leaves both files in place")
+    
+    stats = organizer.organize_files(
+        str(second), str(output_dir), dry_run=False,
+        remove_duplicates=True, db_path=db_path
+    )
+    check(stats['duplicates_found'] == 1, f"duplicates found: {stats['duplicates_found']}")
+    check(stats['duplicates_removed'] == 1, f"duplicates removed: {stats['duplicates_removed']}")
+    check(not (second / 'notes_copy.txt').exists(), "real duplicate deleted")
+    
+    # The look-alike must be organized, never deleted
+    moved = [p for p in output_dir.rglob('report*.txt')
+             if p.read_text(encoding='utf-8') == 'QUARTERLY NUMBERS']
+    check(len(moved) == 1, "file matching only by name, size and mtime was moved, not deleted")
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Second run failed: {e}")
+
+# Without remove_duplicates, duplicates stay where they are
+print("\n4. Organizing a duplicate without removal...")
+try:
+    third = work_dir / 'third'
+    write_file(third / 'notes_again.txt', 'meeting notes')
+    
+    stats = organizer.organize_files(
+        str(third), str(output_dir), dry_run=False,
+        remove_duplicates=False, db_path=db_path
+    )
+    check(stats['duplicates_found'] == 1, "duplicate detected")
+    check((third / 'notes_again.txt').exists(), "duplicate kept in place")
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Third run failed: {e}")
+
+print("\n" + "=" * 70)
+if failures:
+    print(f"✗ {failures} DUPLICATE CHECK(S) FAILED")
+    print("=" * 70)
+    exit(1)
+print("✓ ALL DUPLICATE TESTS PASSED")
+print("=" * 70)
@@ -0,0 +1,141 @@
+"""Test the in-memory feedback cache"""
+
+import json
+import tempfile
+from pathlib import Path
+
+print("=" * 70)
+print("TESTING FEEDBACK CACHE")
+print("=" * 70)
+
+failures = 0
+
+
+def check(condition, message):
+    """Print a result line and count failures."""
+    global failures
+    if condition:
+        print(f"   ✓ {message}")
+    else:
+        failures += 1
+        print(f"   ✗ {message}")
+
+
+def total_on_disk(learning_dir: Path):
+    """total_feedback stored in the feedback file, or None if there is none."""
+    path = learning_dir / feedback.FEEDBACK_FILE
+    if not path.exists():
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['metadata']['total_feedback']
+
+
+# Test imports
+print("\n1. Testing imports...")
+try:
+    import feedback_manager as feedback
+    print("   ✓ Feedback manager imported successfully")
+except Exception as e:
+    print(f"   ✗ Import failed: {e}")
+    exit(1)
+
+work_dir = Path(tempfile.mkdtemp(prefix='filegenius_test_'))
+
+# Updates stay in memory until a flush
+print("\n2. Testing deferred writes...")
+try:
+    learning_dir = work_dir / 'deferred'
+    for _ in range(3):
+        feedback.record_positive_feedback('type', 'documents', 'Docs', learning_dir)
+    
+    check(total_on_disk(learning_dir) is None, "nothing written before a flush")
+    check(feedback.load_feedback(learning_dir).metadata['total_feedback'] == 3,
+          "load_feedback sees the pending updates")
+    
+    feedback.flush_feedback(learning_dir)
+    check(total_on_disk(learning_dir) == 3, "flush_feedback writes them")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Deferred write test failed: {e}")
+
+# Every FEEDBACK_FLUSH_INTERVAL updates the file is rewritten on its own
+print("\n3. Testing periodic flush...")
+try:
+    learning_dir = work_dir / 'periodic'
+    interval = feedback.FEEDBACK_FLUSH_INTERVAL
+    feedback.FEEDBACK_FLUSH_INTERVAL = 4
+    try:
+        for _ in range(5):
+            feedback.record_negative_feedback('ext', '.pdf', 'Docs', learning_dir)
+    finally:
+        feedback.FEEDBACK_FLUSH_INTERVAL = interval
+    
+    check(total_on_disk(learning_dir) == 4, "file written after the 4th update")
+    feedback.flush_feedback()
+    check(total_on_disk(learning_dir) == 5, "flushing all directories writes the 5th")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Periodic flush test failed: {e}")
+
+# Clearing drops pending updates instead of writing them back later
+print("\n4. Testing clear_feedback...")
+try:
+    learning_dir = work_dir / 'cleared'
+    feedback.record_positive_feedback('type', 'images', 'Pictures', learning_dir)
+    feedback.flush_feedback(learning_dir)
+    feedback.record_positive_feedback('type', 'images', 'Pictures', learning_dir)
+    
+    feedback.clear_feedback(learning_dir)
+    feedback.flush_feedback()
+    check(total_on_disk(learning_dir) is None, "file removed and not rewritten")
+    check(feedback.load_feedback(learning_dir).metadata['total_feedback'] == 0,
+          "cleared directory starts empty")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ clear_feedback test failed: {e}")
+
+# A full cache evicts its least used directory, writing it out first
+print("\n5. Testing LFU eviction...")
+try:
+    size = feedback.FEEDBACK_CACHE_SIZE
+    feedback.FEEDBACK_CACHE_SIZE = 3
+    try:
+        # Start from an empty cache so the limit applies to these directories
+        feedback.flush_feedback()
+        for key in list(feedback._feedback_cache):
+            feedback._forget(key)
+        
+        hot = work_dir / 'lfu_hot'
+        for _ in range(5):
+            feedback.record_positive_feedback('type', 'documents', 'Docs', hot)
+        
+        cold = [work_dir / f"lfu_cold_{i}" for i in range(4)]
+        for learning_dir in cold:
+            feedback.record_positive_feedback('type', 'documents', 'Docs', learning_dir)
+        
+        check(len(feedback._feedback_cache) <= 3, f"cache holds {len(feedback._feedback_cache)} directories")
+        check(total_on_disk(hot) is None, "frequently used directory stays cached")
+        evicted = [d for d in cold if total_on_disk(d) == 1]
+        check(len(evicted) == 2, f"evicted directories written to disk: {len(evicted)}")
+        check(all(feedback.load_feedback(d).metadata['total_feedback'] == 1 for d in cold),
+              "no update lost after eviction")
+        
+        feedback.flush_feedback()
+        check(total_on_disk(hot) == 5, "hot directory flushed with all its updates")
+    finally:
+        feedback.FEEDBACK_CACHE_SIZE = size
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ LFU eviction test failed: {e}")
+
+print("\n" + "=" * 70)
+if failures:
+    print(f"✗ {failures} FEEDBACK CACHE CHECK(S) FAILED")
+    print("=" * 70)
+    exit(1)
+print("✓ ALL FEEDBACK CACHE TESTS PASSED")
+print("=" * 70)
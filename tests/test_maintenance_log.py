@@ -0,0 +1,77 @@
+"""Test the maintenance log cache"""
+
+import os
+import json
+import tempfile
+from pathlib import Path
+
+print("=" * 70)
+print("TESTING MAINTENANCE LOG CACHE")
+print("=" * 70)
+
+failures = 0
+
+
+def check(condition, message):
+    """Print a result line and count failures."""
+    global failures
+    if condition:
+        print(f"   ✓ {message}")
+    else:
+        failures += 1
+        print(f"   ✗ {message}")
+
+
+# Test imports
+print("\n1. Testing imports...")
+try:
+    import maintenance_engine as maintenance
+    print("   ✓ Maintenance engine imported successfully")
+except Exception as e:
+    print(f"   ✗ Import failed: {e}")
+    exit(1)
+
+work_dir = Path(tempfile.mkdtemp(prefix='filegenius_test_'))
+
+# Test maintenance log cache
+print("\n2. Testing maintenance log cache...")
+try:
+    learning_dir = work_dir / 'maintenance'
+    first = maintenance.MaintenanceLog(learning_dir)
+    first.record_operation('retrain', {})
+    
+    reader = maintenance.MaintenanceLog(learning_dir)
+    writer = maintenance.MaintenanceLog(learning_dir)
+    writer.log['operations'].append({'timestamp': '2024-01-01T00:00:00', 'type': 'cleanup'})
+    writer.log['stats']['total_retrains'] += 10
+    
+    check(len(reader.log['operations']) == 1, "unsaved changes are not visible to other instances")
+    check(reader.log['stats']['total_retrains'] == 1, "stats are not shared between instances")
+    check(len(maintenance.MaintenanceLog(learning_dir).log['operations']) == 1,
+          "new instances read what was saved")
+    
+    writer.record_operation('optimize', {})
+    check(len(maintenance.MaintenanceLog(learning_dir).log['operations']) == 3,
+          "a save is picked up by new instances")
+    
+    # A rewrite that keeps the mtime must still be noticed through the size
+    log_path = learning_dir / maintenance.MAINTENANCE_LOG_FILE
+    st = os.stat(log_path)
+    rewritten = maintenance.MaintenanceLog(learning_dir)
+    rewritten.log['operations'] = rewritten.log['operations'][:1]
+    log_path.write_text(json.dumps(rewritten.log), encoding='utf-8')
+    os.utime(log_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    check(len(maintenance.MaintenanceLog(learning_dir).log['operations']) == 1,
+          "a rewrite with the same mtime is picked up")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Maintenance log test failed: {e}")
+
+print("\n" + "=" * 70)
+if failures:
+    print(f"✗ {failures} MAINTENANCE LOG CHECK(S) FAILED")
+    print("=" * 70)
+    exit(1)
+print("✓ ALL MAINTENANCE LOG TESTS PASSED")
+print("=" * 70)
@@ -0,0 +1,86 @@
+"""Test organizing many files with parallel moves"""
+
+import tempfile
+from pathlib import Path
+
+print("=" * 70)
+print("TESTING PARALLEL MOVES")
+print("=" * 70)
+
+failures = 0
+
+
+def check(condition, message):
+    """Print a result line and count failures."""
+    global failures
+    if condition:
+        print(f"   ✓ {message}")
+    else:
+        failures += 1
+        print(f"   ✗ {message}")
+
+
+# Test imports
+print("\n1. Testing imports...")
+try:
+    import database_manager as db
+    import file_organizer as organizer
+    print("   ✓ All modules imported successfully")
+except Exception as e:
+    print(f"   ✗ Import failed: {e}")
+    exit(1)
+
+work_dir = Path(tempfile.mkdtemp(prefix='filegenius_test_'))
+db_path = str(work_dir / 'organizer.db')
+output_dir = work_dir / 'organized'
+
+# Small batches, so the run spans several batches of parallel moves
+organizer.SCAN_BATCH_SIZE = 16
+
+# Same file names in every folder, so moves in a batch compete for targets
+print("\n2. Organizing files with clashing names...")
+try:
+    source = work_dir / 'source'
+    contents = {}
+    for d in range(6):
+        folder = source / f"folder_{d}"
+        folder.mkdir(parents=True)
+        for name in ('report.pdf', 'photo.jpg', 'notes.txt', 'song.mp3', 'data.csv'):
+            path = folder / name
+            path.write_text(f"{d}/{name}", encoding='utf-8')
+            contents[str(path)] = f"{d}/{name}"
+    
+    stats = organizer.organize_files(
+        str(source), str(output_dir), recursive=True, dry_run=False, db_path=db_path
+    )
+    check(stats['files_moved'] == 30, f"files moved: {stats['files_moved']}")
+    check(stats['errors'] == 0, f"errors: {stats['errors']}")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Organizing failed: {e}")
+
+# Every file must land at its own target with its own content
+print("\n3. Checking results...")
+try:
+    records = db.get_operation_files(db.get_last_operation_id(db_path), db_path)
+    targets = [r['new_path'] for r in records]
+    
+    check(len(records) == 30, f"records written: {len(records)}")
+    check(len(set(targets)) == 30, "every file got a distinct target")
+    check(all(Path(r['new_path']).read_text(encoding='utf-8') == contents[r['original_path']]
+              for r in records),
+          "every target holds the content of its original")
+    check(len(list(output_dir.rglob('*.*'))) == 30, "nothing extra in the output directory")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Result check failed: {e}")
+
+print("\n" + "=" * 70)
+if failures:
+    print(f"✗ {failures} PARALLEL MOVE CHECK(S) FAILED")
+    print("=" * 70)
+    exit(1)
+print("✓ ALL PARALLEL MOVE TESTS PASSED")
+print("=" * 70)
@@ -0,0 +1,177 @@
+"""Test loading of on-disk data written by older versions"""
+
+import json
+import pickle
+import sqlite3
+import tempfile
+from pathlib import Path
+
+print("=" * 70)
+print("TESTING ON-DISK FORMAT MIGRATIONS")
+print("=" * 70)
+
+failures = 0
+
+
+def check(condition, message):
+    """Print a result line and count failures."""
+    global failures
+    if condition:
+        print(f"   ✓ {message}")
+    else:
+        failures += 1
+        print(f"   ✗ {message}")
+
+
+# Test imports
+print("\n1. Testing imports...")
+try:
+    import database_manager as db
+    import learning_engine as learn
+    import feedback_manager as feedback
+    print("   ✓ All modules imported successfully")
+except Exception as e:
+    print(f"   ✗ Import failed: {e}")
+    exit(1)
+
+work_dir = Path(tempfile.mkdtemp(prefix='filegenius_test_'))
+
+# Test hex TEXT hashes -> BLOB
+print("\n2. Testing database hash migration (hex TEXT -> BLOB)...")
+try:
+    db_path = str(work_dir / 'legacy.db')
+    digest = bytes(range(32))
+    
+    # Schema and row as written by versions before BLOB hashes and mtime_ns
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE files (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            original_path TEXT NOT NULL,
+            new_path TEXT NOT NULL,
+            file_name TEXT NOT NULL,
+            file_size INTEGER NOT NULL,
+            file_type TEXT NOT NULL,
+            created_at TEXT,
+            modified_at TEXT,
+            sha256_hash TEXT NOT NULL,
+            operation_date TEXT NOT NULL,
+            operation_id TEXT NOT NULL
+        )
+    """)
+    conn.execute(
+        "INSERT INTO files (original_path, new_path, file_name, file_size, file_type, "
+        "sha256_hash, operation_date, operation_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        ('/old/a.pdf', '/new/a.pdf', 'a.pdf', 10, 'documents',
+         digest.hex(), '2024-01-01T00:00:00', 'op-1')
+    )
+    conn.commit()
+    conn.close()
+    
+    db.init_db(db_path)
+    
+    with db.get_db_connection(db_path) as conn:
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(files)")}
+        stored_type = conn.execute("SELECT typeof(sha256_hash) FROM files").fetchone()[0]
+    
+    check('mtime_ns' in columns, "mtime_ns column added")
+    check(stored_type == 'blob', f"hash stored as {stored_type}")
+    
+    duplicate = db.get_duplicate(digest, db_path)
+    check(duplicate is not None and duplicate['file_name'] == 'a.pdf',
+          "migrated hash found by get_duplicate")
+    
+    # Running init again must leave the data alone
+    db.init_db(db_path)
+    check(db.get_duplicate(digest, db_path) is not None, "second init_db is a no-op")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Hash migration failed: {e}")
+
+# Test legacy feedback keys
+print("\n3. Testing feedback key migration ('type_value' -> 'type|value')...")
+try:
+    learning_dir = work_dir / 'feedback'
+    learning_dir.mkdir()
+    legacy = {
+        'patterns': {
+            'type_documents': {'correct': 3, 'wrong': 1, 'confidence_adj': 0.9},
+            'ext_.tar_gz': {'correct': 1, 'wrong': 0, 'confidence_adj': 1.0}
+        },
+        'metadata': {'total_feedback': 5, 'last_updated': None, 'enabled': True}
+    }
+    with open(learning_dir / feedback.FEEDBACK_FILE, 'w', encoding='utf-8') as f:
+        json.dump(legacy, f)
+    
+    data = feedback.load_feedback(learning_dir)
+    check(('type', 'documents') in data.patterns, "'type_documents' read as ('type', 'documents')")
+    check(('ext', '.tar_gz') in data.patterns, "underscores after the first stay in the value")
+    
+    feedback.save_feedback(data, learning_dir, flush=True)
+    with open(learning_dir / feedback.FEEDBACK_FILE, encoding='utf-8') as f:
+        saved = json.load(f)
+    check(sorted(saved['patterns']) == ['ext|.tar_gz', 'type|documents'],
+          f"re-saved with new keys: {sorted(saved['patterns'])}")
+    
+    reloaded = feedback.FeedbackData.from_dict(saved)
+    check(reloaded.patterns == data.patterns, "new keys round-trip")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Feedback migration failed: {e}")
+
+# Test model files written by older versions
+print("\n4. Testing model loading (legacy pickles and snapshots)...")
+try:
+    model = learn.FileOrganizationModel()
+    model.type_to_folder['documents']['Docs'] = 5
+    model.type_to_folder['documents']['Misc'] = 1
+    model.ext_to_folder['.pdf']['Docs'] = 4
+    model.total_samples = 6
+    model.last_trained = '2024-01-01T00:00:00'
+    file_meta = {'file_name': 'report.pdf', 'file_type': 'documents', 'file_ext': '.pdf'}
+    
+    # Pickled object from before snapshots, without the summary attributes
+    legacy_object = learn.FileOrganizationModel()
+    legacy_object.__dict__ = {
+        k: v for k, v in model.__dict__.items()
+        if k in ('type_to_folder', 'ext_to_folder', 'name_pattern_to_folder',
+                 'temporal_patterns', 'total_samples', 'last_trained', 'version')
+    }
+    
+    formats = {
+        'uncompressed object pickle': pickle.dumps(legacy_object),
+        'uncompressed snapshot': pickle.dumps(model.to_dict(), protocol=pickle.HIGHEST_PROTOCOL),
+    }
+    
+    for label, payload in formats.items():
+        model_dir = work_dir / label.replace(' ', '_')
+        model_dir.mkdir()
+        with open(model_dir / learn.MODEL_FILE, 'wb') as f:
+            f.write(payload)
+        
+        loaded = learn.load_model(model_dir)
+        prediction = learn.predict_destination(file_meta, loaded) if loaded else None
+        check(loaded is not None and loaded.total_samples == 6, f"{label} loaded")
+        check(prediction is not None and prediction[0] == 'Docs', f"{label} predicts: {prediction}")
+    
+    # Current format: compressed snapshot, and it must round-trip
+    model_dir = work_dir / 'current'
+    learn.save_model(model, model_dir)
+    with open(model_dir / learn.MODEL_FILE, 'rb') as f:
+        check(not f.read().startswith(pickle.PROTO), "saved model is compressed")
+    loaded = learn.load_model(model_dir)
+    check(loaded is not None and loaded.to_dict() == model.to_dict(), "compressed snapshot round-trips")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Model loading failed: {e}")
+
+print("\n" + "=" * 70)
+if failures:
+    print(f"✗ {failures} MIGRATION CHECK(S) FAILED")
+    print("=" * 70)
+    exit(1)
+print("✓ ALL MIGRATION TESTS PASSED")
+print("=" * 70)
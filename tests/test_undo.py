@@ -0,0 +1,143 @@
+"""Test undoing organization runs"""
+
+import tempfile
+from pathlib import Path
+
+print("=" * 70)
+print("TESTING UNDO")
+print("=" * 70)
+
+failures = 0
+
+
+def check(condition, message):
+    """Print a result line and count failures."""
+    global failures
+    if condition:
+        print(f"   ✓ {message}")
+    else:
+        failures += 1
+        print(f"   ✗ {message}")
+
+
+def make_files(directory: Path, count: int, prefix: str = 'file'):
+    """Create count small files with distinct content; return their paths."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = directory / f"{prefix}_{i}.txt"
+        path.write_text(f"{prefix} content {i}", encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+# Test imports
+print("\n1. Testing imports...")
+try:
+    import database_manager as db
+    import file_organizer as organizer
+    print("   ✓ All modules imported successfully")
+except Exception as e:
+    print(f"   ✗ Import failed: {e}")
+    exit(1)
+
+work_dir = Path(tempfile.mkdtemp(prefix='filegenius_test_'))
+db_path = str(work_dir / 'organizer.db')
+output_dir = work_dir / 'organized'
+
+# Small delete chunks, so a dozen records already span several DELETEs
+db.DELETE_BATCH_SIZE = 5
+
+# Organize a dozen files
+print("\n2. Organizing files...")
+try:
+    source = work_dir / 'source'
+    originals = make_files(source, 12)
+    
+    stats = organizer.organize_files(
+        str(source), str(output_dir), dry_run=False, db_path=db_path
+    )
+    operation_id = db.get_last_operation_id(db_path)
+    check(stats['files_moved'] == 12, f"files moved: {stats['files_moved']}")
+    check(not any(p.exists() for p in originals), "source directory emptied")
+    check(len(db.get_operation_files(operation_id, db_path)) == 12, "12 records written")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Organizing failed: {e}")
+
+# Dry-run undo moves nothing
+print("\n3. Testing dry-run undo...")
+try:
+    stats = db.undo_operation(operation_id, db_path, dry_run=True)
+    check(stats['files_restored'] == 12, f"would restore: {stats['files_restored']}")
+    check(not any(p.exists() for p in originals), "no file moved back")
+    check(len(db.get_operation_files(operation_id, db_path)) == 12, "records kept")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Dry-run undo failed: {e}")
+
+# Live undo, with one original location taken again in the meantime
+print("\n4. Testing undo (chunked record deletion)...")
+try:
+    blocker = originals[0]
+    blocker.write_text('new file in the old place', encoding='utf-8')
+    
+    stats = db.undo_operation(operation_id, db_path)
+    check(stats['files_restored'] == 11, f"files restored: {stats['files_restored']}")
+    check(stats['errors'] == 1, "occupied original location reported as an error")
+    check(all(p.read_text(encoding='utf-8') == f"file content {i}"
+              for i, p in enumerate(originals) if p != blocker),
+          "restored files have their original content")
+    check(blocker.read_text(encoding='utf-8') == 'new file in the old place',
+          "occupying file left alone")
+    
+    remaining = db.get_operation_files(operation_id, db_path)
+    check(len(remaining) == 1 and remaining[0]['original_path'] == str(blocker),
+          "only the record of the unrestored file remains")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Undo failed: {e}")
+
+# Restores run on a thread pool; one failing move must not affect the rest
+print("\n5. Testing parallel restore across directories...")
+try:
+    nested = work_dir / 'nested'
+    originals = []
+    for d in range(4):
+        originals += make_files(nested / f"dir_{d}", 10, prefix=f"dir{d}")
+    
+    stats = organizer.organize_files(
+        str(nested), str(output_dir), recursive=True, dry_run=False, db_path=db_path
+    )
+    operation_id = db.get_last_operation_id(db_path)
+    check(stats['files_moved'] == 40, f"files moved: {stats['files_moved']}")
+    
+    # The organizer leaves the emptied source directories behind; turn one
+    # into a plain file so its files cannot be restored
+    broken = nested / 'dir_0'
+    broken.rmdir()
+    broken.write_text('not a directory', encoding='utf-8')
+    
+    stats = db.undo_operation(operation_id, db_path)
+    check(stats['files_restored'] == 30, f"files restored: {stats['files_restored']}")
+    check(stats['errors'] == 10, f"errors: {stats['errors']}")
+    check(all(p.read_text(encoding='utf-8').startswith(p.parent.name.replace('_', ''))
+              for p in originals if p.parent != broken),
+          "files restored into their own directories")
+    check(len(db.get_operation_files(operation_id, db_path)) == 10,
+          "records of unrestored files remain")
+    
+except Exception as e:
+    failures += 1
+    print(f"   ✗ Parallel restore failed: {e}")
+
+print("\n" + "=" * 70)
+if failures:
+    print(f"✗ {failures} UNDO CHECK(S) FAILED")
+    print("=" * 70)
+    exit(1)
+print("✓ ALL UNDO TESTS PASSED")
+print("=" * 70)